@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+
+"""
+Generator of the dynamics of a planar n links arm: from the links and servos constants
+(lengths, masses, inertias, gear ratios, see WINDOWX_3LINKS in windowx_arm.py) the model is
+derived with the Lagrange equations and written as python modules with common subexpressions
+eliminated and float64 literals: joint space B, C, g, B^-1, end effector jacobian and its derivative.
+B^-1 is symbolic up to SYMBOLIC_INVERSE_LINKS links; the adjugate of a larger B does not simplify
+in a usable time (a 4 links arm did not finish in 10 minutes), so it is a numpy inverse of B(q) there.
+The modules are cached on disk, keyed by a hash of the parameters, and regenerated only
+when the arm model changes: load_dynamics(WINDOWX_2LINKS).mass_matrix(q).
+Usage: compute_dynamic_matrices.py [2|3]
+"""
+
+import os
+import sys
+import hashlib
+import sympy as sp
+from sympy.printing.pycode import PythonCodePrinter
+from windowx_arm import WINDOWX_3LINKS, WINDOWX_2LINKS, G
+
+#Bump when the generated code changes, so that cached modules are regenerated
+GENERATOR_VERSION = 2
+
+#Largest arm with a symbolic B^-1
+SYMBOLIC_INVERSE_LINKS = 3
+
+CACHE_DIR = os.path.join(os.environ.get('ROS_HOME', os.path.join(os.path.expanduser('~'), '.ros')), 'windowx_dynamics')
+
+HEADER = '''#!/usr/bin/env python
+
+"""
+Joint space dynamics of a %(n)d links planar arm: B(q) q_ddot + C(q, q_dot) q_dot + g(q) = tau,
+with the end effector [x, y, theta] jacobian and its derivative.
+q and q_dot are the angles and velocities of the joints, or (N, %(n)d) arrays for N configurations.
+With out, a preallocated array of the result, a single configuration is evaluated in place.
+
+GENERATED by compute_dynamic_matrices.py, do not edit by hand.
+Parameters hash: %(hash)s
+"""
+
+%(imports)s
+
+'''
+
+#The 3 links windowx modules read the sines and cosines of the tick ArmConfiguration
+CONF_TRIG = '''    conf = as_configuration(q)
+%s'''
+
+#B^-1 of the larger arms, from the generated B
+NUMERIC_INVERSE = '''def mass_matrix_inv(q, out=None):
+    """
+    Inverse of the joint space inertia matrix B(q)^-1, %s, numpy inverse of mass_matrix(q)
+    """
+    B_inv = np.linalg.inv(mass_matrix(q))
+    if out is None:
+        return B_inv
+    out[...] = B_inv
+    return out
+'''
+
+
+class FloatCodePrinter(PythonCodePrinter):
+    """Print floats as exact float64 literals"""
+    def _print_Float(self, expr):
+        return repr(float(expr))
+
+
+def angle_names(n):
+    """
+    Suffixes of the absolute link angles: 1, 12, 123, ...
+    """
+    return [''.join(str(k + 1) for k in range(i + 1)) for i in range(n)]
+
+
+def trig_block(n):
+    """
+    Source computing the sines and cosines of the absolute link angles at the top of a generated function
+    """
+    names = angle_names(n)
+    if n == 3:
+        return CONF_TRIG % ''.join('    s%s = conf.s%s\n    c%s = conf.c%s\n' % (a, a, a, a) for a in names)
+    lines = ['    q = np.asarray(q, dtype=np.float64).T', '    N = q.shape[1] if q.ndim == 2 else None']
+    for i, a in enumerate(names):
+        lines.append('    th%s = %sq[%d]' % (a, ('th%s + ' % names[i - 1]) if i > 0 else '', i))
+        lines.append('    s%s = np.sin(th%s)' % (a, a))
+        lines.append('    c%s = np.cos(th%s)' % (a, a))
+    return '\n'.join(lines) + '\n'
+
+
+def derive(links, grav=G):
+    """
+    Return joint space B, C, g, the jacobian and its derivative as functions of
+    the sines and cosines of the absolute link angles (s1, c1, s12, c12, ...).
+    """
+    n = len(links)
+    q = sp.symbols('q1:%d' % (n + 1))
+    qd = sp.symbols('qd1:%d' % (n + 1))
+    th = [sum(q[:i + 1]) for i in range(n)]
+    rot = lambda a: sp.Matrix([[sp.cos(a), -sp.sin(a)], [sp.sin(a), sp.cos(a)]])
+
+    B = sp.zeros(n, n)
+    U = 0
+    p = sp.zeros(2, 1)
+    for i, link in enumerate(links):
+        #Motor i, its stator moves with link i-1, the rotor spins with kr*q_dot_i
+        if i > 0:
+            Jp = p.jacobian(q)
+            B += link['mm'] * Jp.T * Jp
+            U += link['mm'] * grav * p[1]
+        Jo = sp.Matrix([[1]*i + [link['kr']] + [0]*(n - i - 1)])
+        B += link['Im'] * Jo.T * Jo
+        #Link i
+        com = p + rot(th[i]) * sp.Matrix([link['cx'], link['cy']])
+        Jp = com.jacobian(q)
+        Jo = sp.Matrix([[1]*(i + 1) + [0]*(n - i - 1)])
+        B += link['m'] * Jp.T * Jp + link['I'] * Jo.T * Jo
+        U += link['m'] * grav * com[1]
+        p = p + rot(th[i]) * sp.Matrix([link['ax'], link['ay']])
+
+    g = sp.Matrix([sp.diff(U, qi) for qi in q])
+    #Christoffel symbols of the first type
+    C = sp.zeros(n, n)
+    for i in range(n):
+        for j in range(n):
+            C[i, j] = sum(sp.Rational(1, 2) * (sp.diff(B[i, j], q[k]) + sp.diff(B[i, k], q[j]) - sp.diff(B[j, k], q[i])) * qd[k] for k in range(n))
+
+    #End effector pose [x, y, theta] and jacobian
+    x_e = sp.Matrix([p[0], p[1], th[-1]])
+    J = x_e.jacobian(q)
+    J_dot = sp.zeros(3, n)
+    for k in range(n):
+        J_dot += sp.diff(J, q[k]) * qd[k]
+
+    #Replace trigonometric functions with the per-call cached values
+    trig = {}
+    for i, name in enumerate(angle_names(n)):
+        trig[sp.sin(th[i])] = sp.Symbol('s' + name)
+        trig[sp.cos(th[i])] = sp.Symbol('c' + name)
+    subs = lambda m: m.subs(trig)
+    rename = dict((qd[i], sp.Symbol('q_dot[%d]' % i)) for i in range(n))
+    return [subs(m).subs(rename) for m in (B, C, g, J, J_dot)]
+
+
+def emit_function(name, args, doc, matrix, trig, build='conf.array', mirror_sign=None):
+    """
+    Return the source of a function evaluating matrix with common subexpressions eliminated.
+    With mirror_sign the function gets a mirrored branch returning diag(sign)*matrix*diag(sign).
+    The generated function fills out in place when given (single configuration).
+    """
+    printer = FloatCodePrinter()
+    rows, cols = matrix.shape
+    replacements, reduced = sp.cse(list(matrix), symbols=sp.numbered_symbols('x'))
+    lines = ['def %s(%s, out=None):' % (name, args), '    """', '    %s' % doc, '    """', trig.rstrip('\n')]
+    if 'q_dot' in args:
+        if build == 'conf.array':
+            lines.append('    q_dot = conf.columns(q_dot)')
+        else:
+            lines.append('    q_dot = np.asarray(q_dot, dtype=np.float64).T')
+    for sym, expr in replacements:
+        lines.append('    %s = %s' % (sym, printer.doprint(expr)))
+    entries = []
+    for k, expr in enumerate(reduced):
+        entry = 'm%d%d' % (k // cols, k % cols)
+        lines.append('    %s = %s' % (entry, printer.doprint(expr)))
+        entries.append(entry)
+
+    if mirror_sign:
+        signs = [mirror_sign[k // cols] * (mirror_sign[k % cols] if cols > 1 else 1) for k in range(len(entries))]
+        flipped = [entry for entry, sign in zip(entries, signs) if sign < 0]
+        if flipped:
+            lines.append('    if mirrored:')
+            for entry in flipped:
+                lines.append('        %s = -%s' % (entry, entry))
+    rows_src = '[' + ', '.join('[' + ', '.join(entries[i*cols:(i + 1)*cols]) + ']' for i in range(rows)) + ']'
+    lines.append('    if out is None:')
+    if build == 'conf.array':
+        lines.append('        return conf.array(%s)' % rows_src)
+    else:
+        lines.append('        return %s(%s, N)' % (build, rows_src))
+    for k, entry in enumerate(entries):
+        lines.append('    out[%d, %d] = %s' % (k // cols, k % cols, entry))
+    lines.append('    return out')
+    return '\n'.join(lines) + '\n'
+
+
+def parameters_hash(links, grav=G):
+    """
+    Hash of the arm model and of the generator version, key of the cached modules
+    """
+    key = repr((GENERATOR_VERSION, float(grav), [sorted((k, float(v)) for k, v in link.items()) for link in links]))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def joint_space_source(links, grav=G):
+    """
+    Source of the joint space dynamics module of the arm
+    """
+    n = len(links)
+    B, C, g, J, J_dot = derive(links, grav)
+    trig = trig_block(n)
+    if n == 3:
+        imports = 'from windowx_arm import as_configuration'
+        build = 'conf.array'
+    else:
+        imports = 'import numpy as np\nfrom windowx_arm import stack'
+        build = 'stack'
+    size = '%dx%d' % (n, n)
+    source = HEADER % {'n': n, 'hash': parameters_hash(links, grav), 'imports': imports}
+    source += emit_function('mass_matrix', 'q', 'Joint space inertia matrix B(q), ' + size, B, trig, build) + '\n\n'
+    if n <= SYMBOLIC_INVERSE_LINKS:
+        B_inv = B.adjugate() / B.det()
+        source += emit_function('mass_matrix_inv', 'q', 'Inverse of the joint space inertia matrix B(q)^-1, ' + size, B_inv, trig, build) + '\n\n'
+    else:
+        source += NUMERIC_INVERSE % size + '\n\n'
+    source += emit_function('coriolis', 'q, q_dot', 'Joint space centrifugal and Coriolis matrix C(q, q_dot), ' + size, C, trig, build) + '\n\n'
+    source += emit_function('gravity', 'q', 'Joint space gravity torques g(q), %dx1 column' % n, g, trig, build) + '\n\n'
+    source += emit_function('jacobian', 'q', 'End effector [x, y, theta] jacobian, 3x%d' % n, J, trig, build) + '\n\n'
+    source += emit_function('jacobian_dot', 'q, q_dot', 'Time derivative of the end effector jacobian, 3x%d' % n, J_dot, trig, build)
+    return source
+
+
+def _load_source(name, path):
+    try:
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    except ImportError:
+        import imp
+        return imp.load_source(name, path)
+
+
+def cached_module_path(links, grav=G, cache_dir=None):
+    """
+    Path of the generated module of the arm model, generated if not in the cache
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    path = os.path.join(cache_dir, 'windowx_dynamics_%dlinks_%s.py' % (len(links), parameters_hash(links, grav)[:16]))
+    if not os.path.exists(path):
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        source = joint_space_source(links, grav)
+        tmp = '%s.%d.tmp' % (path, os.getpid())
+        with open(tmp, 'w') as f:
+            f.write(source)
+        os.rename(tmp, path)
+    return path
+
+
+def load_dynamics(links=WINDOWX_3LINKS, grav=G, cache_dir=None):
+    """
+    Import the joint space dynamics module of the arm (mass_matrix, mass_matrix_inv, coriolis,
+    gravity, jacobian, jacobian_dot), generating it only when the parameters are not in the cache
+    """
+    path = cached_module_path(links, grav, cache_dir)
+    return _load_source(os.path.splitext(os.path.basename(path))[0], path)
+
+
+if __name__ == '__main__':
+    links = WINDOWX_2LINKS if sys.argv[1:] == ['2'] else WINDOWX_3LINKS
+    print("Deriving the %d links dynamics, it may take a while..." % len(links))
+    print("Module: " + cached_module_path(links))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+"""
+Generate windowx_dynamics.py: end effector space M, C and g of the 3 links windowx arm.
+The model is derived with the Lagrange equations from the links and motors constants in windowx_arm.py,
+mapped in the end effector space through the jacobian and written as straight-line code
+with common subexpressions eliminated (see compute_dynamic_matrices.py for the joint space modules
+of any n links arm), so that every sin/cos is evaluated once per call.
+"""
+
+import os
+from windowx_arm import WINDOWX_3LINKS, G
+from compute_dynamic_matrices import derive, emit_function, trig_block, parameters_hash
+
+LINKS = WINDOWX_3LINKS
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'windowx_dynamics.py')
+
+HEADER = '''#!/usr/bin/env python
+
+"""
+End effector space dynamics of the 3 links windowx arm: M(q) x_ddot + C(q, q_dot) x_dot + g(q) = u.
+q is the ArmConfiguration of the tick (or the angles of the 2nd, 3rd and 4th joints),
+q_dot the velocities of the same joints.
+A configuration built from a (N, 3) array, with q_dot (N, 3), returns (N, 3, 3) and (N, 3) stacks.
+With out, a preallocated array of the result, a single configuration is evaluated in place.
+With mirrored=True the matrices are expressed in the frame of the arm mounted in front
+of the first one (x and orientation flipped), as used for robot 2 in the cooperative controllers.
+
+GENERATED by compute_dynamic_matrices_3links.py, do not edit by hand.
+Parameters hash: %s
+"""
+
+from windowx_arm import as_configuration
+
+'''
+
+#With the mirrored base x and orientation change sign: M2 = P*M*P, C2 = P*C*P, g2 = P*g with P = diag(-1, 1, -1)
+MIRROR_SIGN = [-1, 1, -1]
+
+
+def ee_dynamics(B, C, g, J, J_dot):
+    """
+    Map the joint space model in the end effector space
+    """
+    J_inv = J.adjugate() / J.det()
+    M_x = J_inv.T * B * J_inv
+    C_x = J_inv.T * (C - B * J_inv * J_dot) * J_inv
+    g_x = J_inv.T * g
+    return M_x, C_x, g_x
+
+
+def generate(path=OUTPUT):
+    B, C, g, J, J_dot = derive(LINKS, G)
+    M_x, C_x, g_x = ee_dynamics(B, C, g, J, J_dot)
+    trig = trig_block(len(LINKS))
+    source = HEADER % parameters_hash(LINKS, G)
+    source += emit_function('mass_matrix', 'q, mirrored=False', 'End effector space inertia matrix M(q), 3x3', M_x, trig, mirror_sign=MIRROR_SIGN) + '\n\n'
+    source += emit_function('coriolis', 'q, q_dot, mirrored=False', 'End effector space centrifugal and Coriolis matrix C(q, q_dot), 3x3', C_x, trig, mirror_sign=MIRROR_SIGN) + '\n\n'
+    source += emit_function('gravity', 'q, mirrored=False', 'End effector space gravity vector g(q), 3x1 column', g_x, trig, mirror_sign=MIRROR_SIGN)
+    with open(path, 'w') as f:
+        f.write(source)
+    return path
+
+
+if __name__ == '__main__':
+    print("Deriving the 3 links windowx dynamics, it may take a while...")
+    print("Written: " + generate())
@@ -10,8 +10,15 @@ from math import sin, cos, pi, sqrt, exp, log, fabs
 from windowx_msgs.msg import TargetConfiguration
 from std_msgs.msg import Float32MultiArray, MultiArrayDimension
 import numpy as np
-from numpy.linalg import inv, det, norm
+from numpy.linalg import det, norm
 from windowx_arm import *
+from windowx_linalg import diag_inv
+from windowx_common.log import ring_logger
+
+#Log record of the performance functions close to saturation: csi_s, csi_v, e_v, ro_v, e_s, ro_s, object velocity, reference velocity
+SATURATION_FIELDS = ['csi_s_x', 'csi_s_y', 'csi_s_theta', 'csi_v_x', 'csi_v_y', 'csi_v_theta', 'e_v_x', 'e_v_y', 'e_v_theta',
+                     'ro_v_x', 'ro_v_y', 'ro_v_theta', 'e_s_x', 'e_s_y', 'e_s_theta', 'ro_s_x', 'ro_s_y', 'ro_s_theta',
+                     'obj_vx', 'obj_vy', 'obj_w', 'v_ref_x', 'v_ref_y', 'v_ref_w']
 
 class WindowxController():
     """Class to compute and pubblish joints torques"""
@@ -126,6 +133,11 @@ class WindowxController():
         self.obj_pose_call = False
         self.obj_vel_call = False
 
+        #Loop records, formatted and printed by a background thread
+        self.log = ring_logger(len(SATURATION_FIELDS))
+        self.LOG_SATURATION = self.log.channel('saturation', SATURATION_FIELDS)
+        self.LOG_TORQUES = self.log.channel('torques', ['r1_q2', 'r1_q3', 'r1_q4', 'r2_q2', 'r2_q3', 'r2_q4'])
+
         print("\nWindowX controller node created")
         print("\nWaiting for target position, velocity and acceleration...")
 
@@ -216,31 +228,23 @@ class WindowxController():
             r1_array_poses = np.asarray(self.r1_joints_poses)[np.newaxis].T
             r2_array_vels = np.asarray(self.r2_joints_vels)[np.newaxis].T
             r2_array_poses = np.asarray(self.r2_joints_poses)[np.newaxis].T
+            #Configuration contexts: sines and cosines shared by kinematics and dynamics
+            r1_conf = ArmConfiguration(r1_array_poses[1:4,0])
+            r2_conf = ArmConfiguration(r2_array_poses[1:4,0])
             obj_array_vel = np.asarray(self.obj_vel)[np.newaxis].T
             obj_array_pose = np.asarray(self.obj_pose)[np.newaxis].T
 
             # Compute jacobians and ee position from joints_poses
-            r1_x_e = np.array([[L1_X*cos(r1_array_poses[1]) - L1_Y*sin(r1_array_poses[1]) + L2*cos(r1_array_poses[1]+r1_array_poses[2]) + L3*cos(r1_array_poses[1]+r1_array_poses[2]+r1_array_poses[3])],\
-                            [L1_X*sin(r1_array_poses[1]) + L1_Y*cos(r1_array_poses[1]) + L2*sin(r1_array_poses[1]+r1_array_poses[2]) + L3*sin(r1_array_poses[1]+r1_array_poses[2]+r1_array_poses[3])],\
-                            [r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]]])
+            r1_x_e = fk(r1_conf)
             # Compute ee velocities from joints_vels
-            r1_J_e = np.matrix([[ 0.047766999999999996961985715415722*cos(r1_array_poses[1]) - 0.14203*sin(r1_array_poses[1] + r1_array_poses[2]) - 0.16036*sin(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) - 0.14192399999999999460342792190204*sin(r1_array_poses[1]),\
-                             - 0.16036*sin(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) - 0.14203*sin(r1_array_poses[1] + r1_array_poses[2]), -0.16036*sin(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3])],\
-                            [ 0.16036*cos(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) + 0.14203*cos(r1_array_poses[1] + r1_array_poses[2]) + 0.14192399999999999460342792190204*cos(r1_array_poses[1]) + 0.047766999999999996961985715415722*sin(r1_array_poses[1]),\
-                              0.16036*cos(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) + 0.14203*cos(r1_array_poses[1] + r1_array_poses[2]),  0.16036*cos(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3])],\
-                            [1.0,1.0,1.0]])
+            r1_J_e = jacobian(r1_conf, L3_DYN)
             r1_v_e = np.dot(r1_J_e, r1_array_vels[1:4])
 
-            r2_x_e = np.array([[L1_X*cos(r2_array_poses[1]) - L1_Y*sin(r2_array_poses[1]) + L2*cos(r2_array_poses[1]+r2_array_poses[2]) + L3*cos(r2_array_poses[1]+r2_array_poses[2]+r2_array_poses[3])],\
-                            [L1_X*sin(r2_array_poses[1]) + L1_Y*cos(r2_array_poses[1]) + L2*sin(r2_array_poses[1]+r2_array_poses[2]) + L3*sin(r2_array_poses[1]+r2_array_poses[2]+r2_array_poses[3])],\
-                            [r2_array_poses[1] + r2_array_poses[2] + r2_array_poses[3]]])
+            r2_x_e = fk(r2_conf, base=ArmBase(mirrored=True, x_off=0.77))
             # Compute ee velocities from joints_vels
-            r2_J_e = np.matrix([[ 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.047766999999999996961985715415722*cos(r2_array_poses[1,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[1,0]), 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]), 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])],\
-                                [ 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.14192399999999999460342792190204*cos(r2_array_poses[1,0]) + 0.047766999999999996961985715415722*sin(r2_array_poses[1,0]), 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]), 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])],\
-                                [-1.0,-1.0,-1.0]])
+            r2_J_e = jacobian(r2_conf, L3_DYN, mirrored=True)
 
             r2_v_e = np.dot(r2_J_e, r2_array_vels[1:4])
-            r2_x_e = np.array([[0.77 - r2_x_e[0,0]],[r2_x_e[1,0]],[-r2_x_e[2,0]]])
 
             #Compute obj position and vel from ee positions and vel
             r1_p_ee = np.array([[r1_x_e[0,0]],[r1_x_e[1,0]],[0]])
@@ -283,11 +287,14 @@ class WindowxController():
             self.ro_v[0,0] = (self.ro_v_0_x - self.ro_v_inf_x) * exp(-self.l_v_x * (self.actual_time.to_sec())) + self.ro_v_inf_x
             self.ro_v[1,1] = (self.ro_v_0_y - self.ro_v_inf_y) * exp(-self.l_v_y * (self.actual_time.to_sec())) + self.ro_v_inf_y
             self.ro_v[2,2] = (self.ro_v_0_theta - self.ro_v_inf_theta) * exp(-self.l_v_theta * (self.actual_time.to_sec())) + self.ro_v_inf_theta
+            #Performance functions are diagonal: invert them once per tick
+            ro_s_inv = diag_inv(self.ro_s)
+            ro_v_inv = diag_inv(self.ro_v)
 
             #Compute errors and derived signals
             #position errors
             e_s = self.obj_pose1 - self.target_pose
-            csi_s = np.dot(inv(self.ro_s), e_s)
+            csi_s = np.dot(ro_s_inv, e_s)
             csi_s[0,0] = np.sign(csi_s[0,0]) * min(0.99, fabs(csi_s[0,0]))
             csi_s[1,0] = np.sign(csi_s[1,0]) * min(0.99, fabs(csi_s[1,0]))
             csi_s[2,0] = np.sign(csi_s[2,0]) * min(0.99, fabs(csi_s[2,0]))
@@ -295,11 +302,11 @@ class WindowxController():
             r_s = np.matrix([[2/(1 - csi_s[0,0]**2),0,0],[0,2/(1 - csi_s[1,0]**2),0],[0,0, 2/(1 - csi_s[2,0]**2)]])
 
             #Compute reference velocity
-            v_o_des = - self.gs * np.dot(np.dot(inv(self.ro_s), r_s), eps_s)
+            v_o_des = - self.gs * np.dot(np.dot(ro_s_inv, r_s), eps_s)
 
             #Velocity errors
             e_v = self.obj_vel1 - v_o_des
-            csi_v = np.dot(inv(self.ro_v), e_v)
+            csi_v = np.dot(ro_v_inv, e_v)
             csi_v[0,0] = np.sign(csi_v[0,0]) * min(0.9, fabs(csi_v[0,0]))
             csi_v[1,0] = np.sign(csi_v[1,0]) * min(0.9, fabs(csi_v[1,0]))
             csi_v[2,0] = np.sign(csi_v[2,0]) * min(0.9, fabs(csi_v[2,0]))
@@ -307,27 +314,23 @@ class WindowxController():
             r_v = np.matrix([[2/(1 - csi_v[0,0]**2),0,0],[0,2/(1 - csi_v[1,0]**2),0],[0,0, 2/(1 - csi_v[2,0]**2)]])
 
             if fabs(max(csi_s)) >0.899999 or fabs(max(csi_v))>0.89999 :
-                print("\n csi_s_v:")
-                print(csi_s)
-                print(csi_v)
+                self.log.push(self.LOG_SATURATION, csi_s, csi_v, e_v, self.ro_v.diagonal(), e_s, self.ro_s.diagonal(), self.obj_vel1, v_o_des)
 
 
             #Compute inputs
-            tmp = np.dot(J_o1_inv, inv(self.ro_v))
+            tmp = np.dot(J_o1_inv, ro_v_inv)
             tmp = np.dot(tmp, r_v)
             tmp = np.dot(tmp, eps_v)
             u_r1 = - self.c1 * self.gv * tmp
 
-            tmp = np.dot(J_o2_inv, inv(self.ro_v))
+            tmp = np.dot(J_o2_inv, ro_v_inv)
             tmp = np.dot(tmp, r_v)
             tmp = np.dot(tmp, eps_v)
             u_r2 = - self.c2 * self.gv * tmp
 
             control_torque_r1 = np.dot(r1_J_e.T, u_r1)
             control_torque_r2 = np.dot(r2_J_e.T, u_r2)
-            print("\n Torques: ")
-            print(control_torque_r1)
-            print(control_torque_r2)
+            self.log.push(self.LOG_TORQUES, control_torque_r1, control_torque_r2)
             #Create ROS message
             self.torques1.data = [0.0, control_torque_r1[0,0], control_torque_r1[1,0], control_torque_r1[2,0], 0.0, self.r1_close_gripper]
             self.torques2.data = [0.0, control_torque_r2[0,0], control_torque_r2[1,0], control_torque_r2[2,0], 0.0, self.r2_close_gripper]
@@ -7,14 +7,23 @@ Start PPC controller for manuvering windowx arms through the ArbotiX board simul
 import cv2
 import rospy, roslib
 from math import sin, cos, pi, sqrt, exp, log, fabs
-from windowx_msgs.msg import TargetConfiguration
+from windowx_msgs.msg import TargetConfiguration, JointsState
 from std_msgs.msg import Float32MultiArray, MultiArrayDimension
 import numpy as np
-from numpy.linalg import inv, det, norm
+from numpy.linalg import det, norm
 from windowx_arm import *
+from windowx_linalg import jacobian_inv, grasp_inv, diag_inv
 from windowx_driver.srv import *
+from windowx_common.latency import loop_probe
+from windowx_common.log import ring_logger
+from windowx_common.singularity import SingularityMap, RCOND_GRASP
 import time
 
+#Log record of the performance functions close to saturation: csi_s, csi_v, e_v, ro_v, e_s, ro_s, object velocity, reference velocity
+SATURATION_FIELDS = ['csi_s_x', 'csi_s_y', 'csi_s_theta', 'csi_v_x', 'csi_v_y', 'csi_v_theta', 'e_v_x', 'e_v_y', 'e_v_theta',
+                     'ro_v_x', 'ro_v_y', 'ro_v_theta', 'e_s_x', 'e_s_y', 'e_s_theta', 'ro_s_x', 'ro_s_y', 'ro_s_theta',
+                     'obj_vx', 'obj_vy', 'obj_w', 'v_ref_x', 'v_ref_y', 'v_ref_w']
+
 class WindowxController():
     """Class to compute and pubblish joints torques"""
     def __init__(self):
@@ -70,12 +79,10 @@ class WindowxController():
 
         #initialize pose, velocity listeners and torques publishers
         #Robot1
-        self.r1_pose_sub = rospy.Subscriber('/windowx_3links_r1/joints_poses', Float32MultiArray, self._r1_pose_callback, queue_size=1)
-        self.r1_vel_sub = rospy.Subscriber('/windowx_3links_r1/joints_vels', Float32MultiArray, self._r1_vel_callback, queue_size=1)
+        self.r1_state_sub = rospy.Subscriber('/windowx_3links_r1/joints_state', JointsState, self._r1_state_callback, queue_size=1)
         self.r1_torque_pub = rospy.Publisher('/windowx_3links_r1/torques', Float32MultiArray, queue_size=1)
         #Robot2
-        self.r2_pose_sub = rospy.Subscriber('/windowx_3links_r2/joints_poses', Float32MultiArray, self._r2_pose_callback, queue_size=1)
-        self.r2_vel_sub = rospy.Subscriber('/windowx_3links_r2/joints_vels', Float32MultiArray, self._r2_vel_callback, queue_size=1)
+        self.r2_state_sub = rospy.Subscriber('/windowx_3links_r2/joints_state', JointsState, self._r2_state_callback, queue_size=1)
         self.r2_torque_pub = rospy.Publisher('/windowx_3links_r2/torques', Float32MultiArray, queue_size=1)
         #Trajectory listener
         self.target_sub = rospy.Subscriber('/object/target_conf', TargetConfiguration, self._target_callback, queue_size=1)
@@ -99,12 +106,11 @@ class WindowxController():
         self.target_vel = np.array([[0.0,0.0,0.0]]).T
         self.target_acc = np.array([[0.0,0.0,0.0]]).T
         #Robot1
-        self.r1_joints_poses = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-        self.r1_joints_vels =  [0.0, 0.0, 0.0, 0.0, 0.0]
+        #Positions and velocities of the same bus read, replaced together by the joints state callback
+        self.r1_joints = ([0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0])
         self.r1_close_gripper = 1
         #Robot2
-        self.r2_joints_poses = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-        self.r2_joints_vels =  [0.0, 0.0, 0.0, 0.0, 0.0]
+        self.r2_joints = ([0.0, 0.0, 0.0, 0.0, 0.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0])
         self.r2_close_gripper = 1
         #Obj
         self.obj_pose = [0.0, 0.0, 0.0]
@@ -140,33 +146,32 @@ class WindowxController():
         self.performance_start_step = rospy.Duration.from_sec(2.0)
 
         time.sleep(1)
+        #Loop records, formatted and printed by a background thread
+        self.log = ring_logger(len(SATURATION_FIELDS))
+        self.LOG_SATURATION1 = self.log.channel('saturation r1', SATURATION_FIELDS)
+        self.LOG_SATURATION2 = self.log.channel('saturation r2', SATURATION_FIELDS)
+        self.LOG_INPUTS = self.log.channel('inputs', ['r1_x', 'r1_y', 'r1_theta', 'r2_x', 'r2_y', 'r2_theta'])
+        #Proximity to the singularities of the grasp jacobians, as in windowx_PPC.py
+        self.singularity = SingularityMap(rospy.get_param('~singularity_map', ''), l3=L3, grasp_offset=-self.p1o_in_e1[0,0])
+        self.singularity_rcond = rospy.get_param('~singularity_rcond', 0.007)
+        self.LOG_SINGULARITY = self.log.channel('near singularity', ['r1_q2', 'r1_rcond', 'r2_q2', 'r2_rcond'])
+
         print("\nWindowX controller node created")
         print("\nWaiting for target position, velocity and acceleration...")
         self.compute_torques()
 
     #SENSING CALLBACKS
-    def _r1_pose_callback(self, msg):
-        """
-        ROS callback to get the joint poses
-        """
-        self.r1_joints_poses = msg.data
-
-    def _r2_pose_callback(self, msg):
+    def _r1_state_callback(self, msg):
         """
-        ROS callback to get the joint poses
+        ROS callback to get the joint poses and velocities of one bus read
         """
-        self.r2_joints_poses = msg.data
+        self.r1_joints = (msg.positions, msg.velocities)
 
-    def _r1_vel_callback(self, msg):
-        """
-        ROS callback to get the joint velocities
+    def _r2_state_callback(self, msg):
         """
-        self.r1_joints_vels = msg.data
-    def _r2_vel_callback(self, msg):
+        ROS callback to get the joint poses and velocities of one bus read
         """
-        ROS callback to get the joint velocities
-        """
-        self.r2_joints_vels = msg.data
+        self.r2_joints = (msg.positions, msg.velocities)
 
     #DESIRED TRAJECTORY CALLBACK
     def _target_callback(self, msg):
@@ -187,39 +192,41 @@ class WindowxController():
         Compute and pubblish torques values for 2nd, 3rd and 4th joints
         """
 
+        probe = loop_probe('windowx_PPC_test', 1.0/120)
         while not rospy.is_shutdown():
-
-            r1_array_vels = np.asarray(self.r1_joints_vels)[np.newaxis].T
-            r1_array_poses = np.asarray(self.r1_joints_poses)[np.newaxis].T
-            r2_array_vels = np.asarray(self.r2_joints_vels)[np.newaxis].T
-            r2_array_poses = np.asarray(self.r2_joints_poses)[np.newaxis].T
+            probe.start()
+
+            r1_joints_poses, r1_joints_vels = self.r1_joints
+            r2_joints_poses, r2_joints_vels = self.r2_joints
+            r1_array_vels = np.asarray(r1_joints_vels)[np.newaxis].T
+            r1_array_poses = np.asarray(r1_joints_poses)[np.newaxis].T
+            r2_array_vels = np.asarray(r2_joints_vels)[np.newaxis].T
+            r2_array_poses = np.asarray(r2_joints_poses)[np.newaxis].T
+            #Configuration contexts: sines and cosines shared by kinematics and dynamics
+            r1_conf = ArmConfiguration(r1_array_poses[1:4,0])
+            r2_conf = ArmConfiguration(r2_array_poses[1:4,0])
+            r1_rcond = self.singularity.lookup(r1_conf.q[1], r1_conf.q[2])[RCOND_GRASP]
+            r2_rcond = self.singularity.lookup(r2_conf.q[1], r2_conf.q[2])[RCOND_GRASP]
+            if min(r1_rcond, r2_rcond) < self.singularity_rcond:
+                self.log.push(self.LOG_SINGULARITY, r1_conf.q[1], r1_rcond, r2_conf.q[1], r2_rcond)
             obj_target_pose = self.target_pose
             obj_target_vel = self.target_vel
             obj_target_acc = self.target_acc
+            probe.lap()
 
             # Compute jacobians and ee position from joints_poses
-            r1_x_e = np.array([[L1_X*cos(r1_array_poses[1]) - L1_Y*sin(r1_array_poses[1]) + L2*cos(r1_array_poses[1]+r1_array_poses[2]) + L3*cos(r1_array_poses[1]+r1_array_poses[2]+r1_array_poses[3])],\
-                            [L1_X*sin(r1_array_poses[1]) + L1_Y*cos(r1_array_poses[1]) + L2*sin(r1_array_poses[1]+r1_array_poses[2]) + L3*sin(r1_array_poses[1]+r1_array_poses[2]+r1_array_poses[3])],\
-                            [r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]]])
+            r1_x_e = fk(r1_conf)
             # Compute ee velocities from joints_vels
-            r1_J_e = np.matrix([[ 0.047767*cos(r1_array_poses[1,0]) - 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.15036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.141924*sin(r1_array_poses[1,0]),\
-                             - 0.15036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0]), -0.15036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])],\
-                            [ 0.15036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.141924*cos(r1_array_poses[1,0]) + 0.047767*sin(r1_array_poses[1,0]),\
-                              0.15036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0]),  0.15036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])],\
-                            [1.0,1.0,1.0]])
+            r1_J_e = jacobian(r1_conf)
             r1_v_e = np.dot(r1_J_e, r1_array_vels[1:4])
 
-            r2_x_e = np.array([[L1_X*cos(r2_array_poses[1]) - L1_Y*sin(r2_array_poses[1]) + L2*cos(r2_array_poses[1]+r2_array_poses[2]) + L3*cos(r2_array_poses[1]+r2_array_poses[2]+r2_array_poses[3])],\
-                            [L1_X*sin(r2_array_poses[1]) + L1_Y*cos(r2_array_poses[1]) + L2*sin(r2_array_poses[1]+r2_array_poses[2]) + L3*sin(r2_array_poses[1]+r2_array_poses[2]+r2_array_poses[3])],\
-                            [r2_array_poses[1] + r2_array_poses[2] + r2_array_poses[3]]])
+            r2_x_e = fk(r2_conf, base=ArmBase(mirrored=True, x_off=self.x_off))
             # Compute ee velocities from joints_vels
-            r2_J_e = np.matrix([[ 0.15036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.047767*cos(r2_array_poses[1,0]) + 0.141924*sin(r2_array_poses[1,0]), 0.15036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]), 0.15036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])],\
-                                [ 0.15036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.141924*cos(r2_array_poses[1,0]) + 0.047767*sin(r2_array_poses[1,0]), 0.15036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]), 0.15036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])],\
-                                [-1.0,-1.0,-1.0]])
+            r2_J_e = jacobian(r2_conf, mirrored=True)
 
             #Invert the Jacobians
-            r1_J_e_inv = inv(r1_J_e)
-            r2_J_e_inv = inv(r2_J_e)
+            r1_J_e_inv = jacobian_inv(r1_J_e)
+            r2_J_e_inv = jacobian_inv(r2_J_e)
 
             #Setup offsets
             if self.first_iter:
@@ -229,7 +236,6 @@ class WindowxController():
                 self.first_iter = False
 
             r2_v_e = np.dot(r2_J_e, r2_array_vels[1:4])
-            r2_x_e = np.array([[self.x_off - r2_x_e[0,0]],[r2_x_e[1,0]],[-r2_x_e[2,0]]])
 
             #Compute obj position and vel from ee positions and vel
             r1_p_ee = np.array([[r1_x_e[0,0]],[r1_x_e[1,0]],[0]])
@@ -274,6 +280,9 @@ class WindowxController():
             self.ro_v[0,0] = (self.ro_v_0_x - self.ro_v_inf_x) * exp(-self.l_v_x * (self.actual_time.to_sec())) + self.ro_v_inf_x
             self.ro_v[1,1] = (self.ro_v_0_y - self.ro_v_inf_y) * exp(-self.l_v_y * (self.actual_time.to_sec())) + self.ro_v_inf_y
             self.ro_v[2,2] = (self.ro_v_0_theta - self.ro_v_inf_theta) * exp(-self.l_v_theta * (self.actual_time.to_sec())) + self.ro_v_inf_theta
+            #Performance functions are diagonal: invert them once per tick
+            ro_s_inv = diag_inv(self.ro_s)
+            ro_v_inv = diag_inv(self.ro_v)
 
 
 
@@ -284,7 +293,7 @@ class WindowxController():
             #position errors
             e_s = self.obj_pose1 - self.target_pose
             e_s1 = e_s
-            csi_s = np.dot(inv(self.ro_s), e_s)
+            csi_s = np.dot(ro_s_inv, e_s)
             csi_s[0,0] = np.sign(csi_s[0,0]) * min(0.9999, fabs(csi_s[0,0]))
             csi_s[1,0] = np.sign(csi_s[1,0]) * min(0.9999, fabs(csi_s[1,0]))
             csi_s[2,0] = np.sign(csi_s[2,0]) * min(0.9999, fabs(csi_s[2,0]))
@@ -292,17 +301,17 @@ class WindowxController():
             r_s = np.matrix([[2/(1 - csi_s[0,0]**2),0,0],[0,2/(1 - csi_s[1,0]**2),0],[0,0, 2/(1 - csi_s[2,0]**2)]])
 
             #Compute moving direction for joints from position error
-            v_1_des = np.dot(inv(J_1o), -e_s)
+            v_1_des = np.dot(grasp_inv(J_1o), -e_s)
             q1_dot_des = np.dot(r1_J_e_inv, v_1_des)
 
             #Compute reference velocity
-            tmp = np.dot(inv(self.ro_s), r_s)
+            tmp = np.dot(ro_s_inv, r_s)
             tmp = np.dot(tmp, eps_s)
             v_o_des = - self.gs * tmp
 
             #Velocity errors
             e_v = self.obj_vel1 - v_o_des
-            csi_v = np.dot(inv(self.ro_v), e_v)
+            csi_v = np.dot(ro_v_inv, e_v)
             csi_v[0,0] = np.sign(csi_v[0,0]) * min(0.99, fabs(csi_v[0,0]))
             csi_v[1,0] = np.sign(csi_v[1,0]) * min(0.99, fabs(csi_v[1,0]))
             csi_v[2,0] = np.sign(csi_v[2,0]) * min(0.99, fabs(csi_v[2,0]))
@@ -310,27 +319,12 @@ class WindowxController():
             r_v1 = np.matrix([[2/(1 - csi_v[0,0]**2),0,0],[0,2/(1 - csi_v[1,0]**2),0],[0,0, 2/(1 - csi_v[2,0]**2)]])
 
             if max(fabs(min(csi_s)), max(csi_s)) >0.9998 or max(fabs(min(csi_v)), max(csi_v))>0.98 :
-                print("\n r1: \ncsi_s:")
-                print(csi_s)
-                print("csi_v")
-                print(csi_v)
-                print("e_v")
-                print(e_v)
-                print("ro_v")
-                print(self.ro_v)
-                print("e_s")
-                print(e_s)
-                print("ro_s")
-                print(self.ro_s)
-                print("Obj_vel")
-                print(self.obj_vel1)
-                print("referenc vel")
-                print(v_o_des)
+                self.log.push(self.LOG_SATURATION1, csi_s, csi_v, e_v, self.ro_v.diagonal(), e_s, self.ro_s.diagonal(), self.obj_vel1, v_o_des)
 
             #r2
             e_s = self.obj_pose2 - self.target_pose
             e_s2 = e_s
-            csi_s = np.dot(inv(self.ro_s), e_s)
+            csi_s = np.dot(ro_s_inv, e_s)
             csi_s[0,0] = np.sign(csi_s[0,0]) * min(0.9999, fabs(csi_s[0,0]))
             csi_s[1,0] = np.sign(csi_s[1,0]) * min(0.9999, fabs(csi_s[1,0]))
             csi_s[2,0] = np.sign(csi_s[2,0]) * min(0.9999, fabs(csi_s[2,0]))
@@ -338,17 +332,17 @@ class WindowxController():
             r_s = np.matrix([[2/(1 - csi_s[0,0]**2),0,0],[0,2/(1 - csi_s[1,0]**2),0],[0,0, 2/(1 - csi_s[2,0]**2)]])
 
             #Compute moving direction for joints from position error
-            v_2_des = np.dot(inv(J_2o), -e_s)
+            v_2_des = np.dot(grasp_inv(J_2o), -e_s)
             q2_dot_des = np.dot(r2_J_e_inv, v_2_des)
 
             #Compute reference velocity
-            tmp = np.dot(inv(self.ro_s), r_s)
+            tmp = np.dot(ro_s_inv, r_s)
             tmp = np.dot(tmp, eps_s)
             v_o_des = - self.gs * tmp
 
             #Velocity errors
             e_v = self.obj_vel2 - v_o_des
-            csi_v = np.dot(inv(self.ro_v), e_v)
+            csi_v = np.dot(ro_v_inv, e_v)
             csi_v[0,0] = np.sign(csi_v[0,0]) * min(0.99, fabs(csi_v[0,0]))
             csi_v[1,0] = np.sign(csi_v[1,0]) * min(0.99, fabs(csi_v[1,0]))
             csi_v[2,0] = np.sign(csi_v[2,0]) * min(0.99, fabs(csi_v[2,0]))
@@ -360,41 +354,24 @@ class WindowxController():
 
 
             if max(fabs(min(csi_s)), max(csi_s)) >0.9998 or max(fabs(min(csi_v)), max(csi_v))>0.98 :
-                print("\n r2: \ncsi_s:")
-                print(csi_s)
-                print("csi_v")
-                print(csi_v)
-                print("e_v")
-                print(e_v)
-                print("ro_v")
-                print(self.ro_v)
-                print("e_s")
-                print(e_s)
-                print("ro_s")
-                print(self.ro_s)
-                print("Obj_vel")
-                print(self.obj_vel2)
-                print("referenc vel")
-                print(v_o_des)
+                self.log.push(self.LOG_SATURATION2, csi_s, csi_v, e_v, self.ro_v.diagonal(), e_s, self.ro_s.diagonal(), self.obj_vel2, v_o_des)
 
 
             #Compute inputs
             #Object center of mass input
-            u_o1 = np.dot(np.dot(inv(self.ro_v), r_v1), eps_v1)
-            u_o2 = np.dot(np.dot(inv(self.ro_v), r_v2), eps_v2)
+            u_o1 = np.dot(np.dot(ro_v_inv, r_v1), eps_v1)
+            u_o2 = np.dot(np.dot(ro_v_inv, r_v2), eps_v2)
 
             u_r1 = - self.c1 * self.gv * np.dot(J_1o.T, u_o1)
             u_r2 = - self.c2 * self.gv * np.dot(J_2o.T, u_o2)
-            print("\nInputs:")
-            print(u_r1)
-            print(u_r2)
-            print("\n")
+            self.log.push(self.LOG_INPUTS, u_r1, u_r2)
 
             control_torque_r1 = np.dot(r1_J_e.T, u_r1)
             control_torque_r2 = np.dot(r2_J_e.T, u_r2)
             control_torque_r1 = control_torque_r1 + np.dot(self.tau_comp1, np.sign(q1_dot_des))
             control_torque_r2 = control_torque_r2 + np.dot(self.tau_comp2, np.sign(q2_dot_des))
 
+            probe.lap()
             if  norm(control_torque_r2) < 10 and norm(control_torque_r1) < 10:
                 #Create ROS message
                 self.torques1.data = [0.0, control_torque_r1[0,0], control_torque_r1[1,0], control_torque_r1[2,0], 0.0, self.r1_close_gripper]
@@ -438,6 +415,7 @@ class WindowxController():
             #self.errors.data = [r1_v_e[0,0], r1_v_e[1,0], r1_v_e[2,0], r2_v_e[0,0], r2_v_e[1,0], r2_v_e[2,0]]
             self.errors.data = [norm(u_o1), norm(u_o2), e_s1[0,0], e_s1[1,0], e_s1[2,0], e_s2[0,0], e_s2[1,0], e_s2[2,0]]
             self.errors_pub.publish(self.errors)
+            probe.lap()
             self.pub_rate.sleep()
 
 
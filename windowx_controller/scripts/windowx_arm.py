@@ -1,6 +1,378 @@
 #!/usr/bin/env python
 
-L1_X = 0.141924
-L1_Y = -0.047767
-L2 = 0.14203
-L3 = 0.15036
+"""
+Kinematics of the 3 links windowx arm (2nd, 3rd and 4th joints), evaluated from the sines and
+cosines of an ArmConfiguration: fk, jacobian and jacobian_dot, in the robot base frame or in the
+frame of the cooperative task with an ArmBase (the second arm is mounted in front of the first
+one, mirrored at x_off), and the object-EE grasp jacobian J_o with its derivative. ik inverts fk
+in closed form on batches of poses, to check the targets of a whole trajectory against the joint
+limits before running it.
+Two lengths of the 3rd link are in use: L3 reaches the grasp point between the fingers, it gives
+the end effector poses; L3_DYN is the 3rd link of the dynamic model (WINDOWX_3LINKS, windowx_dynamics),
+whose end effector space M, C and g are expressed at that point: the jacobians mapping those forces
+to joint torques (and the end effector velocities of the same controllers) take L3_DYN, the purely
+kinematic controllers (PPC) take L3.
+"""
+
+from math import sin, cos
+import numpy as np
+#Link lengths, shared with the driver
+from windowx_common.links import L1_X, L1_Y, L2, L3, L3_DYN
+
+G = 9.81 #m/s2
+
+#Dynamic parameters of the planar chain, one dict per link (2nd, 3rd and 4th joints):
+#ax, ay: vector from joint i to joint i+1 in the link frame
+#m, cx, cy, I: link mass, center of mass in the link frame, inertia about the center of mass
+#mm, Im, kr: mass of the servo mounted on joint i (carried by link i-1), rotor inertia and gear ratio
+WINDOWX_3LINKS = [{'ax': L1_X, 'ay': L1_Y, 'm': 0.084, 'cx': L1_X/2, 'cy': 0.005*L1_Y/0.084, 'I': 0.000557931816392701,
+                   'mm': 0.0, 'Im': 0.0154, 'kr': 1.0/200},
+                  {'ax': L2, 'ay': 0.0, 'm': 0.061, 'cx': L2/2, 'cy': 0.0, 'I': (0.061*L2**2)/3,
+                   'mm': 0.137, 'Im': 0.0154, 'kr': 1.0/200},
+                  {'ax': L3_DYN, 'ay': 0.0, 'm': 0.176, 'cx': L3_DYN/2, 'cy': 0.0, 'I': (0.176*L3_DYN**2)/3,
+                   'mm': 0.083, 'Im': 0.0076, 'kr': 1.0/193}]
+#The 2 links arm (3rd and 4th joints) of compute_dynamic_matreces_2link.py is the tail of the 3 links chain
+WINDOWX_2LINKS = WINDOWX_3LINKS[1:]
+
+class ArmConfiguration(object):
+    """
+    Configuration context of one arm for a control tick: angles of the 2nd, 3rd and 4th joints
+    and the sines and cosines of the absolute link angles, shared by kinematics and dynamics.
+    Built from a (N, 3) array it holds N configurations and every function of the context
+    returns stacks: (N, 3, 3) matrices and (N, 3) vectors.
+    """
+    __slots__ = ('q', 'theta', 's1', 'c1', 's12', 'c12', 's123', 'c123', 'n')
+
+    def __init__(self, q):
+        if getattr(q, 'ndim', 1) == 2:
+            q = np.asarray(q, dtype=np.float64)
+            q1 = q[:, 0]
+            q12 = q1 + q[:, 1]
+            q123 = q12 + q[:, 2]
+            self.n = q.shape[0]
+            self.q = (q1, q[:, 1], q[:, 2])
+            self.theta = q123
+            self.s1 = np.sin(q1)
+            self.c1 = np.cos(q1)
+            self.s12 = np.sin(q12)
+            self.c12 = np.cos(q12)
+            self.s123 = np.sin(q123)
+            self.c123 = np.cos(q123)
+        else:
+            self.update(q)
+
+    def update(self, q):
+        """
+        Move the context of a single configuration to the angles q in place
+        """
+        q1 = float(q[0])
+        q12 = q1 + float(q[1])
+        q123 = q12 + float(q[2])
+        self.n = None
+        self.q = (q1, float(q[1]), float(q[2]))
+        self.theta = q123
+        self.s1 = sin(q1)
+        self.c1 = cos(q1)
+        self.s12 = sin(q12)
+        self.c12 = cos(q12)
+        self.s123 = sin(q123)
+        self.c123 = cos(q123)
+        return self
+
+    def columns(self, x):
+        """
+        Per joint components of a joint space vector: x itself for a single configuration,
+        the columns of the (N, 3) array for a batch
+        """
+        if self.n is None:
+            return x
+        return np.asarray(x, dtype=np.float64).T
+
+    def array(self, rows):
+        """
+        Build a matrix from its entries: rows x cols array for a single configuration,
+        (N, rows, cols) stack for a batch ((N, rows) for a column)
+        """
+        return stack(rows, self.n)
+
+def stack(rows, n=None):
+    """
+    Build a matrix from entries that are scalars (n=None) or arrays of n samples
+    """
+    if n is None:
+        return np.array(rows)
+    out = np.empty((n, len(rows), len(rows[0])))
+    for i, row in enumerate(rows):
+        for j, x in enumerate(row):
+            out[:, i, j] = x
+    if out.shape[2] == 1:
+        return out[:, :, 0]
+    return out
+
+def as_configuration(q):
+    """
+    Return q if it is already an ArmConfiguration, build it from the joint angles otherwise
+    """
+    if isinstance(q, ArmConfiguration):
+        return q
+    return ArmConfiguration(q)
+
+class ArmBase(object):
+    """
+    Pose of the robot base in the task frame: identity, or mirrored at x_off for the arm mounted
+    in front of the first one (x -> x_off - x, theta -> -theta)
+    """
+    __slots__ = ('mirrored', 'x_off')
+
+    def __init__(self, mirrored=False, x_off=0.0):
+        self.mirrored = mirrored
+        self.x_off = float(x_off)
+
+def fk(conf, l3=L3, out=None, base=None):
+    """
+    End effector pose [x, y, theta] (3x1 column, (N, 3) for a batch) in the robot base frame,
+    in the task frame with base. out: preallocated 3x1 array filled in place.
+    """
+    x = L1_X*conf.c1 - L1_Y*conf.s1 + L2*conf.c12 + l3*conf.c123
+    y = L1_X*conf.s1 + L1_Y*conf.c1 + L2*conf.s12 + l3*conf.s123
+    theta = conf.theta
+    if base is not None and base.mirrored:
+        x = base.x_off - x
+        theta = -theta
+    if out is not None:
+        out[0, 0] = x
+        out[1, 0] = y
+        out[2, 0] = theta
+        return out
+    return conf.array([[x], [y], [theta]])
+
+def jacobian(conf, l3=L3, mirrored=False, out=None, base=None):
+    """
+    End effector jacobian (3x3). With mirrored=True (or a mirrored base) the x and theta rows are flipped,
+    as for the arm mounted in front of the first one. out: preallocated 3x3 array filled in place.
+    """
+    if base is not None:
+        mirrored = base.mirrored
+    j13 = -l3*conf.s123
+    j12 = j13 - L2*conf.s12
+    j11 = j12 - L1_X*conf.s1 - L1_Y*conf.c1
+    j23 = l3*conf.c123
+    j22 = j23 + L2*conf.c12
+    j21 = j22 + L1_X*conf.c1 - L1_Y*conf.s1
+    if out is not None:
+        sign = -1.0 if mirrored else 1.0
+        out[0, 0] = sign*j11
+        out[0, 1] = sign*j12
+        out[0, 2] = sign*j13
+        out[1, 0] = j21
+        out[1, 1] = j22
+        out[1, 2] = j23
+        out[2, 0] = sign
+        out[2, 1] = sign
+        out[2, 2] = sign
+        return out
+    if mirrored:
+        return conf.array([[-j11, -j12, -j13], [j21, j22, j23], [-1.0, -1.0, -1.0]])
+    return conf.array([[j11, j12, j13], [j21, j22, j23], [1.0, 1.0, 1.0]])
+
+def jacobian_dot(conf, qd, l3=L3, mirrored=False, out=None, base=None):
+    """
+    Time derivative of the jacobian at the joint velocities qd (3, (N, 3) for a batch), same conventions
+    as jacobian: J_dot qd is the end effector acceleration with zero joint accelerations
+    """
+    if base is not None:
+        mirrored = base.mirrored
+    qd = conf.columns(qd)
+    w1 = qd[0]
+    w12 = w1 + qd[1]
+    w123 = w12 + qd[2]
+    d13 = -l3*conf.c123*w123
+    d12 = d13 - L2*conf.c12*w12
+    d11 = d12 - (L1_X*conf.c1 - L1_Y*conf.s1)*w1
+    d23 = -l3*conf.s123*w123
+    d22 = d23 - L2*conf.s12*w12
+    d21 = d22 - (L1_X*conf.s1 + L1_Y*conf.c1)*w1
+    if mirrored:
+        d11 = -d11
+        d12 = -d12
+        d13 = -d13
+    if out is not None:
+        out[0, 0] = d11
+        out[0, 1] = d12
+        out[0, 2] = d13
+        out[1, 0] = d21
+        out[1, 1] = d22
+        out[1, 2] = d23
+        out[2, 0] = 0.0
+        out[2, 1] = 0.0
+        out[2, 2] = 0.0
+        return out
+    return conf.array([[d11, d12, d13], [d21, d22, d23], [0.0, 0.0, 0.0]])
+
+def grasp_jacobian(p, out=None):
+    """
+    Object-EE jacobian J_o = [[1, 0, p_y], [0, 1, -p_x], [0, 0, 1]] of the vector p (x, y) from the
+    end effector to the object. out: preallocated 3x3 array, only its 3rd column is written.
+    """
+    if out is None:
+        out = np.identity(3)
+    out[0, 2] = p[1]
+    out[1, 2] = -p[0]
+    return out
+
+def grasp_jacobian_dot(p_dot, out=None):
+    """
+    Time derivative of J_o at the velocity p_dot (x, y) of the end effector to object vector:
+    [[0, 0, p_dot_y], [0, 0, -p_dot_x], [0, 0, 0]]. out: preallocated 3x3 array, only its 3rd column is written.
+    """
+    if out is None:
+        out = np.zeros((3, 3))
+    out[0, 2] = p_dot[1]
+    out[1, 2] = -p_dot[0]
+    return out
+
+#The first link as a single segment: length and angle of (L1_X, L1_Y). With q2 = Q2_STRETCHED the
+#2nd and 3rd links are aligned, the wrist is at the border of the workspace (jacobian singular)
+L1_LENGTH = np.hypot(L1_X, L1_Y)
+Q2_STRETCHED = np.arctan2(L1_Y, L1_X)
+#Branches of ik: elbow above (q2 < Q2_STRETCHED, the working pose of the drivers) or below the wrist
+ELBOW_UP = 0
+ELBOW_DOWN = 1
+
+def ik(poses, l3=L3, base=None, elbow=None, lower=None, upper=None):
+    """
+    Closed form inverse of fk for end effector poses [x, y, theta] ((N, 3), or a single pose), in the
+    robot base frame or in the task frame with base. Returns the joint angles q and the mask valid:
+    q (2, N, 3) and valid (2, N) for both branches, indexed by ELBOW_UP and ELBOW_DOWN, or the elbow
+    branch only, (N, 3) and (N,). A pose is valid if reachable and, when given, within the joint
+    limits [lower, upper]. q1 and q3 are wrapped in [-pi, pi), q2 is in [Q2_STRETCHED - pi, Q2_STRETCHED + pi].
+    """
+    poses = np.asarray(poses, dtype=np.float64)
+    p = np.atleast_2d(poses)
+    x = p[:, 0]
+    theta = p[:, 2]
+    if base is not None and base.mirrored:
+        x = base.x_off - x
+        theta = -theta
+    #Wrist (4th joint), then the 2 links chain L1_LENGTH, L2 on it: beta is the angle of link 2 from link 1
+    wx = x - l3*np.cos(theta)
+    wy = p[:, 1] - l3*np.sin(theta)
+    c = (wx*wx + wy*wy - L1_LENGTH**2 - L2**2) / (2*L1_LENGTH*L2)
+    reachable = np.abs(c) <= 1.0
+    beta = np.arccos(np.clip(c, -1.0, 1.0))
+    beta = np.array([-beta, beta])
+    q1 = np.arctan2(wy, wx) - np.arctan2(L2*np.sin(beta), L1_LENGTH + L2*np.cos(beta)) - Q2_STRETCHED
+    q2 = beta + Q2_STRETCHED
+    q3 = theta - q1 - q2
+    q = np.stack([(q1 + np.pi) % (2*np.pi) - np.pi, q2, (q3 + np.pi) % (2*np.pi) - np.pi], axis=-1)
+    valid = np.array([reachable, reachable])
+    if lower is not None:
+        valid &= np.all(q >= lower, axis=-1)
+    if upper is not None:
+        valid &= np.all(q <= upper, axis=-1)
+    if elbow is not None:
+        q = q[elbow]
+        valid = valid[elbow]
+    if poses.ndim == 1:
+        return q[..., 0, :], valid[..., 0]
+    return q, valid
+
+
+if __name__ == '__main__':
+    #Consistency with the inline expressions of the controllers (copied verbatim): end effector pose,
+    #jacobians with L3 (PPC) and L3_DYN (cooperative controllers), robot 2 in the task frame, and
+    #jacobian_dot against the commented J_dot1 of the simulated cooperative controller and finite differences
+    rng = np.random.RandomState(0)
+    x_off = 0.603
+    base2 = ArmBase(mirrored=True, x_off=x_off)
+    def inline(r1_poses, r1_array_poses, r1_array_vels, r2_array_poses):
+        #The pose and the L3_DYN jacobian of the cooperative controller index the poses as a flat array
+        r1_x_e = np.array([[L1_X*cos(r1_poses[1]) - L1_Y*sin(r1_poses[1]) + L2*cos(r1_poses[1]+r1_poses[2]) + L3*cos(r1_poses[1]+r1_poses[2]+r1_poses[3])],\
+                           [L1_X*sin(r1_poses[1]) + L1_Y*cos(r1_poses[1]) + L2*sin(r1_poses[1]+r1_poses[2]) + L3*sin(r1_poses[1]+r1_poses[2]+r1_poses[3])],\
+                           [r1_poses[1] + r1_poses[2] + r1_poses[3]]])
+        r1_J_e = np.matrix([[ 0.047766999999999996961985715415722*cos(r1_poses[1]) - 0.14203*sin(r1_poses[1] + r1_poses[2]) - 0.16036*sin(r1_poses[1] + r1_poses[2] + r1_poses[3]) - 0.14192399999999999460342792190204*sin(r1_poses[1]),\
+                            - 0.16036*sin(r1_poses[1] + r1_poses[2] + r1_poses[3]) - 0.14203*sin(r1_poses[1] + r1_poses[2]), -0.16036*sin(r1_poses[1] + r1_poses[2] + r1_poses[3])],\
+                            [ 0.16036*cos(r1_poses[1] + r1_poses[2] + r1_poses[3]) + 0.14203*cos(r1_poses[1] + r1_poses[2]) + 0.14192399999999999460342792190204*cos(r1_poses[1]) + 0.047766999999999996961985715415722*sin(r1_poses[1]),\
+                            0.16036*cos(r1_poses[1] + r1_poses[2] + r1_poses[3]) + 0.14203*cos(r1_poses[1] + r1_poses[2]),  0.16036*cos(r1_poses[1] + r1_poses[2] + r1_poses[3])],\
+                            [1.0,1.0,1.0]])
+        r1_J_e_ppc = np.matrix([[ 0.047767*cos(r1_array_poses[1,0]) - 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.15036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.141924*sin(r1_array_poses[1,0]),\
+                                - 0.15036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0]), -0.15036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])],\
+                                [ 0.15036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.141924*cos(r1_array_poses[1,0]) + 0.047767*sin(r1_array_poses[1,0]),\
+                                0.15036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0]),  0.15036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])],\
+                                [1.0,1.0,1.0]])
+        r2_J_e = np.matrix([[ 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.047766999999999996961985715415722*cos(r2_array_poses[1,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[1,0]), 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]), 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])],\
+                            [ 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.14192399999999999460342792190204*cos(r2_array_poses[1,0]) + 0.047766999999999996961985715415722*sin(r2_array_poses[1,0]), 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]), 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])],\
+                            [-1.0,-1.0,-1.0]])
+        J_dot1 = np.matrix([[r1_array_vels[2,0]*(0.16036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0])) + r1_array_vels[1,0]*(0.16036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.14192399999999999460342792190204*cos(r1_array_poses[1,0]) + 0.047766999999999996961985715415722*sin(r1_array_poses[1,0])) + 0.16036*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]),r1_array_vels[1,0]*(0.16036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0])) + r1_array_vels[2,0]*(0.16036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0])) + 0.16036*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]),  0.16036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])*(r1_array_vels[1,0] + r1_array_vels[2,0] + r1_array_vels[3,0])],\
+                            [ - 1.0*r1_array_vels[2,0]*(0.16036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0])) - 1.0*r1_array_vels[1,0]*(0.16036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.047766999999999996961985715415722*cos(r1_array_poses[1,0]) + 0.14192399999999999460342792190204*sin(r1_array_poses[1,0])) - 0.16036*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]), - 1.0*r1_array_vels[1,0]*(0.16036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0])) - 1.0*r1_array_vels[2,0]*(0.16036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0])) - 0.16036*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]), -0.16036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])*(r1_array_vels[1,0] + r1_array_vels[2,0] + r1_array_vels[3,0])],\
+                            [0,0,0]])
+        return r1_x_e, r1_J_e, r1_J_e_ppc, r2_J_e, J_dot1
+    errors = dict((name, 0.0) for name in ('fk', 'jacobian L3_DYN', 'jacobian L3', 'jacobian mirrored', 'fk mirrored base',
+                                           'jacobian_dot (x row negated)', 'jacobian_dot finite differences'))
+    for i in range(200):
+        poses = np.vstack([[0.0], rng.uniform(-3.0, 3.0, (3, 1))])
+        vels = np.vstack([[0.0], rng.uniform(-2.0, 2.0, (3, 1))])
+        x_e, J_e, J_e_ppc, J_e2, J_dot1 = inline(poses[:, 0], poses, vels, poses)
+        conf = ArmConfiguration(poses[1:4, 0])
+        qd = vels[1:4, 0]
+        errors['fk'] = max(errors['fk'], np.max(np.abs(fk(conf) - x_e)))
+        errors['jacobian L3_DYN'] = max(errors['jacobian L3_DYN'], np.max(np.abs(jacobian(conf, L3_DYN) - J_e)))
+        errors['jacobian L3'] = max(errors['jacobian L3'], np.max(np.abs(jacobian(conf) - J_e_ppc)))
+        errors['jacobian mirrored'] = max(errors['jacobian mirrored'], np.max(np.abs(jacobian(conf, L3_DYN, base=base2) - J_e2)))
+        x_e2 = np.array([[x_off - x_e[0, 0]], [x_e[1, 0]], [-x_e[2, 0]]])
+        errors['fk mirrored base'] = max(errors['fk mirrored base'], np.max(np.abs(fk(conf, base=base2) - x_e2)))
+        #The commented J_dot1 has the x row with the opposite sign: it is the derivative of the mirrored jacobian
+        J_dot = jacobian_dot(conf, qd, L3_DYN)
+        errors['jacobian_dot (x row negated)'] = max(errors['jacobian_dot (x row negated)'],
+                                                     np.max(np.abs(J_dot*np.array([[-1.0], [1.0], [1.0]]) - J_dot1)))
+        dt = 1e-6
+        difference = (jacobian(ArmConfiguration(poses[1:4, 0] + dt*qd), L3_DYN) - jacobian(ArmConfiguration(poses[1:4, 0] - dt*qd), L3_DYN)) / (2*dt)
+        errors['jacobian_dot finite differences'] = max(errors['jacobian_dot finite differences'], np.max(np.abs(J_dot - difference)))
+    #Batches against single configurations
+    q = rng.uniform(-3.0, 3.0, (50, 3))
+    qd = rng.uniform(-2.0, 2.0, (50, 3))
+    batch = jacobian_dot(ArmConfiguration(q), qd, mirrored=True)
+    single = np.array([jacobian_dot(ArmConfiguration(q[i]), qd[i], mirrored=True) for i in range(50)])
+    errors['batch'] = np.max(np.abs(batch - single))
+    #Grasp jacobian derivative against finite differences of J_o along p_dot: zero diagonal
+    errors['grasp_jacobian_dot finite differences'] = 0.0
+    for i in range(200):
+        p = rng.uniform(-0.1, 0.1, 2)
+        p_dot = rng.uniform(-0.5, 0.5, 2)
+        dt = 1e-6
+        difference = (grasp_jacobian(p + dt*p_dot) - grasp_jacobian(p - dt*p_dot)) / (2*dt)
+        errors['grasp_jacobian_dot finite differences'] = max(errors['grasp_jacobian_dot finite differences'],
+                                                              np.max(np.abs(grasp_jacobian_dot(p_dot) - difference)))
+    for name in sorted(errors):
+        print("%-38s max difference %.2e" % (name, errors[name]))
+        assert errors[name] < 1e-6, name
+    #ik: round trip through fk on both branches, the branch of the working pose, and a check of the targets
+    #of windowx_coop_circle.py (100s at 150Hz) for both arms against the driver shutdown threshold of joint 2
+    import timeit
+    q = rng.uniform(-3.0, 3.0, (10000, 3))
+    x = fk(ArmConfiguration(q), base=base2)
+    q_ik, valid = ik(x, base=base2)
+    assert np.all(valid)
+    for branch in (ELBOW_UP, ELBOW_DOWN):
+        difference = fk(ArmConfiguration(q_ik[branch]), base=base2) - x
+        difference[:, 2] = (difference[:, 2] + np.pi) % (2*np.pi) - np.pi
+        print("ik branch %d round trip          max difference %.2e" % (branch, np.max(np.abs(difference))))
+        assert np.max(np.abs(difference)) < 1e-9
+    q0 = np.array([2.09, -2.29, 0.19])
+    q0_ik, valid = ik(fk(ArmConfiguration(q0))[:, 0], elbow=ELBOW_UP)
+    assert valid and np.allclose(q0_ik, q0)
+    t = np.arange(0.0, 100.0, 1.0/150)
+    omega = 2*np.pi/100
+    target = np.column_stack([0.301 + 0.05*np.sin(omega*t), 0.16 - 0.05*np.cos(omega*t), -np.pi/30*np.sin(2*omega*t)])
+    #End effector poses of the object pose, p1o_in_e1 = p2o_in_e2 = [-0.04, 0, 0] (windowx_cooperative_workspace)
+    ct = np.cos(target[:, 2])
+    st = np.sin(target[:, 2])
+    x1 = target + np.column_stack([-0.04*ct, -0.04*st, 0*t])
+    x2 = target + np.column_stack([0.04*ct, 0.04*st, 0*t])
+    upper = (np.inf, -0.45, np.inf)
+    for name, poses, base in (('robot 1', x1, None), ('robot 2', x2, base2)):
+        start = timeit.default_timer()
+        q_ik, valid = ik(poses, base=base, elbow=ELBOW_UP, upper=upper)
+        elapsed = timeit.default_timer() - start
+        print("%s circle: %d targets, %d valid, q2 in [%.3f, %.3f] rad, %.2f ms" %
+              (name, len(poses), np.sum(valid), np.min(q_ik[:, 1]), np.max(q_ik[:, 1]), elapsed*1e3))
@@ -12,6 +12,8 @@ from std_msgs.msg import Float32MultiArray, MultiArrayDimension
 import numpy as np
 from numpy.linalg import inv
 from windowx_arm import *
+from windowx_dynamics import mass_matrix, coriolis, gravity
+from windowx_common.log import ring_logger
 
 class WindowxController():
     """Class to compute and pubblish joints torques"""
@@ -74,6 +76,11 @@ class WindowxController():
         self.vel_call2 = False
         self.obj_pose_call = False
         self.obj_vel_call = False
+        #Loop records, formatted and printed by a background thread
+        self.log = ring_logger()
+        self.LOG_POSES = self.log.channel('poses', ['r1_x', 'r1_y', 'r1_theta', 'r2_x', 'r2_y', 'r2_theta', 'obj_x', 'obj_y', 'obj_theta'])
+        self.LOG_VELOCITIES = self.log.channel('velocities', ['r1_vx', 'r1_vy', 'r1_w', 'r2_vx', 'r2_vy', 'r2_w', 'obj_vx', 'obj_vy', 'obj_w'])
+        self.LOG_TORQUES = self.log.channel('torques', ['r1_q2', 'r1_q3', 'r1_q4', 'r2_q2', 'r2_q3', 'r2_q4'])
         print("\nWindowX controller node created")
         print("\nWaiting for target position, velocity and acceleration...")
 
@@ -159,27 +166,20 @@ class WindowxController():
             r1_array_poses = np.asarray(self.r1_joints_poses)[np.newaxis].T
             r2_array_vels = np.asarray(self.r2_joints_vels)[np.newaxis].T
             r2_array_poses = np.asarray(self.r2_joints_poses)[np.newaxis].T
+            #Configuration contexts: sines and cosines shared by kinematics and dynamics
+            r1_conf = ArmConfiguration(r1_array_poses[1:4,0])
+            r2_conf = ArmConfiguration(r2_array_poses[1:4,0])
             obj_array_vel = np.asarray(self.obj_vel)[np.newaxis].T
             obj_array_pose = np.asarray(self.obj_pose)[np.newaxis].T
 
             # Compute ee position from joints_poses
-            r1_x_e = np.array([[L1_X*cos(r1_array_poses[1]) - L1_Y*sin(r1_array_poses[1]) + L2*cos(r1_array_poses[1]+r1_array_poses[2]) + L3*cos(r1_array_poses[1]+r1_array_poses[2]+r1_array_poses[3])],\
-                            [L1_X*sin(r1_array_poses[1]) + L1_Y*cos(r1_array_poses[1]) + L2*sin(r1_array_poses[1]+r1_array_poses[2]) + L3*sin(r1_array_poses[1]+r1_array_poses[2]+r1_array_poses[3])],\
-                            [r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]]])
+            r1_x_e = fk(r1_conf)
             # Compute ee velocities from joints_vels
-            r1_J_e = np.matrix([[ 0.047766999999999996961985715415722*cos(r1_array_poses[1]) - 0.14203*sin(r1_array_poses[1] + r1_array_poses[2]) - 0.16036*sin(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) - 0.14192399999999999460342792190204*sin(r1_array_poses[1]),\
-                             - 0.16036*sin(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) - 0.14203*sin(r1_array_poses[1] + r1_array_poses[2]), -0.16036*sin(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3])],\
-                            [ 0.16036*cos(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) + 0.14203*cos(r1_array_poses[1] + r1_array_poses[2]) + 0.14192399999999999460342792190204*cos(r1_array_poses[1]) + 0.047766999999999996961985715415722*sin(r1_array_poses[1]),\
-                              0.16036*cos(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) + 0.14203*cos(r1_array_poses[1] + r1_array_poses[2]),  0.16036*cos(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3])],\
-                            [1.0,1.0,1.0]])
+            r1_J_e = jacobian(r1_conf, L3_DYN)
             r1_v_e = np.dot(r1_J_e, r1_array_vels[1:4])
-            r2_x_e = np.array([[L1_X*cos(r2_array_poses[1]) - L1_Y*sin(r2_array_poses[1]) + L2*cos(r2_array_poses[1]+r2_array_poses[2]) + L3*cos(r2_array_poses[1]+r2_array_poses[2]+r2_array_poses[3])],\
-                            [L1_X*sin(r2_array_poses[1]) + L1_Y*cos(r2_array_poses[1]) + L2*sin(r2_array_poses[1]+r2_array_poses[2]) + L3*sin(r2_array_poses[1]+r2_array_poses[2]+r2_array_poses[3])],\
-                            [r2_array_poses[1] + r2_array_poses[2] + r2_array_poses[3]]])
+            r2_x_e = fk(r2_conf, base=ArmBase(mirrored=True, x_off=0.77))
             # Compute ee velocities from joints_vels
-            r2_J_e = np.matrix([[ 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.047766999999999996961985715415722*cos(r2_array_poses[1,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[1,0]), 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]), 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])],\
-                                [ 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.14192399999999999460342792190204*cos(r2_array_poses[1,0]) + 0.047766999999999996961985715415722*sin(r2_array_poses[1,0]), 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]), 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])],\
-                                [-1.0,-1.0,-1.0]])
+            r2_J_e = jacobian(r2_conf, L3_DYN, mirrored=True)
             #J_dot
             # J_dot1 = np.matrix([[r1_array_vels[2,0]*(0.16036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0])) + r1_array_vels[1,0]*(0.16036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.14192399999999999460342792190204*cos(r1_array_poses[1,0]) + 0.047766999999999996961985715415722*sin(r1_array_poses[1,0])) + 0.16036*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]),r1_array_vels[1,0]*(0.16036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0])) + r1_array_vels[2,0]*(0.16036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*cos(r1_array_poses[1,0] + r1_array_poses[2,0])) + 0.16036*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]),  0.16036*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])*(r1_array_vels[1,0] + r1_array_vels[2,0] + r1_array_vels[3,0])],\
             #                     [ - 1.0*r1_array_vels[2,0]*(0.16036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0])) - 1.0*r1_array_vels[1,0]*(0.16036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.047766999999999996961985715415722*cos(r1_array_poses[1,0]) + 0.14192399999999999460342792190204*sin(r1_array_poses[1,0])) - 0.16036*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]), - 1.0*r1_array_vels[1,0]*(0.16036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0])) - 1.0*r1_array_vels[2,0]*(0.16036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.14203*sin(r1_array_poses[1,0] + r1_array_poses[2,0])) - 0.16036*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]), -0.16036*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])*(r1_array_vels[1,0] + r1_array_vels[2,0] + r1_array_vels[3,0])],\
@@ -191,58 +191,18 @@ class WindowxController():
             # J_dot2 = np.dot(np.matrix([[-1,0,0],[0,1,0],[0,0,1]]), J_dot2)
 
             r2_v_e = np.dot(r2_J_e, r2_array_vels[1:4])
-            r2_x_e = np.array([[0.77 - r2_x_e[0,0]],[r2_x_e[1,0]],[-r2_x_e[2,0]]])
-
-            print("\nee 1 pos:")
-            print(r1_x_e)
-            print("ee 2 pos:")
-            print(r2_x_e)
-            print("obj pos:")
-            print(obj_array_pose)
-            print("ee 1 vel:")
-            print(r1_v_e)
-            print("ee 2 vel:")
-            print(r2_v_e)
-            print("obj vel:")
-            print(obj_array_vel)
+
+            self.log.push(self.LOG_POSES, r1_x_e, r2_x_e, obj_array_pose)
+            self.log.push(self.LOG_VELOCITIES, r1_v_e, r2_v_e, obj_array_vel)
 
             #Robot 1 and 2 dynamics
-            M1 =np.matrix([[(49.572386364462757849962123474612*(0.0001361769666249375655142419592553*cos(2.0*r1_array_poses[1,0]) - 0.0000010395654923422999338829146587226*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.0000030887284722755998825530154849872*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.00010430570934130451406174333622838*cos(2.0*r1_array_poses[2,0]) + 0.00010337561876074369688845282770292*sin(2.0*r1_array_poses[1,0]) + 0.000079181285283975840220601603442762*sin(2.0*r1_array_poses[2,0]) - 0.0000030887284722755998825530154849872*cos(r1_array_poses[2,0]) + 0.00040313592533045451009466604148129*cos(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) + 0.0000010395654923422999338829146587226*sin(r1_array_poses[2,0]) + 0.00070506131454818413163718096909733))/(0.013558567415999998622109604440311*sin(2.0*r1_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r1_array_poses[2,0]) + 0.022424108064999998177960152112576),(49.572386364462757849962123474612*(0.0000010395654923422999338829146587226*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.0000030887284722755998825530154849872*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.00010337561876074369688845282770292*cos(2.0*r1_array_poses[1,0]) + 0.0001361769666249375655142419592553*sin(2.0*r1_array_poses[1,0]) + 0.00040313592533045451009466604148129*sin(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0])))/(0.013558567415999998622109604440311*sin(2.0*r1_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r1_array_poses[2,0]) + 0.022424108064999998177960152112576), -(24.786193182231378924981061737306*(0.00012929375397198337047756129282388*sin(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.0000088378184731947519431226043473656*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000033154628448945718466064590900881*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.00021336040564880879742640358132956*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000011642080847389553545544785987331*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000043674676735949976011727681172359*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.00000016670472235201121739746419467276*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.00000024953154947055056846529683193203*sin(r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.00000049530849781411519716620156317255*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.00000016670472235201121739746419467276*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.00000015087736493725280842073467806088*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) + 0.00000033340944470402243479492838934553*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.00000049530849781411519716620156317255*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000019875113818734438265101740694115*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.0000009906169956282303943324031263451*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.0000088378184731947519431226043473656*cos(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000011642080847389553545544785987331*sin(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0])))/(0.013558567415999998622109604440311*sin(2.0*r1_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r1_array_poses[2,0]) + 0.022424108064999998177960152112576)],\
-                          [(49.572386364462757849962123474612*(0.0000010395654923422999338829146587226*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.0000030887284722755998825530154849872*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.00010337561876074369688845282770292*cos(2.0*r1_array_poses[1,0]) + 0.0001361769666249375655142419592553*sin(2.0*r1_array_poses[1,0]) + 0.00040313592533045451009466604148129*sin(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0])))/(0.013558567415999998622109604440311*sin(2.0*r1_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r1_array_poses[2,0]) + 0.022424108064999998177960152112576),(49.572386364462757849962123474612*(0.0000030887284722755998825530154849872*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.0000010395654923422999338829146587226*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.0001361769666249375655142419592553*cos(2.0*r1_array_poses[1,0]) - 0.00010430570934130451406174333622838*cos(2.0*r1_array_poses[2,0]) - 0.00010337561876074369688845282770292*sin(2.0*r1_array_poses[1,0]) + 0.000079181285283975840220601603442762*sin(2.0*r1_array_poses[2,0]) - 0.0000030887284722755998825530154849872*cos(r1_array_poses[2,0]) - 0.00040313592533045451009466604148129*cos(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) + 0.0000010395654923422999338829146587226*sin(r1_array_poses[2,0]) + 0.00070506131454818413163718096909733))/(0.013558567415999998622109604440311*sin(2.0*r1_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r1_array_poses[2,0]) + 0.022424108064999998177960152112576),  (24.786193182231378924981061737306*(0.00012929375397198337047756129282388*cos(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.00021336040564880879742640358132956*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000011642080847389553545544785987331*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000043674676735949976011727681172359*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000088378184731947519431226043473656*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000033154628448945718466064590900881*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.00000024953154947055056846529683193203*cos(r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.00000049530849781411519716620156317255*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.00000016670472235201121739746419467276*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.00000049530849781411519716620156317255*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000019875113818734438265101740694115*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.0000009906169956282303943324031263451*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.00000016670472235201121739746419467276*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000015087736493725280842073467806088*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.00000033340944470402243479492838934553*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.000011642080847389553545544785987331*cos(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000088378184731947519431226043473656*sin(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0])))/(0.013558567415999998622109604440311*sin(2.0*r1_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r1_array_poses[2,0]) + 0.022424108064999998177960152112576)],\
-                          [ -(24.786193182231378924981061737306*(0.00012929375397198337047756129282388*sin(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.0000088378184731947519431226043473656*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000033154628448945718466064590900881*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.00021336040564880879742640358132956*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000011642080847389553545544785987331*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000043674676735949976011727681172359*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.00000016670472235201121739746419467276*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.00000024953154947055056846529683193203*sin(r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.00000049530849781411519716620156317255*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.00000016670472235201121739746419467276*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.00000015087736493725280842073467806088*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) + 0.00000033340944470402243479492838934553*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.00000049530849781411519716620156317255*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000019875113818734438265101740694115*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.0000009906169956282303943324031263451*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.0000088378184731947519431226043473656*cos(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000011642080847389553545544785987331*sin(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0])))/(0.013558567415999998622109604440311*sin(2.0*r1_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r1_array_poses[2,0]) + 0.022424108064999998177960152112576), (24.786193182231378924981061737306*(0.00012929375397198337047756129282388*cos(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.00021336040564880879742640358132956*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000011642080847389553545544785987331*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000043674676735949976011727681172359*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000088378184731947519431226043473656*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000033154628448945718466064590900881*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.00000024953154947055056846529683193203*cos(r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.00000049530849781411519716620156317255*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.00000016670472235201121739746419467276*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.00000049530849781411519716620156317255*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000019875113818734438265101740694115*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.0000009906169956282303943324031263451*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.00000016670472235201121739746419467276*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000015087736493725280842073467806088*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.00000033340944470402243479492838934553*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.000011642080847389553545544785987331*cos(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000088378184731947519431226043473656*sin(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0])))/(0.013558567415999998622109604440311*sin(2.0*r1_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r1_array_poses[2,0]) + 0.022424108064999998177960152112576),-(49.572386364462757849962123474612*(0.000000026732769276368518821857358257724*sin(r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) - 0.000000031871732519722545201917151377082*cos(2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000007942767070947151301757208267035*cos(r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) + 0.000000024194694241337860358349012973843*sin(2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000020028861984271396211740451538764*cos(2.0*r1_array_poses[2,0]) + 0.000010366773193473626644890864458619*cos(2.0*r1_array_poses[3,0]) - 0.0000015204450884856399668441155638056*sin(2.0*r1_array_poses[2,0]) + 0.00000007942767070947151301757208267035*cos(r1_array_poses[2,0]) + 0.00000004001487927309748915909499996862*cos(r1_array_poses[3,0]) + 0.0000035018355806884690766203254763997*cos(2.0*r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) - 0.000000026732769276368518821857358257724*sin(r1_array_poses[2,0]) - 0.0000026583381090364677066090588984327*sin(2.0*r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) - 0.000017277937413586096424197894997158))/(0.013558567415999998622109604440311*sin(2.0*r1_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r1_array_poses[2,0]) + 0.022424108064999998177960152112576)]])
-
-            C1 = np.matrix([[-(12.393096591115689462490530868653*(0.000032949940073977341546754725149535*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.00000073203243685793528826971806258359*r1_array_vels[2,0] + 0.00013869404912582092959861518971449*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.000011089877593033423757847637491665*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.000046679903642746034319030001569579*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.000014388836629933194457940340309125*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) + 0.000014388836629933194457940340309125*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) + 0.000021176246481773180157534027188411*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) + 0.000021176246481773180157534027188411*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.00000038870777482652758327933797037624*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0]) - 0.00000058306166223979137491900695556436*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0]) - 0.00000019435388741326379163966898518812*r1_array_vels[2,0]*cos(2.0*r1_array_poses[2,0]) - 0.00000029507858587037714041261734139187*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0]) - 0.00000044261787880556571061892601208781*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0]) + 0.00000014753929293518857020630867069594*r1_array_vels[2,0]*sin(2.0*r1_array_poses[2,0]) + 0.00016295877211844301176698376951963*r1_array_vels[2,0]*cos(r1_array_poses[2,0]) + 0.00000048802162457195685884647870838906*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) - 0.00000024401081228597842942323935419453*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) - 0.000054846619794972429920141577098329*r1_array_vels[2,0]*sin(r1_array_poses[2,0]) - 0.000057214663066599423715123304954675*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] + 3.0*r1_array_poses[2,0]) + 0.000019256593745259819358959213020415*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] + 3.0*r1_array_poses[2,0])))/(0.0028864291829225755969117457465885*cos(r1_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r1_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r1_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r1_array_poses[2,0])**2*sin(r1_array_poses[2,0])),(12.393096591115689462490530868653*(0.000011089877593033423757847637491665*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.000046679903642746034319030001569579*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.000032949940073977341546754725149535*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.00013869404912582092959861518971449*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.000021176246481773180157534027188411*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) + 0.000021176246481773180157534027188411*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.000014388836629933194457940340309125*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.000014388836629933194457940340309125*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.00000029507858587037714041261734139187*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0]) - 0.00000029507858587037714041261734139187*r1_array_vels[1,0]*cos(2.0*r1_array_poses[2,0]) - 0.00000044261787880556571061892601208781*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0]) - 0.00000014753929293518857020630867069594*r1_array_vels[2,0]*cos(2.0*r1_array_poses[2,0]) + 0.00000038870777482652758327933797037624*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0]) - 0.00000038870777482652758327933797037624*r1_array_vels[1,0]*sin(2.0*r1_array_poses[2,0]) + 0.00000058306166223979137491900695556436*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0]) - 0.00000019435388741326379163966898518812*r1_array_vels[2,0]*sin(2.0*r1_array_poses[2,0]) + 0.000054846619794972429920141577098329*r1_array_vels[1,0]*cos(r1_array_poses[2,0]) + 0.00003851318749051963871791842604083*r1_array_vels[2,0]*cos(r1_array_poses[2,0]) + 0.00016295877211844301176698376951963*r1_array_vels[1,0]*sin(r1_array_poses[2,0]) + 0.00011442932613319884743024660990935*r1_array_vels[2,0]*sin(r1_array_poses[2,0]) - 0.00000048802162457195685884647870838906*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) + 0.00000024401081228597842942323935419453*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) + 0.000019256593745259819358959213020415*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] + 3.0*r1_array_poses[2,0]) + 0.000057214663066599423715123304954675*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] + 3.0*r1_array_poses[2,0])))/(0.0028864291829225755969117457465885*cos(r1_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r1_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r1_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r1_array_poses[2,0])**2*sin(r1_array_poses[2,0])), -(6.1965482955578447312452654343266*(0.0000018104058248269486959230379712567*r1_array_vels[1,0]*cos(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000047318802030173678236567316865601*r1_array_vels[2,0]*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r1_array_vels[3,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000000094637604060347356473134633731202*r1_array_vels[3,0]*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r1_array_vels[3,0]*cos(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r1_array_vels[1,0]*sin(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.00000023477744314907700565386397703181*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r1_array_vels[2,0]*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.00000015651829543271800376924265135454*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r1_array_vels[3,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.00000012466635754236392650934927385907*r1_array_vels[3,0]*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r1_array_vels[3,0]*sin(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000020945738194573054747217346601561*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000013509006974121133933904142467225*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000010889777769779084336715637963644*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000062233402715820258713648653506498*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000040137590926689301431357553545922*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000032355408968495547238318382630818*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.0000020945738194573054747217346601561*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000040814009265224237900836641397514*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000010889777769779084336715637963644*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000011414433154663828459182407807069*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.0000035567455416376796676168942963269*r1_array_vels[3,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.0000062233402715820258713648653506498*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000012301346071758212453528510987523*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000012126546467137741302549481014413*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000012301346071758212453528510987523*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000032355408968495547238318382630818*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000012301346071758212453528510987523*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000033914250655107275559992688195273*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.000010567704780526012980875175449959*r1_array_vels[3,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.0000061759747459797292648053987999074*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.0000061759747459797292648053987999074*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.0000067916457716342943401243131998673*r1_array_vels[3,0]*cos(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000018349886738719767173914346365063*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.000018349886738719767173914346365063*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.0000046147876839521741265506259439426*r1_array_vels[3,0]*sin(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000000062333178771181963254674636929534*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000023477744314907700565386397703181*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])))/(0.0028864291829225755969117457465885*cos(r1_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r1_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r1_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r1_array_poses[2,0])**2*sin(r1_array_poses[2,0]))],\
-                           [(12.393096591115689462490530868653*(0.000011089877593033423757847637491665*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.000046679903642746034319030001569579*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.000032949940073977341546754725149535*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.00013869404912582092959861518971449*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.000021176246481773180157534027188411*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) + 0.000021176246481773180157534027188411*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.000014388836629933194457940340309125*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.000014388836629933194457940340309125*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.00000029507858587037714041261734139187*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0]) + 0.00000029507858587037714041261734139187*r1_array_vels[1,0]*cos(2.0*r1_array_poses[2,0]) - 0.00000044261787880556571061892601208781*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0]) + 0.00000014753929293518857020630867069594*r1_array_vels[2,0]*cos(2.0*r1_array_poses[2,0]) + 0.00000038870777482652758327933797037624*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0]) + 0.00000038870777482652758327933797037624*r1_array_vels[1,0]*sin(2.0*r1_array_poses[2,0]) + 0.00000058306166223979137491900695556436*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0]) + 0.00000019435388741326379163966898518812*r1_array_vels[2,0]*sin(2.0*r1_array_poses[2,0]) - 0.000054846619794972429920141577098329*r1_array_vels[1,0]*cos(r1_array_poses[2,0]) - 0.00003851318749051963871791842604083*r1_array_vels[2,0]*cos(r1_array_poses[2,0]) - 0.00016295877211844301176698376951963*r1_array_vels[1,0]*sin(r1_array_poses[2,0]) - 0.00011442932613319884743024660990935*r1_array_vels[2,0]*sin(r1_array_poses[2,0]) - 0.00000048802162457195685884647870838906*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) + 0.00000024401081228597842942323935419453*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) + 0.000019256593745259819358959213020415*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] + 3.0*r1_array_poses[2,0]) + 0.000057214663066599423715123304954675*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] + 3.0*r1_array_poses[2,0])))/(0.0028864291829225755969117457465885*cos(r1_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r1_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r1_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r1_array_poses[2,0])**2*sin(r1_array_poses[2,0])),(12.393096591115689462490530868653*(0.00000073203243685793528826971806258359*r1_array_vels[2,0] + 0.000032949940073977341546754725149535*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.00013869404912582092959861518971449*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.000011089877593033423757847637491665*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.000046679903642746034319030001569579*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.000014388836629933194457940340309125*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) + 0.000014388836629933194457940340309125*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) + 0.000021176246481773180157534027188411*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) + 0.000021176246481773180157534027188411*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0] - 1.0*r1_array_poses[2,0]) - 0.00000038870777482652758327933797037624*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0]) - 0.00000058306166223979137491900695556436*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0]) + 0.00000019435388741326379163966898518812*r1_array_vels[2,0]*cos(2.0*r1_array_poses[2,0]) - 0.00000029507858587037714041261734139187*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0]) - 0.00000044261787880556571061892601208781*r1_array_vels[2,0]*sin(2.0*r1_array_poses[1,0]) - 0.00000014753929293518857020630867069594*r1_array_vels[2,0]*sin(2.0*r1_array_poses[2,0]) - 0.00016295877211844301176698376951963*r1_array_vels[2,0]*cos(r1_array_poses[2,0]) + 0.00000048802162457195685884647870838906*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) - 0.00000024401081228597842942323935419453*r1_array_vels[2,0]*cos(2.0*r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) + 0.000054846619794972429920141577098329*r1_array_vels[2,0]*sin(r1_array_poses[2,0]) - 0.000057214663066599423715123304954675*r1_array_vels[1,0]*cos(2.0*r1_array_poses[1,0] + 3.0*r1_array_poses[2,0]) + 0.000019256593745259819358959213020415*r1_array_vels[1,0]*sin(2.0*r1_array_poses[1,0] + 3.0*r1_array_poses[2,0])))/(0.0028864291829225755969117457465885*cos(r1_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r1_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r1_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r1_array_poses[2,0])**2*sin(r1_array_poses[2,0])), -(6.1965482955578447312452654343266*(0.0000012301346071758212453528510987523*r1_array_vels[1,0]*cos(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000023477744314907700565386397703181*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) + 0.000000062333178771181963254674636929534*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r1_array_vels[2,0]*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000012301346071758212453528510987523*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000015651829543271800376924265135454*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) + 0.000000062333178771181963254674636929534*r1_array_vels[3,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.00000012466635754236392650934927385907*r1_array_vels[3,0]*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000012301346071758212453528510987523*r1_array_vels[3,0]*cos(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r1_array_vels[1,0]*sin(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r1_array_vels[2,0]*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r1_array_vels[3,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000094637604060347356473134633731202*r1_array_vels[3,0]*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r1_array_vels[3,0]*sin(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000062233402715820258713648653506498*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000040137590926689301431357553545922*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000032355408968495547238318382630818*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.0000020945738194573054747217346601561*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000013509006974121133933904142467225*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000010889777769779084336715637963644*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000062233402715820258713648653506498*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000012126546467137741302549481014413*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000032355408968495547238318382630818*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000033914250655107275559992688195273*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.000010567704780526012980875175449959*r1_array_vels[3,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.0000020945738194573054747217346601561*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000040814009265224237900836641397514*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000010889777769779084336715637963644*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + 4.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000011414433154663828459182407807069*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.0000035567455416376796676168942963269*r1_array_vels[3,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.000018349886738719767173914346365063*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) + 0.000018349886738719767173914346365063*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.0000046147876839521741265506259439426*r1_array_vels[3,0]*cos(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r1_array_vels[3,0]*cos(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000061759747459797292648053987999074*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.0000061759747459797292648053987999074*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) + 0.0000067916457716342943401243131998673*r1_array_vels[3,0]*sin(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r1_array_vels[3,0]*sin(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.00000023477744314907700565386397703181*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])))/(0.0028864291829225755969117457465885*cos(r1_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r1_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r1_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r1_array_poses[2,0])**2*sin(r1_array_poses[2,0]))],\
-                           [ -(12.393096591115689462490530868653*(0.0000000236594010150868391182836584328*r1_array_vels[1,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000047318802030173678236567316865601*r1_array_vels[1,0]*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000000236594010150868391182836584328*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000070978203045260517354850975298401*r1_array_vels[2,0]*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000000005959686761779894122900711012458*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) - 0.000000005959686761779894122900711012458*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) - 0.00000007825914771635900188462132567727*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.000000031166589385590981627337318464767*r1_array_vels[1,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r1_array_vels[1,0]*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000000039129573858179500942310662838635*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.000000031166589385590981627337318464767*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000093499768156772944882011955394301*r1_array_vels[2,0]*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000000017707257813529208766126897548914*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) - 0.000000017707257813529208766126897548914*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) - 0.000004397601975160889430996951651744*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.0000074855893481507540633996510516977*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000013066034348456760683476758640084*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000022240977717816644270433931822616*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000004397601975160889430996951651744*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000013096146021710247985942522517903*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000001545343237957477264518306259928*r1_array_vels[1,0]*cos(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0]) + 0.0000017783727708188398338084471481634*r1_array_vels[1,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.00000001545343237957477264518306259928*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0]) + 0.0000074855893481507540633996510516977*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.000013066034348456760683476758640084*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000038910909790968770965195854575523*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000000010500298722571454324661254081789*r1_array_vels[1,0]*sin(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0]) - 0.0000052838523902630064904375877249794*r1_array_vels[1,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.000000010500298722571454324661254081789*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0]) - 0.000022240977717816644270433931822616*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.000000011919373523559788245801422024916*r1_array_vels[1,0]*cos(r1_array_poses[1,0]) + 0.0000030879873729898646324026993999537*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) + 0.0000033958228858171471700621565999336*r1_array_vels[1,0]*cos(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000033958228858171471700621565999336*r1_array_vels[2,0]*cos(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000000236594010150868391182836584328*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000035414515627058417532253795097828*r1_array_vels[1,0]*sin(r1_array_poses[1,0]) + 0.0000091749433693598835869571731825317*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) + 0.0000023073938419760870632753129719713*r1_array_vels[1,0]*sin(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000023073938419760870632753129719713*r1_array_vels[2,0]*sin(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000000031166589385590981627337318464767*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000001173887215745385028269319885159*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])))/(0.0028864291829225755969117457465885*cos(r1_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r1_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r1_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r1_array_poses[2,0])**2*sin(r1_array_poses[2,0])), -(12.393096591115689462490530868653*(0.00000007825914771635900188462132567727*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) + 0.000000031166589385590981627337318464767*r1_array_vels[1,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r1_array_vels[1,0]*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000000039129573858179500942310662838635*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) + 0.000000031166589385590981627337318464767*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000093499768156772944882011955394301*r1_array_vels[2,0]*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000000017707257813529208766126897548914*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) + 0.000000017707257813529208766126897548914*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) + 0.0000000236594010150868391182836584328*r1_array_vels[1,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r1_array_vels[1,0]*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000000236594010150868391182836584328*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000000070978203045260517354850975298401*r1_array_vels[2,0]*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000000005959686761779894122900711012458*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) - 0.000000005959686761779894122900711012458*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0]) - 0.000013066034348456760683476758640084*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000022240977717816644270433931822616*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000004397601975160889430996951651744*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.0000074855893481507540633996510516977*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.000013066034348456760683476758640084*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000038910909790968770965195854575523*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000000010500298722571454324661254081789*r1_array_vels[1,0]*cos(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0]) + 0.0000052838523902630064904375877249794*r1_array_vels[1,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.000000010500298722571454324661254081789*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0]) + 0.000022240977717816644270433931822616*r1_array_vels[2,0]*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.000004397601975160889430996951651744*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000013096146021710247985942522517903*r1_array_vels[2,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.00000001545343237957477264518306259928*r1_array_vels[1,0]*sin(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0]) + 0.0000017783727708188398338084471481634*r1_array_vels[1,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) - 0.00000001545343237957477264518306259928*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 2.0*r1_array_poses[2,0]) + 0.0000074855893481507540633996510516977*r1_array_vels[2,0]*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.000000035414515627058417532253795097828*r1_array_vels[1,0]*cos(r1_array_poses[1,0]) - 0.0000091749433693598835869571731825317*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) + 0.0000023073938419760870632753129719713*r1_array_vels[1,0]*cos(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000023073938419760870632753129719713*r1_array_vels[2,0]*cos(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.000000031166589385590981627337318464767*r1_array_vels[1,0]*cos(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.000000011919373523559788245801422024916*r1_array_vels[1,0]*sin(r1_array_poses[1,0]) + 0.0000030879873729898646324026993999537*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.0000033958228858171471700621565999336*r1_array_vels[1,0]*sin(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.0000033958228858171471700621565999336*r1_array_vels[2,0]*sin(2.0*r1_array_poses[2,0] - 1.0*r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0000000236594010150868391182836584328*r1_array_vels[1,0]*sin(r1_array_poses[1,0] + 3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000001173887215745385028269319885159*r1_array_vels[2,0]*cos(r1_array_poses[1,0] + r1_array_poses[2,0] + r1_array_poses[3,0])))/(0.0028864291829225755969117457465885*cos(r1_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r1_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r1_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r1_array_poses[2,0])**2*sin(r1_array_poses[2,0])),-(12.393096591115689462490530868653*(0.00000084731856930257572080657156757769*r1_array_vels[3,0]*cos(r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) - 0.000002719244617526501354400213739497*r1_array_vels[2,0]*cos(r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) - 0.00000001882445539169299431332681367841*r1_array_vels[2,0] + 0.00000091520925034094576585724545797076*r1_array_vels[2,0]*sin(r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) - 0.00000028517985752850915574952258467949*r1_array_vels[3,0]*sin(r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) - 0.0000000016838279031515584155026787045557*r1_array_vels[3,0]*cos(3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000000049978742738733698137598123890101*r1_array_vels[2,0]*cos(2.0*r1_array_poses[2,0]) + 0.00000001882445539169299431332681367841*r1_array_vels[2,0]*cos(2.0*r1_array_poses[3,0]) + 0.000000012549636927795329542217875785607*r1_array_vels[3,0]*cos(2.0*r1_array_poses[3,0]) + 0.0000000024781124163886105413815559184205*r1_array_vels[3,0]*sin(3.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000000037940215467793255210079674662839*r1_array_vels[2,0]*sin(2.0*r1_array_poses[2,0]) + 0.0000000056790717259550878354722185818877*r1_array_vels[2,0]*cos(r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.0000000056790717259550878354722185818877*r1_array_vels[3,0]*cos(r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000000019113907382380476430967160359155*r1_array_vels[2,0]*sin(r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000000019113907382380476430967160359155*r1_array_vels[3,0]*sin(r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.0000000056790717259550878354722185818877*r1_array_vels[2,0]*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.0000014712939187105509320044522915508*r1_array_vels[2,0]*cos(r1_array_poses[2,0] - 2.0*r1_array_poses[3,0]) - 0.0000000028395358629775439177361092909438*r1_array_vels[3,0]*cos(r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) - 0.0000014712939187105509320044522915508*r1_array_vels[3,0]*cos(r1_array_poses[2,0] - 2.0*r1_array_poses[3,0]) + 0.0000000019113907382380476430967160359155*r1_array_vels[2,0]*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) + 0.00000049518965513265469245209687577658*r1_array_vels[2,0]*sin(r1_array_poses[2,0] - 2.0*r1_array_poses[3,0]) + 0.00000000095569536911902382154835801795777*r1_array_vels[3,0]*sin(r1_array_poses[2,0] - 1.0*r1_array_poses[3,0]) + 0.00000049518965513265469245209687577658*r1_array_vels[3,0]*sin(r1_array_poses[2,0] - 2.0*r1_array_poses[3,0]) + 0.0000041905385362370522864046660310477*r1_array_vels[2,0]*cos(r1_array_poses[2,0]) + 0.0000000049978742738733698137598123890101*r1_array_vels[2,0]*cos(2.0*r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) - 0.0000000099957485477467396275196247780201*r1_array_vels[3,0]*cos(2.0*r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) - 0.0000014103989054736004583093423337473*r1_array_vels[2,0]*sin(r1_array_poses[2,0]) - 0.0000000037940215467793255210079674662839*r1_array_vels[2,0]*sin(2.0*r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) + 0.0000000075880430935586510420159349325677*r1_array_vels[3,0]*sin(2.0*r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) + 0.00000037001367649928532146682918818532*r1_array_vels[3,0]*cos(3.0*r1_array_poses[2,0] + 2.0*r1_array_poses[3,0]) - 0.00000054455415796963772019116743236536*r1_array_vels[3,0]*sin(3.0*r1_array_poses[2,0] + 2.0*r1_array_poses[3,0])))/(0.0028864291829225755969117457465885*cos(r1_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r1_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r1_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r1_array_poses[2,0])**2*sin(r1_array_poses[2,0]))]])
-
-            g1 = np.matrix([[(34.534957403365486164894740547772*(0.004222989068339999884482663308205*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.0011702998592249999407335799905816*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.004222989068339999884482663308205*cos(r1_array_poses[2,0]) - 0.0011702998592249999407335799905816*sin(r1_array_poses[2,0])))/(0.047766999999999996961985715415722*cos(r1_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r1_array_poses[2,0]))],\
-                           [(34.534957403365486164894740547772*(0.004222989068339999884482663308205*sin(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) - 0.0011702998592249999407335799905816*cos(2.0*r1_array_poses[1,0] + r1_array_poses[2,0]) + 0.0050984367780149996605704280017157*cos(r1_array_poses[2,0]) + 0.015894161720219999350575154704046*sin(r1_array_poses[2,0])))/(0.047766999999999996961985715415722*cos(r1_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r1_array_poses[2,0]))],\
-                           [-(69.069914806730972329789481095543*(0.00020344438477991318706079621747573*cos(r1_array_poses[1,0] + r1_array_poses[3,0]) - 0.00066426872218756557474159382126189*sin(r1_array_poses[1,0] + r1_array_poses[3,0]) + 0.0001096097420672526918127777738309*cos(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) - 0.000093834642712660495248018443644833*cos(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0]) + 0.00032566945868806438400377387721001*sin(r1_array_poses[1,0] + 2.0*r1_array_poses[2,0] + r1_array_poses[3,0]) + 0.00033859926349950119073781994405188*sin(r1_array_poses[1,0] - 1.0*r1_array_poses[3,0])))/(0.047766999999999996961985715415722*cos(r1_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r1_array_poses[2,0]))]])
-
-
-            M2 = np.matrix([[(49.572386364462757849962123474612*(0.0001361769666249375655142419592553*cos(2.0*r2_array_poses[1,0]) - 0.0000010395654923422999338829146587226*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.0000030887284722755998825530154849872*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.00010430570934130451406174333622838*cos(2.0*r2_array_poses[2,0]) + 0.00010337561876074369688845282770292*sin(2.0*r2_array_poses[1,0]) + 0.000079181285283975840220601603442762*sin(2.0*r2_array_poses[2,0]) - 0.0000030887284722755998825530154849872*cos(r2_array_poses[2,0]) + 0.00040313592533045451009466604148129*cos(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) + 0.0000010395654923422999338829146587226*sin(r2_array_poses[2,0]) + 0.00070506131454818413163718096909733))/(0.013558567415999998622109604440311*sin(2.0*r2_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r2_array_poses[2,0]) + 0.022424108064999998177960152112576),\
-                            -(49.572386364462757849962123474612*(0.0000010395654923422999338829146587226*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.0000030887284722755998825530154849872*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.00010337561876074369688845282770292*cos(2.0*r2_array_poses[1,0]) + 0.0001361769666249375655142419592553*sin(2.0*r2_array_poses[1,0]) + 0.00040313592533045451009466604148129*sin(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0])))/(0.013558567415999998622109604440311*sin(2.0*r2_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r2_array_poses[2,0]) + 0.022424108064999998177960152112576),\
-                            (3.9747139387026239244099630601944*(0.047766999999999996961985715415722*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[3,0]))*(0.00027895664328787183010421376151069*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) - 0.00082882832587325816208455827647565*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) - 0.0000217632569*cos(r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.00028445570585160958918374820569852*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000095738534014076793910962925870933*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.00028445570585160958918374820569852*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000095738534014076793910962925870933*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0030041117825278514553436796373526*cos(r2_array_poses[1,0]) + 0.0010110862681153848312989132246105*sin(r2_array_poses[1,0])))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0]))**2 - (24.786193182231378924981061737306*(0.0076599161199999995128240293240651*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.022758932639999999134605701556211*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0067843470099999995685108311604949*cos(r2_array_poses[2,0]) + 0.020157465719999999233524867747747*sin(r2_array_poses[2,0]))*(0.00028445570585160958918374820569852*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000095738534014076793910962925870933*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.00028445570585160958918374820569852*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000095738534014076793910962925870933*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000011119520030067920863664636561489*cos(r2_array_poses[1,0]) + 0.0000037424685978147061970484875263562*sin(r2_array_poses[1,0])))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0]))**2 + (0.16036*sin(r2_array_poses[3,0])*((cos(r2_array_poses[1,0] + r2_array_poses[2,0])*(0.0040055721446399998476906034738931*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0013481452371199999142570291610355*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.011671172651879999466092491395841*cos(r2_array_poses[2,0]) + 0.0040085638208*cos(r2_array_poses[3,0]) - 0.0039281369187899997198368480111341*sin(r2_array_poses[2,0]) + 0.042812399753418998939427354098797))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0])) - (7.0407660353446454974301203970992*(0.14203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.14192399999999999460342792190204*cos(r2_array_poses[1,0]) + 0.047766999999999996961985715415722*sin(r2_array_poses[1,0]))*(0.0020027860723199999238453017369466*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00067407261855999995712851458051773*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0058355863259399997330462456979205*cos(r2_array_poses[2,0]) + 0.0040085638208*cos(r2_array_poses[3,0]) - 0.0019640684593949998599184240055671*sin(r2_array_poses[2,0]) + 0.01625959562072499985284632093574))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0])) + (7.0407660353446454974301203970992*(0.14192399999999999460342792190204*cos(r2_array_poses[1,0]) + 0.047766999999999996961985715415722*sin(r2_array_poses[1,0]))*(0.0020027860723199999238453017369466*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00067407261855999995712851458051773*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0020042819104*cos(r2_array_poses[3,0]) + 0.0026794854106086355903769417993171))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0]))))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0]))],\
-                            [-(49.572386364462757849962123474612*(0.0000010395654923422999338829146587226*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.0000030887284722755998825530154849872*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.00010337561876074369688845282770292*cos(2.0*r2_array_poses[1,0]) + 0.0001361769666249375655142419592553*sin(2.0*r2_array_poses[1,0]) + 0.00040313592533045451009466604148129*sin(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0])))/(0.013558567415999998622109604440311*sin(2.0*r2_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r2_array_poses[2,0]) + 0.022424108064999998177960152112576),\
-                            (49.572386364462757849962123474612*(0.0000030887284722755998825530154849872*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.0000010395654923422999338829146587226*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.0001361769666249375655142419592553*cos(2.0*r2_array_poses[1,0]) - 0.00010430570934130451406174333622838*cos(2.0*r2_array_poses[2,0]) - 0.00010337561876074369688845282770292*sin(2.0*r2_array_poses[1,0]) + 0.000079181285283975840220601603442762*sin(2.0*r2_array_poses[2,0]) - 0.0000030887284722755998825530154849872*cos(r2_array_poses[2,0]) - 0.00040313592533045451009466604148129*cos(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) + 0.0000010395654923422999338829146587226*sin(r2_array_poses[2,0]) + 0.00070506131454818413163718096909733))/(0.013558567415999998622109604440311*sin(2.0*r2_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r2_array_poses[2,0]) + 0.022424108064999998177960152112576),\
-                             (3.9747139387026239244099630601944*(0.047766999999999996961985715415722*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[3,0]))*(0.00027895664328787183010421376151069*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) + 0.00082882832587325816208455827647565*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) + 0.000095738534014076793910962925870933*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000217632569*sin(r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.00028445570585160958918374820569852*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000095738534014076793910962925870933*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.00028445570585160958918374820569852*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0010110862681153848312989132246105*cos(r2_array_poses[1,0]) - 0.0030041117825278514553436796373526*sin(r2_array_poses[1,0])))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0]))**2 + (0.16036*sin(r2_array_poses[3,0])*((7.0407660353446454974301203970992*(0.14203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.047766999999999996961985715415722*cos(r2_array_poses[1,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[1,0]))*(0.0020027860723199999238453017369466*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00067407261855999995712851458051773*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0058355863259399997330462456979205*cos(r2_array_poses[2,0]) + 0.0040085638208*cos(r2_array_poses[3,0]) - 0.0019640684593949998599184240055671*sin(r2_array_poses[2,0]) + 0.01625959562072499985284632093574))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0])) + (7.0407660353446454974301203970992*(0.047766999999999996961985715415722*cos(r2_array_poses[1,0]) - 0.14192399999999999460342792190204*sin(r2_array_poses[1,0]))*(0.0020027860723199999238453017369466*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00067407261855999995712851458051773*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0020042819104*cos(r2_array_poses[3,0]) + 0.0026794854106086355903769417993171))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0])) - (1.0*sin(r2_array_poses[1,0] + r2_array_poses[2,0])*(0.0040055721446399998476906034738931*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0013481452371199999142570291610355*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.011671172651879999466092491395841*cos(r2_array_poses[2,0]) + 0.0040085638208*cos(r2_array_poses[3,0]) - 0.0039281369187899997198368480111341*sin(r2_array_poses[2,0]) + 0.042812399753418998939427354098797))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0]))))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0])) - (24.786193182231378924981061737306*(0.0076599161199999995128240293240651*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.022758932639999999134605701556211*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0067843470099999995685108311604949*cos(r2_array_poses[2,0]) + 0.020157465719999999233524867747747*sin(r2_array_poses[2,0]))*(0.000095738534014076793910962925870933*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.00028445570585160958918374820569852*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000095738534014076793910962925870933*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.00028445570585160958918374820569852*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000037424685978147061970484875263562*cos(r2_array_poses[1,0]) - 0.000011119520030067920863664636561489*sin(r2_array_poses[1,0])))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0]))**2],\
-                            [-(24.786193182231378924981061737306*(0.00012929375397198337047756129282388*sin(r2_array_poses[1,0] + r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.0000088378184731947519431226043473656*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000033154628448945718466064590900881*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.00021336040564880879742640358132956*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000011642080847389553545544785987331*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000043674676735949976011727681172359*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.00000016670472235201121739746419467276*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.00000024953154947055056846529683193203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.00000049530849781411519716620156317255*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.00000016670472235201121739746419467276*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.00000015087736493725280842073467806088*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) + 0.00000033340944470402243479492838934553*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) + 0.00000049530849781411519716620156317255*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00000019875113818734438265101740694115*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) - 0.0000009906169956282303943324031263451*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) + 0.0000088378184731947519431226043473656*cos(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000011642080847389553545544785987331*sin(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0])))/(0.013558567415999998622109604440311*sin(2.0*r2_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r2_array_poses[2,0]) + 0.022424108064999998177960152112576),\
-                            -(24.786193182231378924981061737306*(0.00012929375397198337047756129282388*cos(r2_array_poses[1,0] + r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.00021336040564880879742640358132956*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000011642080847389553545544785987331*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000043674676735949976011727681172359*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000088378184731947519431226043473656*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000033154628448945718466064590900881*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.00000024953154947055056846529683193203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.00000049530849781411519716620156317255*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.00000016670472235201121739746419467276*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.00000049530849781411519716620156317255*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00000019875113818734438265101740694115*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) - 0.0000009906169956282303943324031263451*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.00000016670472235201121739746419467276*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00000015087736493725280842073467806088*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) - 0.00000033340944470402243479492838934553*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) + 0.000011642080847389553545544785987331*cos(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000088378184731947519431226043473656*sin(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0])))/(0.013558567415999998622109604440311*sin(2.0*r2_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r2_array_poses[2,0]) + 0.022424108064999998177960152112576),\
-                            -(49.572386364462757849962123474612*(0.000000026732769276368518821857358257724*sin(r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) - 0.000000031871732519722545201917151377082*cos(2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00000007942767070947151301757208267035*cos(r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) + 0.000000024194694241337860358349012973843*sin(2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000020028861984271396211740451538764*cos(2.0*r2_array_poses[2,0]) + 0.000010366773193473626644890864458619*cos(2.0*r2_array_poses[3,0]) - 0.0000015204450884856399668441155638056*sin(2.0*r2_array_poses[2,0]) + 0.00000007942767070947151301757208267035*cos(r2_array_poses[2,0]) + 0.00000004001487927309748915909499996862*cos(r2_array_poses[3,0]) + 0.0000035018355806884690766203254763997*cos(2.0*r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) - 0.000000026732769276368518821857358257724*sin(r2_array_poses[2,0]) - 0.0000026583381090364677066090588984327*sin(2.0*r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) - 0.000017277937413586096424197894997158))/(0.013558567415999998622109604440311*sin(2.0*r2_array_poses[2,0]) - 0.017860735486999998758427465439524*cos(2.0*r2_array_poses[2,0]) + 0.022424108064999998177960152112576)]])
-
-            C2 = np.matrix([[-(12.393096591115689462490530868653*(0.000032949940073977341546754725149535*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.00000073203243685793528826971806258359*r2_array_vels[2,0] + 0.00013869404912582092959861518971449*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.000011089877593033423757847637491665*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.000046679903642746034319030001569579*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.000014388836629933194457940340309125*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) + 0.000014388836629933194457940340309125*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) + 0.000021176246481773180157534027188411*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) + 0.000021176246481773180157534027188411*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) - 0.00000038870777482652758327933797037624*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0]) - 0.00000058306166223979137491900695556436*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0]) - 0.00000019435388741326379163966898518812*r2_array_vels[2,0]*cos(2.0*r2_array_poses[2,0]) - 0.00000029507858587037714041261734139187*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0]) - 0.00000044261787880556571061892601208781*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0]) + 0.00000014753929293518857020630867069594*r2_array_vels[2,0]*sin(2.0*r2_array_poses[2,0]) + 0.00016295877211844301176698376951963*r2_array_vels[2,0]*cos(r2_array_poses[2,0]) + 0.00000048802162457195685884647870838906*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) - 0.00000024401081228597842942323935419453*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) - 0.000054846619794972429920141577098329*r2_array_vels[2,0]*sin(r2_array_poses[2,0]) - 0.000057214663066599423715123304954675*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] + 3.0*r2_array_poses[2,0]) + 0.000019256593745259819358959213020415*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] + 3.0*r2_array_poses[2,0])))/(0.0028864291829225755969117457465885*cos(r2_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r2_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r2_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r2_array_poses[2,0])**2*sin(r2_array_poses[2,0])),\
-                            -(12.393096591115689462490530868653*(0.000011089877593033423757847637491665*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.000046679903642746034319030001569579*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.000032949940073977341546754725149535*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.00013869404912582092959861518971449*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.000021176246481773180157534027188411*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) + 0.000021176246481773180157534027188411*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) - 0.000014388836629933194457940340309125*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) - 0.000014388836629933194457940340309125*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) - 0.00000029507858587037714041261734139187*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0]) - 0.00000029507858587037714041261734139187*r2_array_vels[1,0]*cos(2.0*r2_array_poses[2,0]) - 0.00000044261787880556571061892601208781*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0]) - 0.00000014753929293518857020630867069594*r2_array_vels[2,0]*cos(2.0*r2_array_poses[2,0]) + 0.00000038870777482652758327933797037624*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0]) - 0.00000038870777482652758327933797037624*r2_array_vels[1,0]*sin(2.0*r2_array_poses[2,0]) + 0.00000058306166223979137491900695556436*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0]) - 0.00000019435388741326379163966898518812*r2_array_vels[2,0]*sin(2.0*r2_array_poses[2,0]) + 0.000054846619794972429920141577098329*r2_array_vels[1,0]*cos(r2_array_poses[2,0]) + 0.00003851318749051963871791842604083*r2_array_vels[2,0]*cos(r2_array_poses[2,0]) + 0.00016295877211844301176698376951963*r2_array_vels[1,0]*sin(r2_array_poses[2,0]) + 0.00011442932613319884743024660990935*r2_array_vels[2,0]*sin(r2_array_poses[2,0]) - 0.00000048802162457195685884647870838906*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) + 0.00000024401081228597842942323935419453*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) + 0.000019256593745259819358959213020415*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] + 3.0*r2_array_poses[2,0]) + 0.000057214663066599423715123304954675*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] + 3.0*r2_array_poses[2,0])))/(0.0028864291829225755969117457465885*cos(r2_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r2_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r2_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r2_array_poses[2,0])**2*sin(r2_array_poses[2,0])),\
-                            -(6.1965482955578447312452654343266*(0.0000018104058248269486959230379712567*r2_array_vels[1,0]*cos(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000047318802030173678236567316865601*r2_array_vels[2,0]*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r2_array_vels[3,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000000094637604060347356473134633731202*r2_array_vels[3,0]*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r2_array_vels[3,0]*cos(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r2_array_vels[1,0]*sin(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.00000023477744314907700565386397703181*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r2_array_vels[2,0]*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.00000015651829543271800376924265135454*r2_array_vels[3,0]*sin(r2_array_poses[1,0] + r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r2_array_vels[3,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.00000012466635754236392650934927385907*r2_array_vels[3,0]*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r2_array_vels[3,0]*sin(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000020945738194573054747217346601561*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000013509006974121133933904142467225*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000010889777769779084336715637963644*r2_array_vels[3,0]*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000062233402715820258713648653506498*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000040137590926689301431357553545922*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000032355408968495547238318382630818*r2_array_vels[3,0]*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.0000020945738194573054747217346601561*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000040814009265224237900836641397514*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000010889777769779084336715637963644*r2_array_vels[3,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r2_array_vels[3,0]*cos(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000011414433154663828459182407807069*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.0000035567455416376796676168942963269*r2_array_vels[3,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.0000062233402715820258713648653506498*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000012301346071758212453528510987523*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000012126546467137741302549481014413*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000012301346071758212453528510987523*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000032355408968495547238318382630818*r2_array_vels[3,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000012301346071758212453528510987523*r2_array_vels[3,0]*sin(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000033914250655107275559992688195273*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) + 0.000010567704780526012980875175449959*r2_array_vels[3,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.0000061759747459797292648053987999074*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.0000061759747459797292648053987999074*r2_array_vels[3,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.0000067916457716342943401243131998673*r2_array_vels[3,0]*cos(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r2_array_vels[3,0]*cos(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000018349886738719767173914346365063*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.000018349886738719767173914346365063*r2_array_vels[3,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.0000046147876839521741265506259439426*r2_array_vels[3,0]*sin(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000000062333178771181963254674636929534*r2_array_vels[3,0]*sin(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00000023477744314907700565386397703181*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])))/(0.0028864291829225755969117457465885*cos(r2_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r2_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r2_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r2_array_poses[2,0])**2*sin(r2_array_poses[2,0]))],\
-                            [-(12.393096591115689462490530868653*(0.000011089877593033423757847637491665*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.000046679903642746034319030001569579*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.000032949940073977341546754725149535*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.00013869404912582092959861518971449*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.000021176246481773180157534027188411*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) + 0.000021176246481773180157534027188411*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) - 0.000014388836629933194457940340309125*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) - 0.000014388836629933194457940340309125*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) - 0.00000029507858587037714041261734139187*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0]) + 0.00000029507858587037714041261734139187*r2_array_vels[1,0]*cos(2.0*r2_array_poses[2,0]) - 0.00000044261787880556571061892601208781*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0]) + 0.00000014753929293518857020630867069594*r2_array_vels[2,0]*cos(2.0*r2_array_poses[2,0]) + 0.00000038870777482652758327933797037624*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0]) + 0.00000038870777482652758327933797037624*r2_array_vels[1,0]*sin(2.0*r2_array_poses[2,0]) + 0.00000058306166223979137491900695556436*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0]) + 0.00000019435388741326379163966898518812*r2_array_vels[2,0]*sin(2.0*r2_array_poses[2,0]) - 0.000054846619794972429920141577098329*r2_array_vels[1,0]*cos(r2_array_poses[2,0]) - 0.00003851318749051963871791842604083*r2_array_vels[2,0]*cos(r2_array_poses[2,0]) - 0.00016295877211844301176698376951963*r2_array_vels[1,0]*sin(r2_array_poses[2,0]) - 0.00011442932613319884743024660990935*r2_array_vels[2,0]*sin(r2_array_poses[2,0]) - 0.00000048802162457195685884647870838906*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) + 0.00000024401081228597842942323935419453*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) + 0.000019256593745259819358959213020415*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] + 3.0*r2_array_poses[2,0]) + 0.000057214663066599423715123304954675*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] + 3.0*r2_array_poses[2,0])))/(0.0028864291829225755969117457465885*cos(r2_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r2_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r2_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r2_array_poses[2,0])**2*sin(r2_array_poses[2,0])),\
-                            (12.393096591115689462490530868653*(0.00000073203243685793528826971806258359*r2_array_vels[2,0] + 0.000032949940073977341546754725149535*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.00013869404912582092959861518971449*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.000011089877593033423757847637491665*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.000046679903642746034319030001569579*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.000014388836629933194457940340309125*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) + 0.000014388836629933194457940340309125*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) + 0.000021176246481773180157534027188411*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) + 0.000021176246481773180157534027188411*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0] - 1.0*r2_array_poses[2,0]) - 0.00000038870777482652758327933797037624*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0]) - 0.00000058306166223979137491900695556436*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0]) + 0.00000019435388741326379163966898518812*r2_array_vels[2,0]*cos(2.0*r2_array_poses[2,0]) - 0.00000029507858587037714041261734139187*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0]) - 0.00000044261787880556571061892601208781*r2_array_vels[2,0]*sin(2.0*r2_array_poses[1,0]) - 0.00000014753929293518857020630867069594*r2_array_vels[2,0]*sin(2.0*r2_array_poses[2,0]) - 0.00016295877211844301176698376951963*r2_array_vels[2,0]*cos(r2_array_poses[2,0]) + 0.00000048802162457195685884647870838906*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) - 0.00000024401081228597842942323935419453*r2_array_vels[2,0]*cos(2.0*r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) + 0.000054846619794972429920141577098329*r2_array_vels[2,0]*sin(r2_array_poses[2,0]) - 0.000057214663066599423715123304954675*r2_array_vels[1,0]*cos(2.0*r2_array_poses[1,0] + 3.0*r2_array_poses[2,0]) + 0.000019256593745259819358959213020415*r2_array_vels[1,0]*sin(2.0*r2_array_poses[1,0] + 3.0*r2_array_poses[2,0])))/(0.0028864291829225755969117457465885*cos(r2_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r2_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r2_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r2_array_poses[2,0])**2*sin(r2_array_poses[2,0])),\
-                            (6.1965482955578447312452654343266*(0.0000012301346071758212453528510987523*r2_array_vels[1,0]*cos(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00000023477744314907700565386397703181*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) + 0.000000062333178771181963254674636929534*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r2_array_vels[2,0]*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000012301346071758212453528510987523*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00000015651829543271800376924265135454*r2_array_vels[3,0]*cos(r2_array_poses[1,0] + r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) + 0.000000062333178771181963254674636929534*r2_array_vels[3,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.00000012466635754236392650934927385907*r2_array_vels[3,0]*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000012301346071758212453528510987523*r2_array_vels[3,0]*cos(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r2_array_vels[1,0]*sin(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r2_array_vels[2,0]*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r2_array_vels[3,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000094637604060347356473134633731202*r2_array_vels[3,0]*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r2_array_vels[3,0]*sin(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000062233402715820258713648653506498*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000040137590926689301431357553545922*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000032355408968495547238318382630818*r2_array_vels[3,0]*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.0000020945738194573054747217346601561*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000013509006974121133933904142467225*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000010889777769779084336715637963644*r2_array_vels[3,0]*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000062233402715820258713648653506498*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000012126546467137741302549481014413*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000032355408968495547238318382630818*r2_array_vels[3,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000012301346071758212453528510987523*r2_array_vels[3,0]*cos(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000033914250655107275559992688195273*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.000010567704780526012980875175449959*r2_array_vels[3,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.0000020945738194573054747217346601561*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000040814009265224237900836641397514*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000010889777769779084336715637963644*r2_array_vels[3,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000018104058248269486959230379712567*r2_array_vels[3,0]*sin(r2_array_poses[1,0] + 4.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000011414433154663828459182407807069*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.0000035567455416376796676168942963269*r2_array_vels[3,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) + 0.000018349886738719767173914346365063*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) + 0.000018349886738719767173914346365063*r2_array_vels[3,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.0000046147876839521741265506259439426*r2_array_vels[3,0]*cos(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r2_array_vels[3,0]*cos(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000061759747459797292648053987999074*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.0000061759747459797292648053987999074*r2_array_vels[3,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) + 0.0000067916457716342943401243131998673*r2_array_vels[3,0]*sin(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r2_array_vels[3,0]*sin(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.00000023477744314907700565386397703181*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])))/(0.0028864291829225755969117457465885*cos(r2_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r2_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r2_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r2_array_poses[2,0])**2*sin(r2_array_poses[2,0]))],\
-                            [-(12.393096591115689462490530868653*(0.0000000236594010150868391182836584328*r2_array_vels[1,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000047318802030173678236567316865601*r2_array_vels[1,0]*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000000236594010150868391182836584328*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000070978203045260517354850975298401*r2_array_vels[2,0]*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000000005959686761779894122900711012458*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) - 0.000000005959686761779894122900711012458*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) - 0.00000007825914771635900188462132567727*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.000000031166589385590981627337318464767*r2_array_vels[1,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r2_array_vels[1,0]*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000000039129573858179500942310662838635*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.000000031166589385590981627337318464767*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000093499768156772944882011955394301*r2_array_vels[2,0]*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000000017707257813529208766126897548914*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) - 0.000000017707257813529208766126897548914*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) - 0.000004397601975160889430996951651744*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.0000074855893481507540633996510516977*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000013066034348456760683476758640084*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000022240977717816644270433931822616*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000004397601975160889430996951651744*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000013096146021710247985942522517903*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00000001545343237957477264518306259928*r2_array_vels[1,0]*cos(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0]) + 0.0000017783727708188398338084471481634*r2_array_vels[1,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.00000001545343237957477264518306259928*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0]) + 0.0000074855893481507540633996510516977*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.000013066034348456760683476758640084*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000038910909790968770965195854575523*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000000010500298722571454324661254081789*r2_array_vels[1,0]*sin(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0]) - 0.0000052838523902630064904375877249794*r2_array_vels[1,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) + 0.000000010500298722571454324661254081789*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0]) - 0.000022240977717816644270433931822616*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) + 0.000000011919373523559788245801422024916*r2_array_vels[1,0]*cos(r2_array_poses[1,0]) + 0.0000030879873729898646324026993999537*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) + 0.0000033958228858171471700621565999336*r2_array_vels[1,0]*cos(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000033958228858171471700621565999336*r2_array_vels[2,0]*cos(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000000236594010150868391182836584328*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000035414515627058417532253795097828*r2_array_vels[1,0]*sin(r2_array_poses[1,0]) + 0.0000091749433693598835869571731825317*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) + 0.0000023073938419760870632753129719713*r2_array_vels[1,0]*sin(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000023073938419760870632753129719713*r2_array_vels[2,0]*sin(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000000031166589385590981627337318464767*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000001173887215745385028269319885159*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])))/(0.0028864291829225755969117457465885*cos(r2_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r2_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r2_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r2_array_poses[2,0])**2*sin(r2_array_poses[2,0])),\
-                            (12.393096591115689462490530868653*(0.00000007825914771635900188462132567727*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) + 0.000000031166589385590981627337318464767*r2_array_vels[1,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000062333178771181963254674636929534*r2_array_vels[1,0]*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000000039129573858179500942310662838635*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) + 0.000000031166589385590981627337318464767*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000093499768156772944882011955394301*r2_array_vels[2,0]*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000000017707257813529208766126897548914*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) + 0.000000017707257813529208766126897548914*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) + 0.0000000236594010150868391182836584328*r2_array_vels[1,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000000047318802030173678236567316865601*r2_array_vels[1,0]*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000000236594010150868391182836584328*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000000070978203045260517354850975298401*r2_array_vels[2,0]*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000000005959686761779894122900711012458*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) - 0.000000005959686761779894122900711012458*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0]) - 0.000013066034348456760683476758640084*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000022240977717816644270433931822616*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000004397601975160889430996951651744*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.0000074855893481507540633996510516977*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.000013066034348456760683476758640084*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000038910909790968770965195854575523*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.000000010500298722571454324661254081789*r2_array_vels[1,0]*cos(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0]) + 0.0000052838523902630064904375877249794*r2_array_vels[1,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.000000010500298722571454324661254081789*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0]) + 0.000022240977717816644270433931822616*r2_array_vels[2,0]*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.000004397601975160889430996951651744*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000013096146021710247985942522517903*r2_array_vels[2,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.00000001545343237957477264518306259928*r2_array_vels[1,0]*sin(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0]) + 0.0000017783727708188398338084471481634*r2_array_vels[1,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) - 0.00000001545343237957477264518306259928*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 2.0*r2_array_poses[2,0]) + 0.0000074855893481507540633996510516977*r2_array_vels[2,0]*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) + 0.000000035414515627058417532253795097828*r2_array_vels[1,0]*cos(r2_array_poses[1,0]) - 0.0000091749433693598835869571731825317*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) + 0.0000023073938419760870632753129719713*r2_array_vels[1,0]*cos(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000023073938419760870632753129719713*r2_array_vels[2,0]*cos(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.000000031166589385590981627337318464767*r2_array_vels[1,0]*cos(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.000000011919373523559788245801422024916*r2_array_vels[1,0]*sin(r2_array_poses[1,0]) + 0.0000030879873729898646324026993999537*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.0000033958228858171471700621565999336*r2_array_vels[1,0]*sin(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) - 0.0000033958228858171471700621565999336*r2_array_vels[2,0]*sin(2.0*r2_array_poses[2,0] - 1.0*r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.0000000236594010150868391182836584328*r2_array_vels[1,0]*sin(r2_array_poses[1,0] + 3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000001173887215745385028269319885159*r2_array_vels[2,0]*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])))/(0.0028864291829225755969117457465885*cos(r2_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r2_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r2_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r2_array_poses[2,0])**2*sin(r2_array_poses[2,0])),\
-                            -(12.393096591115689462490530868653*(0.00000084731856930257572080657156757769*r2_array_vels[3,0]*cos(r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) - 0.000002719244617526501354400213739497*r2_array_vels[2,0]*cos(r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) - 0.00000001882445539169299431332681367841*r2_array_vels[2,0] + 0.00000091520925034094576585724545797076*r2_array_vels[2,0]*sin(r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) - 0.00000028517985752850915574952258467949*r2_array_vels[3,0]*sin(r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) - 0.0000000016838279031515584155026787045557*r2_array_vels[3,0]*cos(3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000000049978742738733698137598123890101*r2_array_vels[2,0]*cos(2.0*r2_array_poses[2,0]) + 0.00000001882445539169299431332681367841*r2_array_vels[2,0]*cos(2.0*r2_array_poses[3,0]) + 0.000000012549636927795329542217875785607*r2_array_vels[3,0]*cos(2.0*r2_array_poses[3,0]) + 0.0000000024781124163886105413815559184205*r2_array_vels[3,0]*sin(3.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000000037940215467793255210079674662839*r2_array_vels[2,0]*sin(2.0*r2_array_poses[2,0]) + 0.0000000056790717259550878354722185818877*r2_array_vels[2,0]*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.0000000056790717259550878354722185818877*r2_array_vels[3,0]*cos(r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000000019113907382380476430967160359155*r2_array_vels[2,0]*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000000019113907382380476430967160359155*r2_array_vels[3,0]*sin(r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.0000000056790717259550878354722185818877*r2_array_vels[2,0]*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.0000014712939187105509320044522915508*r2_array_vels[2,0]*cos(r2_array_poses[2,0] - 2.0*r2_array_poses[3,0]) - 0.0000000028395358629775439177361092909438*r2_array_vels[3,0]*cos(r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) - 0.0000014712939187105509320044522915508*r2_array_vels[3,0]*cos(r2_array_poses[2,0] - 2.0*r2_array_poses[3,0]) + 0.0000000019113907382380476430967160359155*r2_array_vels[2,0]*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) + 0.00000049518965513265469245209687577658*r2_array_vels[2,0]*sin(r2_array_poses[2,0] - 2.0*r2_array_poses[3,0]) + 0.00000000095569536911902382154835801795777*r2_array_vels[3,0]*sin(r2_array_poses[2,0] - 1.0*r2_array_poses[3,0]) + 0.00000049518965513265469245209687577658*r2_array_vels[3,0]*sin(r2_array_poses[2,0] - 2.0*r2_array_poses[3,0]) + 0.0000041905385362370522864046660310477*r2_array_vels[2,0]*cos(r2_array_poses[2,0]) + 0.0000000049978742738733698137598123890101*r2_array_vels[2,0]*cos(2.0*r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) - 0.0000000099957485477467396275196247780201*r2_array_vels[3,0]*cos(2.0*r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) - 0.0000014103989054736004583093423337473*r2_array_vels[2,0]*sin(r2_array_poses[2,0]) - 0.0000000037940215467793255210079674662839*r2_array_vels[2,0]*sin(2.0*r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) + 0.0000000075880430935586510420159349325677*r2_array_vels[3,0]*sin(2.0*r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) + 0.00000037001367649928532146682918818532*r2_array_vels[3,0]*cos(3.0*r2_array_poses[2,0] + 2.0*r2_array_poses[3,0]) - 0.00000054455415796963772019116743236536*r2_array_vels[3,0]*sin(3.0*r2_array_poses[2,0] + 2.0*r2_array_poses[3,0])))/(0.0028864291829225755969117457465885*cos(r2_array_poses[2,0]) + 0.0028586930681370236738999071750982*sin(r2_array_poses[2,0]) - 0.0027774398739559126177071323633547*cos(r2_array_poses[2,0])**3 - 0.0018872149334969158344131251946081*cos(r2_array_poses[2,0])**2*sin(r2_array_poses[2,0]))]])
-
-            g2 = np.matrix([[-(0.035203830176723227487150601985496*(4.1427522760415398866774927053491*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 1.1480641618997249418596419707606*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 4.1427522760415398866774927053491*cos(r2_array_poses[2,0]) - 1.1480641618997249418596419707606*sin(r2_array_poses[2,0])))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0]))],\
-                            [(0.035203830176723227487150601985496*(4.1427522760415398866774927053491*sin(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) - 1.1480641618997249418596419707606*cos(2.0*r2_array_poses[1,0] + r2_array_poses[2,0]) + 5.0015664792327146670195898696831*cos(r2_array_poses[2,0]) + 15.592172647535819362914226764669*sin(r2_array_poses[2,0])))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0]))],
-                            [(0.035203830176723227487150601985496*(0.39915788293818967301328217868739*cos(r2_array_poses[1,0] + r2_array_poses[3,0]) - 1.3032952329320036576430070773158*sin(r2_array_poses[1,0] + r2_array_poses[3,0]) + 0.21505431393594978133666999225623*cos(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) - 0.18410356900223989167661218643116*cos(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0]) + 0.63896347794598232141540434708604*sin(r2_array_poses[1,0] + 2.0*r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.66433175498602133622760273022979*sin(r2_array_poses[1,0] - 1.0*r2_array_poses[3,0])))/(0.047766999999999996961985715415722*cos(r2_array_poses[2,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[2,0]))]])
+            M1 = mass_matrix(r1_conf)
+            C1 = coriolis(r1_conf, r1_array_vels[1:4,0])
+            g1 = gravity(r1_conf)
+
+            M2 = mass_matrix(r2_conf, mirrored=True)
+            C2 = coriolis(r2_conf, r2_array_vels[1:4,0], mirrored=True)
+            g2 = gravity(r2_conf, mirrored=True)
 
             # c12 = cos(r1_array_poses[1] + r1_array_poses[2])
             # c23 = cos(r1_array_poses[2] + r1_array_poses[3])
@@ -330,8 +290,8 @@ class WindowxController():
             p_o2_dot = obj_array_vel[0:2] - r2_v_e[0:2]
             J_o1 = np.matrix([[1,0,p_o1[1,0]],[0,1,-p_o1[0,0]],[0,0,1]])
             J_o2 = np.matrix([[1,0,p_o2[1,0]],[0,1,-p_o2[0,0]],[0,0,1]])
-            J_o1_dot = np.matrix([[1,0,p_o1_dot[1,0]],[0,1,-p_o1_dot[0,0]],[0,0,1]])
-            J_o2_dot = np.matrix([[1,0,p_o2_dot[1,0]],[0,1,-p_o2_dot[0,0]],[0,0,1]])
+            J_o1_dot = np.matrix([[0,0,p_o1_dot[1,0]],[0,0,-p_o1_dot[0,0]],[0,0,0]])
+            J_o2_dot = np.matrix([[0,0,p_o2_dot[1,0]],[0,0,-p_o2_dot[0,0]],[0,0,0]])
             #Object dynamics
             Ro = np.matrix([[cos(self.obj_pose[2]), -sin(self.obj_pose[2]), 0], [sin(self.obj_pose[2]), cos(self.obj_pose[2]), 0], [0,0,1]])
             Io_i = np.dot(Ro, self.Io)
@@ -405,9 +365,7 @@ class WindowxController():
 
             control_torque_r1 = np.dot(r1_J_e.T, u_r1)
             control_torque_r2 = np.dot(r2_J_e.T, u_r2)
-            print("Torques: ")
-            print(control_torque_r1)
-            print(control_torque_r2)
+            self.log.push(self.LOG_TORQUES, control_torque_r1, control_torque_r2)
             #Create ROS message
             self.torques1.data = [0.0, control_torque_r1[0,0], control_torque_r1[1,0], control_torque_r1[2,0], 0.0, self.r1_close_gripper]
             self.torques2.data = [0.0, control_torque_r2[0,0], control_torque_r2[1,0], control_torque_r2[2,0], 0.0, self.r2_close_gripper]
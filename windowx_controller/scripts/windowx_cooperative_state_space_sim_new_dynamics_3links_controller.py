@@ -12,6 +12,7 @@ from std_msgs.msg import Float32MultiArray, MultiArrayDimension
 import numpy as np
 from numpy.linalg import inv
 from windowx_arm import *
+from windowx_common.log import ring_logger
 
 class WindowxController():
     """Class to compute and pubblish joints torques"""
@@ -82,6 +83,12 @@ class WindowxController():
         self.pose_call2 = False
         self.vel_call2 = False
 
+        #Loop records, formatted and printed by a background thread
+        self.log = ring_logger()
+        self.LOG_POSES = self.log.channel('poses', ['r1_x', 'r1_y', 'r1_theta', 'r2_x', 'r2_y', 'r2_theta', 'obj_x', 'obj_y', 'obj_theta'])
+        self.LOG_VELOCITIES = self.log.channel('velocities', ['r1_vx', 'r1_vy', 'r1_w', 'r2_vx', 'r2_vy', 'r2_w'])
+        self.LOG_ERRORS = self.log.channel('errors', ['e_x', 'e_y', 'e_theta'])
+        self.LOG_TORQUES = self.log.channel('torques', ['r1_q2', 'r1_q3', 'r1_q4', 'r2_q2', 'r2_q3', 'r2_q4'])
         print("\nWindowX controller node created")
         print("\nWaiting for target position, velocity and acceleration...")
 
@@ -149,28 +156,20 @@ class WindowxController():
             r1_array_poses = np.asarray(self.r1_joints_poses)[np.newaxis].T
             r2_array_vels = np.asarray(self.r2_joints_vels)[np.newaxis].T
             r2_array_poses = np.asarray(self.r2_joints_poses)[np.newaxis].T
+            #Configuration contexts: sines and cosines shared by kinematics and dynamics
+            r1_conf = ArmConfiguration(r1_array_poses[1:4,0])
+            r2_conf = ArmConfiguration(r2_array_poses[1:4,0])
 
             # Compute ee position from joints_poses
-            r1_x_e = np.array([[L1_X*cos(r1_array_poses[1]) - L1_Y*sin(r1_array_poses[1]) + L2*cos(r1_array_poses[1]+r1_array_poses[2]) + L3*cos(r1_array_poses[1]+r1_array_poses[2]+r1_array_poses[3])],\
-                            [L1_X*sin(r1_array_poses[1]) + L1_Y*cos(r1_array_poses[1]) + L2*sin(r1_array_poses[1]+r1_array_poses[2]) + L3*sin(r1_array_poses[1]+r1_array_poses[2]+r1_array_poses[3])],\
-                            [r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]]])
+            r1_x_e = fk(r1_conf)
             # Compute ee velocities from joints_vels
-            r1_J_e = np.matrix([[ 0.047766999999999996961985715415722*cos(r1_array_poses[1]) - 0.14203*sin(r1_array_poses[1] + r1_array_poses[2]) - 0.16036*sin(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) - 0.14192399999999999460342792190204*sin(r1_array_poses[1]),\
-                             - 0.16036*sin(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) - 0.14203*sin(r1_array_poses[1] + r1_array_poses[2]), -0.16036*sin(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3])],\
-                            [ 0.16036*cos(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) + 0.14203*cos(r1_array_poses[1] + r1_array_poses[2]) + 0.14192399999999999460342792190204*cos(r1_array_poses[1]) + 0.047766999999999996961985715415722*sin(r1_array_poses[1]),\
-                              0.16036*cos(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3]) + 0.14203*cos(r1_array_poses[1] + r1_array_poses[2]),  0.16036*cos(r1_array_poses[1] + r1_array_poses[2] + r1_array_poses[3])],\
-                            [1.0,1.0,1.0]])
+            r1_J_e = jacobian(r1_conf, L3_DYN)
             r1_v_e = np.dot(r1_J_e, r1_array_vels[1:4])
-            r2_x_e = np.array([[L1_X*cos(r2_array_poses[1]) - L1_Y*sin(r2_array_poses[1]) + L2*cos(r2_array_poses[1]+r2_array_poses[2]) + L3*cos(r2_array_poses[1]+r2_array_poses[2]+r2_array_poses[3])],\
-                            [L1_X*sin(r2_array_poses[1]) + L1_Y*cos(r2_array_poses[1]) + L2*sin(r2_array_poses[1]+r2_array_poses[2]) + L3*sin(r2_array_poses[1]+r2_array_poses[2]+r2_array_poses[3])],\
-                            [r2_array_poses[1] + r2_array_poses[2] + r2_array_poses[3]]])
+            r2_x_e = fk(r2_conf, base=ArmBase(mirrored=True, x_off=0.705))
             # Compute ee velocities from joints_vels
-            r2_J_e = np.matrix([[ 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]) - 0.047766999999999996961985715415722*cos(r2_array_poses[1,0]) + 0.14192399999999999460342792190204*sin(r2_array_poses[1,0]), 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*sin(r2_array_poses[1,0] + r2_array_poses[2,0]), 0.16036*sin(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])],\
-                                [ 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]) + 0.14192399999999999460342792190204*cos(r2_array_poses[1,0]) + 0.047766999999999996961985715415722*sin(r2_array_poses[1,0]), 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0]) + 0.14203*cos(r2_array_poses[1,0] + r2_array_poses[2,0]), 0.16036*cos(r2_array_poses[1,0] + r2_array_poses[2,0] + r2_array_poses[3,0])],\
-                                [-1.0,-1.0,-1.0]])
+            r2_J_e = jacobian(r2_conf, L3_DYN, mirrored=True)
 
             r2_v_e = np.dot(r2_J_e, r2_array_vels[1:4])
-            r2_x_e = np.array([[0.705 - r2_x_e[0,0]],[r2_x_e[1,0]],[-r2_x_e[2,0]]])
 
             #Setup offsets
             if self.first_iter:
@@ -196,19 +195,11 @@ class WindowxController():
             p_o2_dot = obj_array_vel[0:2] - r2_v_e[0:2]
             J_o1 = np.matrix([[1,0,p_o1[1,0]],[0,1,-p_o1[0,0]],[0,0,1]])
             J_o2 = np.matrix([[1,0,p_o2[1,0]],[0,1,-p_o2[0,0]],[0,0,1]])
-            J_o1_dot = np.matrix([[1,0,p_o1_dot[1,0]],[0,1,-p_o1_dot[0,0]],[0,0,1]])
-            J_o2_dot = np.matrix([[1,0,p_o2_dot[1,0]],[0,1,-p_o2_dot[0,0]],[0,0,1]])
-
-            print("\nee 1 pos:")
-            print(r1_x_e)
-            print("ee 1 vel:")
-            print(r1_v_e)
-            print("ee 2 pos:")
-            print(r2_x_e)
-            print("ee 2 vel:")
-            print(r2_v_e)
-            print("obj pos:")
-            print(obj_array_pose)
+            J_o1_dot = np.matrix([[0,0,p_o1_dot[1,0]],[0,0,-p_o1_dot[0,0]],[0,0,0]])
+            J_o2_dot = np.matrix([[0,0,p_o2_dot[1,0]],[0,0,-p_o2_dot[0,0]],[0,0,0]])
+
+            self.log.push(self.LOG_POSES, r1_x_e, r2_x_e, obj_array_pose)
+            self.log.push(self.LOG_VELOCITIES, r1_v_e, r2_v_e)
             # print("obj vel:")
             # print(obj_array_vel)
 
@@ -294,8 +285,7 @@ class WindowxController():
             # print(e_eta)
             # print("e_eps")
             # print(e_eps)
-            print("\ne:")
-            print(e)
+            self.log.push(self.LOG_ERRORS, e)
             # print("e_dot:")
             # print(e_dot)
             # print("v ref: ")
@@ -332,9 +322,7 @@ class WindowxController():
             control_torque_r1 = np.dot(r1_J_e.T, u_r1)
             control_torque_r2 = np.dot(r2_J_e.T, u_r2)
 
-            print("Torques: ")
-            print(control_torque_r1)
-            print(control_torque_r2)
+            self.log.push(self.LOG_TORQUES, control_torque_r1, control_torque_r2)
             # print(control_torque_r1 - control_torque_r2)
             #Create ROS message
             self.torques1.data = [0.0, control_torque_r1[0,0], control_torque_r1[1,0], control_torque_r1[2,0], 0.0, self.r1_close_gripper]
@@ -0,0 +1,362 @@
+#!/usr/bin/env python
+
+"""
+Control law of the cooperative state space controller (windowx_cooperative_state_space_3links_controller.py)
+evaluated on preallocated float64 buffers: every intermediate (Re1, Re2_z, J_1o, J_o1, S_eps1, e_dot1, trm1, ...)
+lives in the workspace and is updated in place with out= operations, so that the steady state
+control loop allocates no arrays.
+"""
+
+from math import sin, cos, sqrt
+import numpy as np
+from windowx_arm import *
+from windowx_dynamics import mass_matrix, coriolis, gravity
+
+def _column():
+    return np.zeros((3, 1))
+
+class CooperativeControlWorkspace(object):
+    """Buffers and in place evaluation of the cooperative controller torques"""
+    def __init__(self, m_obj, Io, p1o_in_e1, p2o_in_e2, c1, c2, x_off, Kv, Kv_dot, K_ref, K_ref_dot, KIv, Fs, Fv, period,
+                 omega_off1=0.0, omega_off2=0.0, grav=G, dynamics_cache=None):
+        #M(q) and g(q) through a windowx_dynamics_cache.DynamicsCache if given
+        self.mass_matrix = dynamics_cache.mass_matrix if dynamics_cache is not None else mass_matrix
+        self.gravity = dynamics_cache.gravity if dynamics_cache is not None else gravity
+        #Parameters, as plain float64 arrays (no np.matrix)
+        self.p1o_in_e1 = tuple(float(p) for p in np.ravel(p1o_in_e1))
+        self.p2o_in_e2 = tuple(float(p) for p in np.ravel(p2o_in_e2))
+        self.x_off = float(x_off)
+        self.base1 = ArmBase()
+        self.base2 = ArmBase(mirrored=True, x_off=x_off)
+        self.omega_off1 = float(omega_off1)
+        self.omega_off2 = float(omega_off2)
+        self.period = float(period)
+        self.Kv = np.array(Kv, dtype=np.float64)
+        self.Kv_dot = np.array(Kv_dot, dtype=np.float64)
+        self.K_ref = np.array(K_ref, dtype=np.float64)
+        self.K_ref_dot = np.array(K_ref_dot, dtype=np.float64)
+        self.KIv = np.array(KIv, dtype=np.float64)
+        self.Fs = np.array(Fs, dtype=np.float64)
+        self.Fv = np.array(Fv, dtype=np.float64)
+        go = np.array([[0.0], [m_obj*grav], [0.0]])
+        #Rotations are about the 3rd axis only: Ro*Io*Ro^T has always Io[2,2] as 3rd diagonal element
+        Mo = np.diag([m_obj, m_obj, float(np.asarray(Io)[2, 2])])
+        #Scalar factors are folded in constant matrices: multiplying by a python float allocates a numpy scalar
+        self.c1_I = float(c1)*np.identity(3)
+        self.c2_I = float(c2)*np.identity(3)
+        self.c1_Mo = float(c1)*Mo
+        self.c2_Mo = float(c2)*Mo
+        self.c1_go = float(c1)*go
+        self.c2_go = float(c2)*go
+        self.rate_I = np.identity(3)/self.period
+
+        #Robots state
+        self.q1 = np.zeros(3)
+        self.q2 = np.zeros(3)
+        self.qd1 = _column()
+        self.qd2 = _column()
+        self.qd1_flat = self.qd1[:, 0]
+        self.qd2_flat = self.qd2[:, 0]
+        self.conf1 = ArmConfiguration(self.q1)
+        self.conf2 = ArmConfiguration(self.q2)
+        self.x1 = _column()
+        self.x2 = _column()
+        self.J1 = np.zeros((3, 3))
+        self.J2 = np.zeros((3, 3))
+        self.J1_T = self.J1.T
+        self.J2_T = self.J2.T
+        self.v1 = _column()
+        self.v2 = _column()
+        #Robots dynamics
+        self.M1 = np.zeros((3, 3))
+        self.C1 = np.zeros((3, 3))
+        self.g1 = _column()
+        self.M2 = np.zeros((3, 3))
+        self.C2 = np.zeros((3, 3))
+        self.g2 = _column()
+        #Object
+        self.obj_pose1 = _column()
+        self.obj_pose2 = _column()
+        self.obj_vel1 = _column()
+        self.obj_vel2 = _column()
+        self.obj_vel_old1 = _column()
+        self.obj_vel_old2 = _column()
+        #Object-EE jacobians, only the 3rd column (and row of the inverse transposed) changes
+        self.J_o1 = np.identity(3)
+        self.J_o2 = np.identity(3)
+        self.J_o1_dot = np.zeros((3, 3))
+        self.J_o2_dot = np.zeros((3, 3))
+        self.J_o1_t_inv = np.identity(3)
+        self.J_o2_t_inv = np.identity(3)
+        #Errors and references
+        self.e_i1 = _column()
+        self.e_i2 = _column()
+        self.e_i_dot1 = _column()
+        self.e_i_dot2 = _column()
+        self.e1 = _column()
+        self.e2 = _column()
+        self.e_dot1 = _column()
+        self.e_dot2 = _column()
+        self.v_o_r1 = _column()
+        self.v_o_r2 = _column()
+        self.v_o_r_dot1 = _column()
+        self.v_o_r_dot2 = _column()
+        self.e_v1 = _column()
+        self.e_v2 = _column()
+        self.e_acc1 = _column()
+        self.e_acc2 = _column()
+        #Control terms
+        self.T = np.zeros((3, 3))
+        self.T_tmp = np.zeros((3, 3))
+        self.trm1 = _column()
+        self.trm2 = _column()
+        self.trm3 = _column()
+        self.tmp = _column()
+        self.tmp2 = _column()
+        self.u_r1 = _column()
+        self.u_r2 = _column()
+        self.tau1 = _column()
+        self.tau2 = _column()
+        self.sign = _column()
+        self.errors = [0.0, 0.0, 0.0]
+
+    def set_period(self, period):
+        """
+        Loop period of the integral terms and of the reference acceleration differences
+        """
+        self.period = float(period)
+        self.rate_I = np.identity(3)/self.period
+
+    def _robot(self, poses, vels, q, qd, conf, x, J, v, base):
+        """
+        Joints state, end effector pose in the task frame, jacobian and velocity of one robot
+        """
+        q[0] = poses[1]
+        q[1] = poses[2]
+        q[2] = poses[3]
+        qd[0, 0] = vels[1]
+        qd[1, 0] = vels[2]
+        qd[2, 0] = vels[3]
+        conf.update(q)
+        fk(conf, out=x, base=base)
+        jacobian(conf, L3_DYN, out=J, base=base)
+        np.dot(J, qd, out=v)
+
+    def _input(self, M, C, g, J_o, J_o_dot, J_o_t_inv, v_o_r, v_o_r_dot, e_v, e, e_acc, c_I, c_Mo, c_go, u):
+        """
+        End effector force u = g + (C J_o + M J_o_dot) v_o_r + M J_o v_o_r_dot + J_o^-T (c (Mo v_o_r_dot + go) - Kv e_v - c e - Kv_dot e_acc)
+        """
+        T = self.T
+        np.dot(C, J_o, out=T)
+        np.dot(M, J_o_dot, out=self.T_tmp)
+        np.add(T, self.T_tmp, out=T)
+        np.dot(T, v_o_r, out=self.trm1)
+        np.dot(M, J_o, out=T)
+        np.dot(T, v_o_r_dot, out=self.trm2)
+        #errors term
+        np.dot(self.Kv, e_v, out=self.tmp)
+        np.dot(c_I, e, out=self.tmp2)
+        np.add(self.tmp, self.tmp2, out=self.tmp)
+        np.dot(self.Kv_dot, e_acc, out=self.tmp2)
+        np.add(self.tmp, self.tmp2, out=self.tmp)
+        #reference term (load share of the object dynamics) minus errors term
+        np.dot(c_Mo, v_o_r_dot, out=self.tmp2)
+        np.add(self.tmp2, c_go, out=self.tmp2)
+        np.subtract(self.tmp2, self.tmp, out=self.tmp2)
+        np.dot(J_o_t_inv, self.tmp2, out=self.trm3)
+        np.add(g, self.trm1, out=u)
+        np.add(u, self.trm2, out=u)
+        np.add(u, self.trm3, out=u)
+
+    def _torque(self, J_T, u, qd, tau):
+        """
+        Joint torques J^T u plus static and viscous friction compensation
+        """
+        np.dot(J_T, u, out=tau)
+        np.sign(qd, out=self.sign)
+        np.dot(self.Fs, self.sign, out=self.tmp)
+        np.add(tau, self.tmp, out=tau)
+        np.dot(self.Fv, qd, out=self.tmp)
+        np.add(tau, self.tmp, out=tau)
+
+    def compute(self, r1_joints_poses, r1_joints_vels, r2_joints_poses, r2_joints_vels, target_pose, target_vel, target_acc):
+        """
+        Update the workspace with the joints state of the two robots and the object target,
+        the torques of the 2nd, 3rd and 4th joints are left in tau1 and tau2
+        """
+        x1 = self.x1
+        x2 = self.x2
+        v1 = self.v1
+        v2 = self.v2
+        self._robot(r1_joints_poses, r1_joints_vels, self.q1, self.qd1, self.conf1, x1, self.J1, v1, self.base1)
+        self._robot(r2_joints_poses, r2_joints_vels, self.q2, self.qd2, self.conf2, x2, self.J2, v2, self.base2)
+
+        #Object position from the end effectors: p_ee - Re*p_o_in_e, Re2 = Re2_z*Re2_y, Re2_y = diag(-1, 1, -1)
+        pose1 = self.obj_pose1
+        pose2 = self.obj_pose2
+        th = x1[2, 0] - self.omega_off1
+        ct = cos(th)
+        st = sin(th)
+        px, py, pz = self.p1o_in_e1
+        pose1[0, 0] = x1[0, 0] - (ct*px - st*py)
+        pose1[1, 0] = x1[1, 0] - (st*px + ct*py)
+        pose1[2, 0] = th
+        th = x2[2, 0] - self.omega_off2
+        ct = cos(th)
+        st = sin(th)
+        px, py, pz = self.p2o_in_e2
+        pose2[0, 0] = x2[0, 0] - (-ct*px - st*py)
+        pose2[1, 0] = x2[1, 0] - (-st*px + ct*py)
+        pose2[2, 0] = th
+        p_o1_x = pose2[0, 0] - x1[0, 0]
+        p_o1_y = pose2[1, 0] - x1[1, 0]
+        p_o2_x = pose2[0, 0] - x2[0, 0]
+        p_o2_y = pose2[1, 0] - x2[1, 0]
+        #Object velocity, J_1o = [[1, 0, -p_o1_y], [0, 1, p_o1_x], [0, 0, 1]]
+        vel1 = self.obj_vel1
+        vel2 = self.obj_vel2
+        vel1[0, 0] = v1[0, 0] - p_o1_y*v1[2, 0]
+        vel1[1, 0] = v1[1, 0] + p_o1_x*v1[2, 0]
+        vel1[2, 0] = v1[2, 0]
+        vel2[0, 0] = v2[0, 0] - p_o2_y*v2[2, 0]
+        vel2[1, 0] = v2[1, 0] + p_o2_x*v2[2, 0]
+        vel2[2, 0] = v2[2, 0]
+        #Object-EE jacobians, p_o_dot = v_o - v_e
+        p_o1_dot_x = vel2[0, 0] - v1[0, 0]
+        p_o1_dot_y = vel2[1, 0] - v1[1, 0]
+        p_o2_dot_x = vel2[0, 0] - v2[0, 0]
+        p_o2_dot_y = vel2[1, 0] - v2[1, 0]
+        grasp_jacobian((p_o1_x, p_o1_y), self.J_o1)
+        grasp_jacobian((p_o2_x, p_o2_y), self.J_o2)
+        grasp_jacobian_dot((p_o1_dot_x, p_o1_dot_y), self.J_o1_dot)
+        grasp_jacobian_dot((p_o2_dot_x, p_o2_dot_y), self.J_o2_dot)
+        self.J_o1_t_inv[2, 0] = -p_o1_y
+        self.J_o1_t_inv[2, 1] = p_o1_x
+        self.J_o2_t_inv[2, 0] = -p_o2_y
+        self.J_o2_t_inv[2, 1] = p_o2_x
+
+        #Robot 1 and 2 dynamics
+        self.mass_matrix(self.conf1, out=self.M1)
+        coriolis(self.conf1, self.qd1_flat, out=self.C1)
+        self.gravity(self.conf1, out=self.g1)
+        self.mass_matrix(self.conf2, mirrored=True, out=self.M2)
+        coriolis(self.conf2, self.qd2_flat, mirrored=True, out=self.C2)
+        self.gravity(self.conf2, mirrored=True, out=self.g2)
+
+        #Quaternions, rotations only about the 3rd axis: eps = [0, 0, sin(theta/2)], S_eps*eps_od = 0
+        tp_th = target_pose[2, 0]
+        tv_th = target_vel[2, 0]
+        eta_o = cos(pose2[2, 0]/2)
+        eps_o = sin(pose2[2, 0]/2)
+        c_d = cos(tp_th)
+        trace_1 = c_d + c_d + 1 + 1
+        eta_od = trace_1/(2*sqrt(trace_1))
+        eps_od = sin(tp_th/2)
+        e_eta = eta_o*eta_od + eps_o*eps_od
+        e_eps = eta_o*eps_od - eta_od*eps_o
+        period = self.period
+
+        #Robot 1 errors and reference signals
+        e_p_x = pose2[0, 0] - target_pose[0, 0]
+        e_p_y = pose2[1, 0] - target_pose[1, 0]
+        self.e_i1[0, 0] += period*e_p_x
+        self.e_i1[1, 0] += period*e_p_y
+        e_p_dot_x = pose2[0, 0] - target_vel[0, 0]
+        e_p_dot_y = pose2[1, 0] - target_vel[1, 0]
+        self.e_i_dot1[0, 0] += period*e_p_dot_x
+        self.e_i_dot1[1, 0] += period*e_p_dot_y
+        e_eps_dot = -0.5*(e_eta*(pose2[2, 0] - tv_th))
+        e = self.e1
+        e[0, 0] = e_p_x
+        e[1, 0] = e_p_y
+        e[2, 0] = -e_eps
+        e_dot = self.e_dot1
+        e_dot[0, 0] = e_p_dot_x
+        e_dot[1, 0] = e_p_dot_y
+        e_dot[2, 0] = -e_eps_dot
+        np.dot(self.K_ref, e, out=self.v_o_r1)
+        np.subtract(target_vel, self.v_o_r1, out=self.v_o_r1)
+        np.dot(self.K_ref_dot, e_dot, out=self.v_o_r_dot1)
+        np.subtract(target_acc, self.v_o_r_dot1, out=self.v_o_r_dot1)
+        np.subtract(pose2, self.v_o_r1, out=self.e_v1)
+
+        #Robot 2 errors and reference signals
+        self.e_i2[0, 0] += period*e_p_x
+        self.e_i2[1, 0] += period*e_p_y
+        e_p_dot_x = vel2[0, 0] - target_vel[0, 0]
+        e_p_dot_y = vel2[1, 0] - target_vel[1, 0]
+        self.e_i_dot2[0, 0] += period*e_p_dot_x
+        self.e_i_dot2[1, 0] += period*e_p_dot_y
+        e_eps_dot = -0.5*(e_eta*(vel2[2, 0] - tv_th))
+        e = self.e2
+        e[0, 0] = e_p_x
+        e[1, 0] = e_p_y
+        e[2, 0] = -e_eps
+        e_dot = self.e_dot2
+        e_dot[0, 0] = e_p_dot_x
+        e_dot[1, 0] = e_p_dot_y
+        e_dot[2, 0] = -e_eps_dot
+        np.dot(self.K_ref, e, out=self.v_o_r2)
+        np.subtract(target_vel, self.v_o_r2, out=self.v_o_r2)
+        np.dot(self.K_ref_dot, e_dot, out=self.v_o_r_dot2)
+        np.subtract(target_acc, self.v_o_r_dot2, out=self.v_o_r_dot2)
+        np.dot(self.KIv, self.e_i_dot2, out=self.tmp)
+        np.subtract(self.v_o_r_dot2, self.tmp, out=self.v_o_r_dot2)
+        np.subtract(vel2, self.v_o_r2, out=self.e_v2)
+
+        #Accelerations by finite differences
+        np.subtract(vel2, self.obj_vel_old2, out=self.tmp)
+        np.dot(self.rate_I, self.tmp, out=self.e_acc2)
+        np.subtract(self.e_acc2, target_acc, out=self.e_acc2)
+        np.copyto(self.obj_vel_old2, vel2)
+        np.subtract(pose2, self.obj_vel_old1, out=self.tmp)
+        np.dot(self.rate_I, self.tmp, out=self.e_acc1)
+        np.subtract(self.e_acc1, target_acc, out=self.e_acc1)
+        np.copyto(self.obj_vel_old1, pose2)
+
+        #Control inputs
+        self._input(self.M1, self.C1, self.g1, self.J_o1, self.J_o1_dot, self.J_o1_t_inv, self.v_o_r1, self.v_o_r_dot1,
+                    self.e_v1, self.e1, self.e_acc1, self.c1_I, self.c1_Mo, self.c1_go, self.u_r1)
+        self._input(self.M2, self.C2, self.g2, self.J_o2, self.J_o2_dot, self.J_o2_t_inv, self.v_o_r2, self.v_o_r_dot2,
+                    self.e_v2, self.e2, self.e_acc2, self.c2_I, self.c2_Mo, self.c2_go, self.u_r2)
+        self._torque(self.J1_T, self.u_r1, self.qd1, self.tau1)
+        self._torque(self.J2_T, self.u_r2, self.qd2, self.tau2)
+
+        self.errors[0] = self.e2[0, 0]
+        self.errors[1] = self.e2[1, 0]
+        self.errors[2] = pose2[2, 0] - tp_th
+
+
+if __name__ == '__main__':
+    #Steady state allocation check: after warm up the control loop must not allocate arrays
+    import tracemalloc
+    from itertools import repeat
+    import timeit
+    ws = CooperativeControlWorkspace(0.062, np.diag([6.5e-5]*3), [[-0.04], [0], [0]], [[-0.04], [0], [0]], 0.5, 0.5, 0.603,
+                                     np.diag([3.5, 0.5, 0.3]), np.zeros((3, 3)), np.diag([100, 90, 100]), np.diag([5, 2, 40]),
+                                     np.zeros((3, 3)), np.diag([0.0843, 0.0843, 0.0078]), np.diag([0.0347, 0.0347, 0.0362]), 1.0/160)
+    r1_poses = (0.0, 0.3, -1.2, 0.4, 0.0, 0.0)
+    r2_poses = (0.0, 0.3, -1.2, 0.4, 0.0, 0.0)
+    vels = (0.0, 0.1, -0.2, 0.05, 0.0)
+    target_pose = np.array([[0.303], [0.12], [0.0]])
+    target_vel = np.zeros((3, 1))
+    target_acc = np.zeros((3, 1))
+    loop = lambda: ws.compute(r1_poses, vels, r2_poses, vels, target_pose, target_vel, target_acc)
+    #Python floats of the straight-line generated code are the only per tick allocations: after warm up
+    #the traced memory must not grow with the ticks (a few bytes of loop counter aside) and the transient peak
+    #must stay below the scalar temporaries of one generated function (~2 KB), where the np.matrix version
+    #created ~60 arrays per tick
+    tracemalloc.start()
+    for i in repeat(None, 1000):
+        loop()
+    start, peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    for i in repeat(None, 1000):
+        loop()
+    end, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("steady state, 1000 ticks: retained %d bytes, transient peak %d bytes" % (end - start, peak - start))
+    assert end - start < 256, "the control loop retains memory"
+    assert peak - start < 2500, "the control loop allocates arrays"
+    n = 5000
+    print("compute: %.1f us per tick" % (timeit.timeit(loop, number=n) / n * 1e6))
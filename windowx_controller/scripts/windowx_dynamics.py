@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+
+"""
+End effector space dynamics of the 3 links windowx arm: M(q) x_ddot + C(q, q_dot) x_dot + g(q) = u.
+q is the ArmConfiguration of the tick (or the angles of the 2nd, 3rd and 4th joints),
+q_dot the velocities of the same joints.
+A configuration built from a (N, 3) array, with q_dot (N, 3), returns (N, 3, 3) and (N, 3) stacks.
+With out, a preallocated array of the result, a single configuration is evaluated in place.
+With mirrored=True the matrices are expressed in the frame of the arm mounted in front
+of the first one (x and orientation flipped), as used for robot 2 in the cooperative controllers.
+
+GENERATED by compute_dynamic_matrices_3links.py, do not edit by hand.
+Parameters hash: 22482a704c85a2d1401c9e6538dd1f20a84ed7bc
+"""
+
+from windowx_arm import as_configuration
+
+def mass_matrix(q, mirrored=False, out=None):
+    """
+    End effector space inertia matrix M(q), 3x3
+    """
+    conf = as_configuration(q)
+    s1 = conf.s1
+    c1 = conf.c1
+    s12 = conf.s12
+    c12 = conf.c12
+    s123 = conf.s123
+    c123 = conf.c123
+    x0 = 0.0011314745024*c123**2 + 0.0011314745024*s123**2 + 0.001508836702189682
+    x1 = 0.141924*c1 + 0.047767*s1
+    x2 = 0.006784347009999999*c1*c12 + 0.020157465719999997*c1*s12 - 0.020157465719999997*c12*s1 + 0.006784347009999999*s1*s12
+    x3 = 1/x2
+    x4 = x1*x3
+    x5 = 0.01411168*c123
+    x6 = 0.024997279999999997*c12 + x5
+    x7 = 0.08018*c123
+    x8 = 0.01411168*s123
+    x9 = 0.024997279999999997*s12 + x8
+    x10 = -x9
+    x11 = 0.08018*s123
+    x12 = -x10*x11 + x6*x7 + 0.0015480109082086355
+    x13 = 0.14203*c12
+    x14 = x1 + x13
+    x15 = -x14*x3
+    x16 = 0.024978623999999998*c1 + 0.008406991999999999*s1 + x6
+    x17 = 0.008406991999999999*c1 - 0.024978623999999998*s1 - x9
+    x18 = -x11*x17 + x16*x7 + 0.0015480109082086355
+    x19 = x13*x3
+    x20 = x0*x4 + x12*x15 + x18*x19
+    x21 = x13 + x7
+    x22 = 0.14203*s12
+    x23 = x11 + x22
+    x24 = -x23
+    x25 = x21*x5 - x24*x8 + 0.0015480109082086355
+    x26 = 0.0019819501784249997*c12**2 + 0.0019819501784249997*s12**2 + x10*x24 + x21*x6 + 0.0095191922615
+    x27 = 0.0043319149999999996*c12
+    x28 = 0.008657363999999999*c1 + 0.0029137869999999997*s1 + x27
+    x29 = 0.071015*c12
+    x30 = 0.01178849*c12
+    x31 = 0.011779692*c1 + 0.0039646609999999995*s1 + x30
+    x32 = 0.0043319149999999996*s12
+    x33 = 0.0029137869999999997*c1 - 0.008657363999999999*s1 - x32
+    x34 = 0.071015*s12
+    x35 = 0.01178849*s12
+    x36 = 0.0039646609999999995*c1 - 0.011779692*s1 - x35
+    x37 = x13*x31 + x16*x21 + x17*x24 - x22*x36 + x28*x29 - x33*x34 + 0.0095958072615
+    x38 = x15*x26 + x19*x37 + x25*x4
+    x39 = x1 + x21
+    x40 = 0.141924*s1
+    x41 = 0.047767*c1
+    x42 = x40 - x41
+    x43 = -x23 - x42
+    x44 = x39*x5 - x43*x8 + 0.0015480109082086355
+    x45 = x1 + x29
+    x46 = -x22 - x42
+    x47 = -x34 - x42
+    x48 = x10*x43 + x14*x30 + x27*x45 - x32*x47 - x35*x46 + x39*x6 + 0.0095958072615
+    x49 = -x40 + x41
+    x50 = x1*(0.019443588*c1 + 0.006544079*s1) + x14*x31 + x16*x39 + x17*x43 + x28*x45 + x33*x47 + x36*x46 + x49*(0.006544079*c1 - 0.019443588*s1) + (0.00023883499999999996*c1 - 0.005960808*s1)*(0.002843273809523809*c1 - 0.070962*s1) + (0.005960808*c1 + 0.00023883499999999996*s1)*(0.070962*c1 + 0.002843273809523809*s1) + 0.025477124077892696
+    x51 = x15*x48 + x19*x50 + x4*x44
+    x52 = -x49
+    x53 = x20*x3
+    x54 = x3*x38
+    x55 = x22*x3
+    x56 = 0.00765991612*c1*c123 + 0.02275893264*c1*s123 - 0.02275893264*c123*s1 + 0.00765991612*s1*s123
+    x57 = x2 + x56
+    x58 = 0.0227759308*c12*s123 - 0.0227759308*c123*s12
+    x59 = -x56 - x58
+    x60 = x3*x58
+    x61 = x3*x52
+    x62 = x3*x46
+    x63 = x0*x61 + x12*x62 + x18*x55
+    x64 = x25*x61 + x26*x62 + x37*x55
+    x65 = x44*x61 + x48*x62 + x50*x55
+    x66 = x3*x57
+    x67 = x3*x59
+    x68 = x0*x66 + x12*x67 + x18*x60
+    x69 = x25*x66 + x26*x67 + x37*x60
+    x70 = x44*x66 + x48*x67 + x50*x60
+    m00 = x15*x38 + x19*x51 + x20*x4
+    m01 = x46*x54 + x51*x55 + x52*x53
+    m02 = x51*x60 + x53*x57 + x54*x59
+    m10 = x15*x64 + x19*x65 + x4*x63
+    m11 = x55*x65 + x61*x63 + x62*x64
+    m12 = x60*x65 + x63*x66 + x64*x67
+    m20 = x15*x69 + x19*x70 + x4*x68
+    m21 = x55*x70 + x61*x68 + x62*x69
+    m22 = x60*x70 + x66*x68 + x67*x69
+    if mirrored:
+        m01 = -m01
+        m10 = -m10
+        m12 = -m12
+        m21 = -m21
+    if out is None:
+        return conf.array([[m00, m01, m02], [m10, m11, m12], [m20, m21, m22]])
+    out[0, 0] = m00
+    out[0, 1] = m01
+    out[0, 2] = m02
+    out[1, 0] = m10
+    out[1, 1] = m11
+    out[1, 2] = m12
+    out[2, 0] = m20
+    out[2, 1] = m21
+    out[2, 2] = m22
+    return out
+
+
+def coriolis(q, q_dot, mirrored=False, out=None):
+    """
+    End effector space centrifugal and Coriolis matrix C(q, q_dot), 3x3
+    """
+    conf = as_configuration(q)
+    s1 = conf.s1
+    c1 = conf.c1
+    s12 = conf.s12
+    c12 = conf.c12
+    s123 = conf.s123
+    c123 = conf.c123
+    q_dot = conf.columns(q_dot)
+    x0 = 0.16036*c123
+    x1 = q_dot[2]*x0
+    x2 = -q_dot[0]*x0 - q_dot[1]*x0 - x1
+    x3 = 0.141924*c1 + 0.047767*s1
+    x4 = 0.006784347009999999*c1*c12 + 0.020157465719999997*c1*s12 - 0.020157465719999997*c12*s1 + 0.006784347009999999*s1*s12
+    x5 = 1/x4
+    x6 = x5*(0.0011314745024*c123**2 + 0.0011314745024*s123**2 + 0.001508836702189682)
+    x7 = 0.14203*c12
+    x8 = x3 + x7
+    x9 = -x8
+    x10 = 0.08018*c123
+    x11 = x10 + x7
+    x12 = 0.01411168*c123
+    x13 = 0.14203*s12
+    x14 = 0.08018*s123
+    x15 = x13 + x14
+    x16 = -x15
+    x17 = 0.01411168*s123
+    x18 = x5*(x11*x12 - x16*x17 + 0.0015480109082086355)
+    x19 = x11 + x3
+    x20 = 0.141924*s1
+    x21 = 0.047767*c1
+    x22 = x20 - x21
+    x23 = -x15 - x22
+    x24 = x5*(x12*x19 - x17*x23 + 0.0015480109082086355)
+    x25 = x18*x9 + x24*x7 + x3*x6
+    x26 = 0.16036*s123
+    x27 = q_dot[2]*x26
+    x28 = -q_dot[0]*x26 - q_dot[1]*x26 - x27
+    x29 = -x20 + x21
+    x30 = -x29
+    x31 = -x13 - x22
+    x32 = x13*x24 + x18*x31 + x30*x6
+    x33 = -x2*x25 - x28*x32
+    x34 = x3*x5
+    x35 = 0.024997279999999997*s12 + x17
+    x36 = -x35
+    x37 = 0.024997279999999997*c12 + x12
+    x38 = x14*x37
+    x39 = x10*x36 + x38
+    x40 = 0.04009*c123
+    x41 = x36*x40
+    x42 = 0.00705584*c123
+    x43 = x16*x42
+    x44 = -x37
+    x45 = 0.04009*s123
+    x46 = -x11
+    x47 = -0.00705584*s123*x46 + x43 + x44*x45
+    x48 = -x38 - x41 - x47
+    x49 = x10*x37 - x14*x36 + 0.0015480109082086355
+    x50 = x5*(0.0019819501784249997*c12**2 + 0.0019819501784249997*s12**2 + x11*x37 + x16*x36 + 0.0095191922615)
+    x51 = 0.071015*c12
+    x52 = x3 + x51
+    x53 = 0.0043319149999999996*c12
+    x54 = 0.01178849*c12
+    x55 = 0.01178849*s12
+    x56 = 0.071015*s12
+    x57 = -x22 - x56
+    x58 = 0.0043319149999999996*s12
+    x59 = x5*(x19*x37 + x23*x36 - x31*x55 + x52*x53 + x54*x8 - x57*x58 + 0.0095958072615)
+    x60 = x34*x49 + x50*x9 + x59*x7
+    x61 = x30*x5
+    x62 = x13*x59 + x31*x50 + x49*x61
+    x63 = q_dot[0]*x48 + q_dot[1]*x48 - q_dot[2]*x39 - x2*x60 - x28*x62
+    x64 = x5*x9
+    x65 = 0.008406991999999999*c1 - 0.024978623999999998*s1 - x35
+    x66 = 0.024978623999999998*c1 + 0.008406991999999999*s1 + x37
+    x67 = x14*x66
+    x68 = x10*x65 + x67
+    x69 = -x41
+    x70 = x40*x65
+    x71 = x23*x42
+    x72 = -x19
+    x73 = -x66
+    x74 = x10*x66 - x14*x65 + 0.0015480109082086355
+    x75 = 0.008657363999999999*c1 + 0.0029137869999999997*s1 + x53
+    x76 = 0.011779692*c1 + 0.0039646609999999995*s1 + x54
+    x77 = 0.0029137869999999997*c1 - 0.008657363999999999*s1 - x58
+    x78 = 0.0039646609999999995*c1 - 0.011779692*s1 - x55
+    x79 = x11*x66 - x13*x78 + x16*x65 + x51*x75 - x56*x77 + x7*x76 + 0.0095958072615
+    x80 = 0.00023883499999999996*c1 - 0.005960808*s1
+    x81 = 0.002843273809523809*c1 - 0.070962*s1
+    x82 = 0.005960808*c1 + 0.00023883499999999996*s1
+    x83 = 0.070962*c1 + 0.002843273809523809*s1
+    x84 = 0.006544079*c1 - 0.019443588*s1
+    x85 = 0.019443588*c1 + 0.006544079*s1
+    x86 = x5*(x19*x66 + x23*x65 + x29*x84 + x3*x85 + x31*x78 + x52*x75 + x57*x77 + x76*x8 + x80*x81 + x82*x83 + 0.025477124077892696)
+    x87 = x34*x74 + x64*x79 + x7*x86
+    x88 = x31*x5
+    x89 = x13*x86 + x61*x74 + x79*x88
+    x90 = q_dot[0]*(0.00705584*s123*x72 - x45*x73 - x67 - x70 - x71) + q_dot[1]*(-x47 - x68 - x69) - q_dot[2]*x68 - x2*x87 - x28*x89
+    x91 = x5*x7
+    x92 = x33*x34 + x63*x64 + x90*x91
+    x93 = x37*x45
+    x94 = 0.00705584*s123
+    x95 = x11*x94
+    x96 = x43 + x95
+    x97 = x69 - x93 + x96
+    x98 = -x17*x46
+    x99 = x41 + x93
+    x100 = x43 - x95 + x98 + x99
+    x101 = x0 + x7
+    x102 = -x101
+    x103 = q_dot[1]*x102 - x1
+    x104 = q_dot[0]*x102 + x103
+    x105 = x13 + x26
+    x106 = -x105
+    x107 = q_dot[1]*x106 - x27
+    x108 = q_dot[0]*x106 + x107
+    x109 = q_dot[0]*x100 + q_dot[1]*x100 - q_dot[2]*x97 - x104*x25 - x108*x32
+    x110 = x16*x37
+    x111 = x36*x46
+    x112 = (1/2)*x110 + (1/2)*x111
+    x113 = (1/2)*x11*x36 + x112 + (1/2)*x16*x44
+    x114 = q_dot[0]*x113 + q_dot[1]*x113 + q_dot[2]*(-x96 - x99) - x104*x60 - x108*x62
+    x115 = x13*x76 - x16*x66 - x46*x65 + x56*x75
+    x116 = x23*x37
+    x117 = x36*x72
+    x118 = -x75
+    x119 = 0.0355075*s12
+    x120 = -x76
+    x121 = -x52
+    x122 = 0.0355075*c12*x77
+    x123 = x51*x78
+    x124 = 0.0021659574999999998*c12*x57
+    x125 = 0.005894245*c12*x31
+    x126 = x122 + x123 + x124 + x125
+    x127 = q_dot[0]*(0.0021659574999999998*s12*x121 + 0.005894245*s12*x9 + (1/2)*x11*x65 - x115 - 1/2*x116 - 1/2*x117 - x118*x119 - x120*x56 - x126 + (1/2)*x16*x73) + q_dot[1]*(2.168404344971009e-19*c12*s12 + (1/2)*x11*x36 - x112 - x115 + (1/2)*x16*x44 - x51*x77 - x7*x78) + q_dot[2]*(-x68 - x97) - x104*x87 - x108*x89
+    x128 = x109*x34 + x114*x64 + x127*x91
+    x129 = x19*x94
+    x130 = x45*x66
+    x131 = x130 + x70
+    x132 = -x129 + x131
+    x133 = x132 - x71
+    x134 = q_dot[0]*(-x101 - x3) + x103
+    x135 = q_dot[0]*(-x105 - x22) + x107
+    x136 = q_dot[0]*(x132 - x17*x72 + x71) + q_dot[1]*(x12*x16 + x133 + x98) + q_dot[2]*x133 - x134*x25 - x135*x32
+    x137 = x129 + x71
+    x138 = x119*x75 - 1/2*x16*x66 - 1/2*x46*x65 + x56*x76
+    x139 = (1/2)*x23
+    x140 = (1/2)*x19
+    x141 = 0.0021659574999999998*s12*x52
+    x142 = 0.005894245*s12*x8
+    x143 = x139*x44 + x140*x36 - x141 - x142
+    x144 = x126 + x138
+    x145 = q_dot[0]*(x116 + x117 - x121*x58 + x143 + x144 - x55*x9) + q_dot[1]*(x110 + x111 + x122 + x123 - x124 - x125 + x138 + x143) + q_dot[2]*(x130 - x137 - x39 + x70) - x134*x60 - x135*x62
+    x146 = (1/2)*x84
+    x147 = (1/2)*x80
+    x148 = (1/2)*x29
+    x149 = (1/2)*x81
+    x150 = (1/2)*x78
+    x151 = (1/2)*x77
+    x152 = (1/2)*x31
+    x153 = (1/2)*x57
+    x154 = q_dot[0]*(x118*x153 + x120*x152 + x121*x151 + x139*x66 + x139*x73 + x140*x65 + x150*x8 + x150*x9 + x151*x52 + x152*x76 + x153*x75 + (1/2)*x65*x72) + q_dot[1]*(-x141 - x142 - x144 + (1/2)*x19*x36 + (1/2)*x23*x44) + q_dot[2]*(-x131 - x137) - x134*x87 - x135*x89
+    x155 = x136*x34 + x145*x64 + x154*x91
+    x156 = x13*x5
+    x157 = 0.00765991612*c1*c123 + 0.02275893264*c1*s123 - 0.02275893264*c123*s1 + 0.00765991612*s1*s123
+    x158 = x5*(x157 + x4)
+    x159 = 0.0227759308*c12*s123 - 0.0227759308*c123*s12
+    x160 = x5*(-x157 - x159)
+    x161 = x159*x5
+    x162 = x156*x90 + x33*x61 + x63*x88
+    x163 = x109*x61 + x114*x88 + x127*x156
+    x164 = x136*x61 + x145*x88 + x154*x156
+    x165 = x158*x33 + x160*x63 + x161*x90
+    x166 = x109*x158 + x114*x160 + x127*x161
+    x167 = x136*x158 + x145*x160 + x154*x161
+    m00 = x128*x64 + x155*x91 + x34*x92
+    m01 = x128*x88 + x155*x156 + x61*x92
+    m02 = x128*x160 + x155*x161 + x158*x92
+    m10 = x162*x34 + x163*x64 + x164*x91
+    m11 = x156*x164 + x162*x61 + x163*x88
+    m12 = x158*x162 + x160*x163 + x161*x164
+    m20 = x165*x34 + x166*x64 + x167*x91
+    m21 = x156*x167 + x165*x61 + x166*x88
+    m22 = x158*x165 + x160*x166 + x161*x167
+    if mirrored:
+        m01 = -m01
+        m10 = -m10
+        m12 = -m12
+        m21 = -m21
+    if out is None:
+        return conf.array([[m00, m01, m02], [m10, m11, m12], [m20, m21, m22]])
+    out[0, 0] = m00
+    out[0, 1] = m01
+    out[0, 2] = m02
+    out[1, 0] = m10
+    out[1, 1] = m11
+    out[1, 2] = m12
+    out[2, 0] = m20
+    out[2, 1] = m21
+    out[2, 2] = m22
+    return out
+
+
+def gravity(q, mirrored=False, out=None):
+    """
+    End effector space gravity vector g(q), 3x1 column
+    """
+    conf = as_configuration(q)
+    s1 = conf.s1
+    c1 = conf.c1
+    s12 = conf.s12
+    c12 = conf.c12
+    s123 = conf.s123
+    c123 = conf.c123
+    x0 = 0.141924*c1 + 0.047767*s1
+    x1 = 0.006784347009999999*c1*c12 + 0.020157465719999997*c1*s12 - 0.020157465719999997*c12*s1 + 0.006784347009999999*s1*s12
+    x2 = 1/x1
+    x3 = 0.1384355808*c123
+    x4 = x2*x3
+    x5 = 0.14203*c12
+    x6 = 0.40336448985*c12 + x3
+    x7 = x2*(0.6947449455600001*c1 + 0.21649055274*s1 + x6)
+    x8 = x2*x6
+    x9 = 0.047767*c1
+    x10 = 0.141924*s1
+    x11 = 0.14203*s12
+    x12 = 0.0227759308*c12*s123 - 0.0227759308*c123*s12
+    x13 = 0.00765991612*c1*c123 + 0.02275893264*c1*s123 - 0.02275893264*c123*s1 + 0.00765991612*s1*s123
+    m00 = x0*x4 + x5*x7 + x8*(-x0 - x5)
+    m10 = x11*x7 + x4*(x10 - x9) + x8*(-x10 - x11 + x9)
+    m20 = x12*x7 + x4*(x1 + x13) + x8*(-x12 - x13)
+    if mirrored:
+        m00 = -m00
+        m20 = -m20
+    if out is None:
+        return conf.array([[m00], [m10], [m20]])
+    out[0, 0] = m00
+    out[1, 0] = m10
+    out[2, 0] = m20
+    return out
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+"""
+Per sample cost of the dynamics and kinematics of the 3 links arm:
+scalar calls in a python loop against one vectorized call over a (N, 3) batch.
+Usage: windowx_dynamics_benchmark.py [N]
+"""
+
+import sys
+import timeit
+import numpy as np
+from windowx_arm import *
+from windowx_dynamics import mass_matrix, coriolis, gravity
+
+def scalar(q, q_dot):
+    M = np.empty((q.shape[0], 3, 3))
+    C = np.empty((q.shape[0], 3, 3))
+    g = np.empty((q.shape[0], 3))
+    x = np.empty((q.shape[0], 3))
+    J = np.empty((q.shape[0], 3, 3))
+    for i in range(q.shape[0]):
+        conf = ArmConfiguration(q[i])
+        M[i] = mass_matrix(conf)
+        C[i] = coriolis(conf, q_dot[i])
+        g[i] = gravity(conf)[:, 0]
+        x[i] = fk(conf)[:, 0]
+        J[i] = jacobian(conf, L3_DYN)
+    return M, C, g, x, J
+
+def batch(q, q_dot):
+    conf = ArmConfiguration(q)
+    return mass_matrix(conf), coriolis(conf, q_dot), gravity(conf), fk(conf), jacobian(conf, L3_DYN)
+
+
+if __name__ == '__main__':
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    np.random.seed(0)
+    q = np.random.uniform([-1.5, 0.2, -1.5], [1.2, 1.5, 1.2], (N, 3))
+    q_dot = np.random.uniform(-1.0, 1.0, (N, 3))
+
+    ref = scalar(q, q_dot)
+    out = batch(q, q_dot)
+    for name, a, b in zip(['M', 'C', 'g', 'fk', 'J'], ref, out):
+        print("%-3s max relative difference: %g" % (name, np.max(np.abs(a - b)) / np.max(np.abs(a))))
+
+    repeat = 3
+    t_scalar = min(timeit.repeat(lambda: scalar(q, q_dot), number=1, repeat=repeat)) / N
+    t_batch = min(timeit.repeat(lambda: batch(q, q_dot), number=1, repeat=repeat)) / N
+    print("N = %d, M + C + g + fk + J per sample:" % N)
+    print("  scalar loop: %8.3f us" % (t_scalar*1e6))
+    print("  batch:       %8.3f us  (x%.1f)" % (t_batch*1e6, t_scalar/t_batch))
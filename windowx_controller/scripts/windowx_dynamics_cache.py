@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+"""
+Memoization of the end effector space dynamics on the encoder steps. The joints positions sent by
+the drivers are multiples of MX_POS_UNIT (4096 steps per revolution), on slow trajectories the
+steps of the 2nd, 3rd and 4th joints are the same for many ticks: DynamicsCache keeps the last
+capacity evaluations of M(q) and g(q) keyed on (steps, mirrored), least recently used dropped first.
+A position that is not on a step (simulators) is rounded to the nearest one, an error of at most
+half a step; enabled=False bypasses the cache. Batches of configurations are not cached.
+"""
+
+from math import pi
+from collections import OrderedDict
+from windowx_arm import as_configuration
+from windowx_dynamics import mass_matrix, gravity
+
+#MX_POS_UNIT of the driver servos_parameters
+ENCODER_STEP = 2*pi/4096
+
+class DynamicsCache():
+    """LRU caches of mass_matrix and gravity of windowx_dynamics, same signatures"""
+    def __init__(self, capacity=256, enabled=True, step=ENCODER_STEP):
+        self.capacity = int(capacity)
+        self.enabled = enabled
+        self.step = step
+        self.tables = {'M': OrderedDict(), 'g': OrderedDict()}
+        self.hits = {'M': 0, 'g': 0}
+        self.misses = {'M': 0, 'g': 0}
+
+    def key(self, conf, mirrored):
+        q1, q2, q3 = conf.q
+        return (int(round(q1/self.step)), int(round(q2/self.step)), int(round(q3/self.step)), bool(mirrored))
+
+    def _lookup(self, name, function, q, mirrored, out):
+        conf = as_configuration(q)
+        if not self.enabled or conf.n is not None or self.capacity <= 0:
+            return function(conf, mirrored, out)
+        table = self.tables[name]
+        key = self.key(conf, mirrored)
+        value = table.pop(key, None)
+        if value is None:
+            self.misses[name] += 1
+            value = function(conf, mirrored)
+            if len(table) >= self.capacity:
+                table.popitem(last=False)
+        else:
+            self.hits[name] += 1
+        #Most recently used last
+        table[key] = value
+        if out is None:
+            return value.copy()
+        out[...] = value
+        return out
+
+    def mass_matrix(self, q, mirrored=False, out=None):
+        """
+        End effector space inertia matrix M(q), 3x3
+        """
+        return self._lookup('M', mass_matrix, q, mirrored, out)
+
+    def gravity(self, q, mirrored=False, out=None):
+        """
+        End effector space gravity vector g(q), 3x1
+        """
+        return self._lookup('g', gravity, q, mirrored, out)
+
+    def hit_rate(self, name):
+        lookups = self.hits[name] + self.misses[name]
+        return float(self.hits[name]) / lookups if lookups else 0.0
+
+    def clear(self):
+        for table in self.tables.values():
+            table.clear()
+
+    def summary(self):
+        """
+        List of (key, value) of the counters, for the loop probe reports
+        """
+        values = [('dynamics cache', 'on (%d entries)' % self.capacity if self.enabled else 'bypassed')]
+        for name in ('M', 'g'):
+            values.append(('%s cache hits' % name, self.hits[name]))
+            values.append(('%s cache misses' % name, self.misses[name]))
+            values.append(('%s cache hit rate' % name, '%.3f' % self.hit_rate(name)))
+        return values
+
+
+if __name__ == '__main__':
+    #Hit rate and cost per tick on a slow joint trajectory read at 150Hz with the encoder quantization,
+    #40s of an object circle of 100s like windowx_coop_circle.py
+    import timeit
+    import numpy as np
+    from windowx_arm import ArmConfiguration
+    t = np.arange(0.0, 40.0, 1.0/150)
+    w = 2*pi/100.0
+    q = np.column_stack([-1.0 + 0.25*np.sin(w*t), 1.2 + 0.3*np.cos(w*t), -0.4 - 0.2*np.sin(w*t)])
+    q = np.round(q/ENCODER_STEP)*ENCODER_STEP
+    confs = [ArmConfiguration(row) for row in q]
+    M = np.zeros((3, 3))
+    g = np.zeros((3, 1))
+    def run(cache):
+        for conf in confs:
+            for mirrored in (False, True):
+                cache.mass_matrix(conf, mirrored, out=M)
+                cache.gravity(conf, mirrored, out=g)
+    for capacity in (1, 16, 256):
+        cache = DynamicsCache(capacity)
+        run(cache)
+        print("capacity %3d: M hit rate %.3f, g hit rate %.3f" % (capacity, cache.hit_rate('M'), cache.hit_rate('g')))
+    error = 0.0
+    cache = DynamicsCache()
+    for conf in confs[::50]:
+        error = max(error, np.max(np.abs(cache.mass_matrix(conf) - mass_matrix(conf))), np.max(np.abs(cache.gravity(conf) - gravity(conf))))
+    print("max difference from the direct evaluation: %g" % error)
+    n = 2*len(confs)
+    t_direct = min(timeit.repeat(lambda: run(DynamicsCache(enabled=False)), number=1, repeat=3)) / n
+    t_cached = min(timeit.repeat(lambda: run(DynamicsCache()), number=1, repeat=3)) / n
+    print("M + g per arm and tick: direct %.1f us, cached %.1f us" % (t_direct*1e6, t_cached*1e6))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+
+"""
+Gravity vector g(q) of windowx_dynamics tabulated on a grid of the joints box, an offline utility
+for batch evaluations and interpolation error maps of g over the box.
+build_table evaluates the grid and saves it as a .npy (steps1 x steps2 x steps3 x 3) with the box in
+a <name>_box.npy next to it; GravityTable maps it read only (np.load mmap_mode) and interpolates
+trilinearly (order=1) or with 4 points Lagrange cubics along each joint (order=3). g(q) is J^-T of the
+joint torques and diverges at the stretched elbow (q2 = -0.325 rad), the default box stops at the
+driver shutdown threshold of -0.45 rad: the largest interpolation errors are at that side, max_error
+reports them. Configurations out of the box are evaluated with the analytic expression.
+The interpolation is not faster than the generated expression, neither for a single configuration
+(~7-10 us against ~1 us) nor for a batch (__main__): the controllers call windowx_dynamics.gravity
+(or windowx_dynamics_cache) per tick.
+Usage: windowx_gravity_table.py [PATH] [STEPS]
+"""
+
+import os
+import numpy as np
+from windowx_arm import ArmConfiguration
+from windowx_dynamics import gravity
+
+#Joints box around the cooperative working pose (q = 2.09, -2.29, 0.19 rad at the initial pose)
+BOX_LOWER = (0.8, -2.9, -1.6)
+BOX_UPPER = (3.2, -0.45, 1.6)
+
+def box_path(path):
+    return os.path.splitext(path)[0] + '_box.npy'
+
+def build_table(path, steps=64, lower=BOX_LOWER, upper=BOX_UPPER):
+    """
+    Evaluate g(q) on steps points per joint over [lower, upper] and save the table in path
+    """
+    axes = [np.linspace(l, u, steps) for l, u in zip(lower, upper)]
+    grid = np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, 3)
+    table = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(steps, steps, steps, 3))
+    #One batch per value of the first joint
+    chunk = steps*steps
+    for i in range(steps):
+        table[i] = gravity(ArmConfiguration(grid[i*chunk:(i + 1)*chunk])).reshape(steps, steps, 3)
+    table.flush()
+    del table
+    np.save(box_path(path), np.array([lower, upper], dtype=np.float64))
+    return path
+
+
+class GravityTable():
+    """Interpolation of a table of build_table, same signature as windowx_dynamics.gravity"""
+    def __init__(self, path, order=1):
+        if order not in (1, 3):
+            raise ValueError("Interpolation order must be 1 (trilinear) or 3 (cubic), not %s" % order)
+        self.path = path
+        self.order = order
+        self.table = np.load(path, mmap_mode='r')
+        #Same mapped buffer without the np.memmap overhead on the small reads of a single configuration
+        self.values = self.table.view(np.ndarray)
+        self.lower, self.upper = np.load(box_path(path))
+        self.shape = np.array(self.table.shape[:3])
+        self.h = (self.upper - self.lower) / (self.shape - 1)
+        self.outside = 0
+
+    def _weights(self, x, axis):
+        """
+        First grid index and interpolation weights of the coordinates x along axis, (N,) and (N, order + 1)
+        """
+        n = self.shape[axis]
+        u = (x - self.lower[axis]) / self.h[axis]
+        if self.order == 1:
+            i = np.clip(np.floor(u).astype(int), 0, n - 2)
+            t = (u - i)[:, None]
+            return i, np.hstack([1 - t, t])
+        #Nodes i-1, i, i+1, i+2 around the cell, shifted inside the grid at the edges
+        i = np.clip(np.floor(u).astype(int), 1, n - 3)
+        t = (u - i)[:, None]
+        return i - 1, np.hstack([-t*(t - 1)*(t - 2)/6, (t + 1)*(t - 1)*(t - 2)/2, -(t + 1)*t*(t - 2)/2, (t + 1)*t*(t - 1)/6])
+
+    def interpolate(self, q):
+        """
+        Interpolated g of the (N, 3) joint angles, (N, 3)
+        """
+        k = np.arange(self.order + 1)
+        (i0, w0), (i1, w1), (i2, w2) = [self._weights(q[:, axis], axis) for axis in range(3)]
+        values = self.values[(i0[:, None] + k)[:, :, None, None], (i1[:, None] + k)[:, None, :, None], (i2[:, None] + k)[:, None, None, :]]
+        weights = w0[:, :, None, None]*w1[:, None, :, None]*w2[:, None, None, :]
+        return np.einsum('nabc,nabcj->nj', weights, values)
+
+    def contains(self, q):
+        return np.all((q >= self.lower) & (q <= self.upper), axis=-1)
+
+    def gravity(self, q, mirrored=False):
+        """
+        End effector space gravity vector g(q) of the (N, 3) joint angles (or their ArmConfiguration), (N, 3)
+        """
+        angles = np.column_stack(q.q) if isinstance(q, ArmConfiguration) else np.asarray(q, dtype=np.float64)
+        inside = self.contains(angles)
+        g = self.interpolate(angles)
+        if not np.all(inside):
+            self.outside += int(np.sum(~inside))
+            g[~inside] = gravity(ArmConfiguration(angles[~inside]))
+        if mirrored:
+            g[:, 0] = -g[:, 0]
+            g[:, 2] = -g[:, 2]
+        return g
+
+    def max_error(self, samples=20000, seed=0):
+        """
+        Max absolute difference from the analytic g per component, on random configurations of the box
+        """
+        q = np.random.RandomState(seed).uniform(self.lower, self.upper, (samples, 3))
+        return np.max(np.abs(self.interpolate(q) - gravity(ArmConfiguration(q))), axis=0)
+
+
+if __name__ == '__main__':
+    #Build a table, then errors and cost of batches of the interpolations against the analytic expression
+    import sys
+    import timeit
+    path = sys.argv[1] if len(sys.argv) > 1 else 'gravity_table.npy'
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    build_table(path, steps)
+    print("%s: %d^3 points, %.1f MB, box %s to %s" % (path, steps, os.path.getsize(path) / 1e6, BOX_LOWER, BOX_UPPER))
+    q = np.random.RandomState(1).uniform(BOX_LOWER, BOX_UPPER, (20000, 3))
+    conf = ArmConfiguration(q)
+    g = gravity(conf)
+    #Error away from the singularity side of the box
+    far = q[:, 1] < -0.8
+    t_analytic = min(timeit.repeat(lambda: gravity(conf), number=5, repeat=3)) / 5
+    print("analytic g: %.2f ms per batch of %d, |g| max %.2f" % (t_analytic*1e3, len(q), np.max(np.abs(g))))
+    for order, name in ((1, 'trilinear'), (3, 'cubic')):
+        table = GravityTable(path, order)
+        error = np.abs(table.gravity(q) - g)
+        assert np.allclose(table.gravity(conf, True), table.gravity(q)*np.array([-1.0, 1.0, -1.0]))
+        t = min(timeit.repeat(lambda: table.gravity(q), number=5, repeat=3)) / 5
+        print("%-9s max error %s, q2 < -0.8 rad %s, %.2f ms per batch" %
+              (name, np.array2string(table.max_error(), precision=4), np.array2string(np.max(error[far], axis=0), precision=4), t*1e3))
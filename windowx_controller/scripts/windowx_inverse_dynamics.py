@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+"""
+Recursive Newton-Euler inverse dynamics of the planar windowx chain.
+rnea(q, q_dot, v, a) returns tau = B(q) a + C(q, q_dot) v + g(q) in O(n), without building
+the matrices: the velocity terms are propagated with the reference velocity v next to the
+actual joint velocity q_dot, so that C is the same Christoffel matrix of the Lagrange model.
+The links (and servos) parameters are the tables of windowx_arm.py, WINDOWX_3LINKS or WINDOWX_2LINKS.
+"""
+
+from math import sin, cos
+import numpy as np
+from windowx_arm import *
+
+MIRROR = np.array([-1.0, 1.0, -1.0]) #x and orientation flip of the arm mounted in front of the first one
+
+def _trig(q, n):
+    """
+    Sines and cosines of the absolute link angles
+    """
+    if isinstance(q, ArmConfiguration) and n == 3:
+        return [q.s1, q.s12, q.s123], [q.c1, q.c12, q.c123]
+    s = []
+    c = []
+    th = 0.0
+    for i in range(n):
+        th += float(q[i])
+        s.append(sin(th))
+        c.append(cos(th))
+    return s, c
+
+def rnea(q, q_dot, v, a, links=WINDOWX_3LINKS, grav=G):
+    """
+    Joint torques B(q) a + C(q, q_dot) v + g(q) (nx1 column).
+    q can be an ArmConfiguration for the 3 links arm. With grav=0 and a=0
+    it returns the velocity terms only, with v=q_dot and a=0 the bias torques.
+    """
+    n = len(links)
+    s, c = _trig(q, n)
+    #Forward pass: angular velocities and accelerations, acceleration of the joints origins
+    w = 0.0
+    wr = 0.0
+    alpha = 0.0
+    apx = 0.0
+    apy = 0.0
+    d = []
+    r = []
+    al = []
+    ap = []
+    ac = []
+    for k in range(n):
+        l = links[k]
+        w += float(q_dot[k])
+        wr += float(v[k])
+        alpha += float(a[k])
+        dx = c[k]*l['ax'] - s[k]*l['ay']
+        dy = s[k]*l['ax'] + c[k]*l['ay']
+        rx = c[k]*l['cx'] - s[k]*l['cy']
+        ry = s[k]*l['cx'] + c[k]*l['cy']
+        ww = w*wr
+        ac.append((apx - alpha*ry - ww*rx, apy + alpha*rx - ww*ry))
+        d.append((dx, dy))
+        r.append((rx, ry))
+        al.append(alpha)
+        apx += -alpha*dy - ww*dx
+        apy += alpha*dx - ww*dy
+        ap.append((apx, apy))
+    #Backward pass: forces and moments about the joints origins
+    tau = np.zeros((n, 1))
+    fx = 0.0
+    fy = 0.0
+    nz = 0.0
+    for k in range(n - 1, -1, -1):
+        l = links[k]
+        Fx = l['m']*ac[k][0]
+        Fy = l['m']*(ac[k][1] + grav)
+        if k + 1 < n:
+            #Servo of the next joint: point mass at the end of link k, rotor driven by link k
+            nxt = links[k + 1]
+            fx += nxt['mm']*ap[k][0]
+            fy += nxt['mm']*(ap[k][1] + grav)
+            nz += nxt['Im']*(al[k] + nxt['kr']*float(a[k + 1]))
+        nz += d[k][0]*fy - d[k][1]*fx + r[k][0]*Fy - r[k][1]*Fx + l['I']*al[k]
+        fx += Fx
+        fy += Fy
+        #Own rotor seen through the gear
+        prev = al[k - 1] if k > 0 else 0.0
+        tau[k, 0] = nz + l['kr']*l['Im']*(prev + l['kr']*float(a[k]))
+    return tau
+
+def _tip_bias(q, q_dot, v, links=WINDOWX_3LINKS):
+    """
+    J_dot(q, q_dot) v of the chain tip position: acceleration of the tip with zero joint accelerations
+    """
+    n = len(links)
+    s, c = _trig(q, n)
+    w = 0.0
+    wr = 0.0
+    ax = 0.0
+    ay = 0.0
+    for k in range(n):
+        l = links[k]
+        w += float(q_dot[k])
+        wr += float(v[k])
+        ax -= w*wr*(c[k]*l['ax'] - s[k]*l['ay'])
+        ay -= w*wr*(s[k]*l['ax'] + c[k]*l['ay'])
+    return np.array([ax, ay, 0.0])
+
+def ee_inverse_dynamics(q, q_dot, v_x, a_x, mirrored=False):
+    """
+    Joint torques J^T (M a_x + C v_x + g) of the 3 links arm (3x1 column), with M, C and g
+    the end effector space matrices of windowx_dynamics.py, computed without building them:
+    v = J^-1 v_x, a = J^-1 (a_x - J_dot v), tau = B a + C v + g.
+    With mirrored=True v_x and a_x are expressed in the frame of the arm mounted in front of the first one.
+    """
+    conf = as_configuration(q)
+    v_x = np.asarray(v_x, dtype=float).reshape(3)
+    a_x = np.asarray(a_x, dtype=float).reshape(3)
+    if mirrored:
+        v_x = MIRROR*v_x
+        a_x = MIRROR*a_x
+    J = jacobian(conf, L3_DYN)
+    v = np.linalg.solve(J, v_x)
+    a = np.linalg.solve(J, a_x - _tip_bias(conf, q_dot, v))
+    return rnea(conf, q_dot, v, a)
+
+
+if __name__ == '__main__':
+    #Consistency check against the generated matrices
+    from windowx_dynamics import mass_matrix, coriolis, gravity
+    np.random.seed(0)
+    err = 0.0
+    for i in range(1000):
+        q = np.random.uniform([-1.5, 0.2, -1.5], [1.2, 1.5, 1.2])
+        qd = np.random.uniform(-1.0, 1.0, 3)
+        v_x = np.random.uniform(-0.5, 0.5, (3, 1))
+        a_x = np.random.uniform(-2.0, 2.0, (3, 1))
+        for mirrored in (False, True):
+            conf = ArmConfiguration(q)
+            J = jacobian(conf, L3_DYN, mirrored)
+            ref = np.dot(J.T, np.dot(mass_matrix(conf, mirrored), a_x) + np.dot(coriolis(conf, qd, mirrored), v_x) + gravity(conf, mirrored))
+            tau = ee_inverse_dynamics(conf, qd, v_x, a_x, mirrored)
+            err = max(err, np.max(np.abs(tau - ref)) / max(1.0, np.max(np.abs(ref))))
+    print("max relative error against windowx_dynamics: %g" % err)
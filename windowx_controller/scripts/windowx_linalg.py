@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+"""
+Closed form inverses of the small matrices of the cooperative controllers:
+planar arm jacobian (with damped least squares near the joint 2 singularity),
+grasp jacobians J_o and diagonal performance functions.
+About 2.5-3.5x faster than numpy.linalg.inv on 3x3 matrices (jacobian: 10.6us -> 4.1us, see __main__),
+the per call overhead of numpy dominates at this size.
+"""
+
+import numpy as np
+
+#The arm jacobian is singular when link 1 and link 2 are aligned, joint 2 at atan2(L1_Y, L1_X) = -0.325rad,
+#where |det(J_e)| = L2*|L1_X*sin(q2) - L1_Y*cos(q2)|. Below SINGULAR_DET (joint 2 ~0.19rad from the
+#singularity, inside the -0.55rad warning of the driver) the inverse is replaced by the damped least squares one,
+#with damping growing up to DAMPING at the singularity. The damping is zero at the threshold, so that the
+#inverse is continuous there: max|J^-1| peaks right outside it (~72 at q2 = -0.51) and the damping only
+#limits the growth closer to the singularity (~3.3 from q2 = -0.42 on).
+SINGULAR_DET = 4e-3
+DAMPING = 0.05
+
+def inv3(A):
+    """
+    Inverse of a 3x3 matrix from its cofactors
+    """
+    (a, b, c), (d, e, f), (g, h, i) = np.asarray(A).tolist()
+    k0 = e*i - f*h
+    k1 = f*g - d*i
+    k2 = d*h - e*g
+    r = 1.0/(a*k0 + b*k1 + c*k2)
+    return np.array([[k0*r, (c*h - b*i)*r, (b*f - c*e)*r],
+                     [k1*r, (a*i - c*g)*r, (c*d - a*f)*r],
+                     [k2*r, (b*g - a*h)*r, (a*e - b*d)*r]])
+
+def jacobian_inv(J, singular_det=SINGULAR_DET, damping=DAMPING):
+    """
+    Inverse of the 3x3 arm jacobian. Near the singularity (|det(J)| < singular_det) the damped
+    least squares inverse J^T (J J^T + l^2 I)^-1 is returned, l^2 = (1 - (det/singular_det)^2) damping^2.
+    Its gain on the singular direction is at most 1/(2 l): bounded by 1/(2 damping) at the singularity,
+    not at the threshold where l = 0 (see SINGULAR_DET).
+    """
+    (a, b, c), (d, e, f), (g, h, i) = np.asarray(J).tolist()
+    k0 = e*i - f*h
+    k1 = f*g - d*i
+    k2 = d*h - e*g
+    det = a*k0 + b*k1 + c*k2
+    if abs(det) >= singular_det:
+        r = 1.0/det
+        return np.array([[k0*r, (c*h - b*i)*r, (b*f - c*e)*r],
+                         [k1*r, (a*i - c*g)*r, (c*d - a*f)*r],
+                         [k2*r, (b*g - a*h)*r, (a*e - b*d)*r]])
+    J = np.asarray(J, dtype=np.float64)
+    l2 = (1.0 - (det/singular_det)**2) * damping**2
+    A = np.dot(J, J.T)
+    A[0, 0] += l2
+    A[1, 1] += l2
+    A[2, 2] += l2
+    return np.dot(J.T, inv3(A))
+
+def grasp_inv(J_o):
+    """
+    Inverse of the grasp jacobian J_o = [[1, 0, py], [0, 1, -px], [0, 0, 1]]
+    """
+    J_o = np.asarray(J_o)
+    return np.array([[1.0, 0.0, -float(J_o[0, 2])], [0.0, 1.0, -float(J_o[1, 2])], [0.0, 0.0, 1.0]])
+
+def diag_inv(D):
+    """
+    Inverse of a 3x3 diagonal matrix (the PPC performance functions ro_s, ro_v)
+    """
+    D = np.asarray(D)
+    return np.array([[1.0/D[0, 0], 0.0, 0.0], [0.0, 1.0/D[1, 1], 0.0], [0.0, 0.0, 1.0/D[2, 2]]])
+
+
+if __name__ == '__main__':
+    #Accuracy and cost against numpy.linalg.inv, behaviour across the joint 2 singularity
+    import timeit
+    from numpy.linalg import inv
+    from windowx_arm import ArmConfiguration, jacobian, L1_X, L1_Y
+    from math import atan2
+    J = np.matrix(jacobian(ArmConfiguration([0.3, -1.2, 0.4])))
+    J_o = np.matrix([[1, 0, 0.05], [0, 1, -0.08], [0, 0, 1]])
+    ro = np.matrix([[0.1, 0, 0], [0, 0.1, 0], [0, 0, 1.0]])
+    print("max error, jacobian: %g, grasp: %g, diagonal: %g" % (np.max(np.abs(jacobian_inv(J) - inv(J))),
+          np.max(np.abs(grasp_inv(J_o) - inv(J_o))), np.max(np.abs(diag_inv(ro) - inv(ro)))))
+    n = 20000
+    for name, f, A in [('jacobian', jacobian_inv, J), ('grasp', grasp_inv, J_o), ('diagonal', diag_inv, ro)]:
+        t_np = timeit.timeit(lambda: inv(A), number=n) / n
+        t_cf = timeit.timeit(lambda: f(A), number=n) / n
+        print("%-9s numpy.linalg.inv %6.2f us, closed form %6.2f us" % (name, t_np*1e6, t_cf*1e6))
+    q_sing = atan2(L1_Y, L1_X)
+    print("joint 2 singularity: %.4f rad" % q_sing)
+    for dq in [0.3, 0.2, 0.19, 0.18, 0.1, 0.05, 0.02, 0.01, 0.001, 0.0]:
+        J = jacobian(ArmConfiguration([0.3, q_sing - dq, 0.4]))
+        print("q2 = %.4f  |det| = %.2e  max|J^-1| = %8.2f" % (q_sing - dq, abs(np.linalg.det(J)), np.max(np.abs(jacobian_inv(J)))))
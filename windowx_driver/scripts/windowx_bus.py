@@ -0,0 +1,518 @@
+#!/usr/bin/env python
+
+"""
+Owner of the servos bus: a single thread runs every transaction on the ArbotiX serial port.
+Each cycle of the period has the same slots, in order:
+    read     periodic state read (positions and velocities)
+    publish  decoding and publishing of the state, no bus traffic
+    write    the latest torque command, pipelined right after the read; a newer command replaces
+             a pending one, torque writes always go before the low priority transactions
+    aux      at most one low priority transaction (gripper moves, ...) if it fits in what is left
+             of the period, or if it has been waiting longer than max_wait
+The slots duration is measured with a windowx_common.latency probe (p50/p99/max published on /diagnostics).
+A failing slot does not stop the cycles: the exception goes to on_error and the cycle continues with
+the next slot, the scheduler gives up after max_failures consecutive cycles with a failure.
+The rate can be changed while running, RateAdapter chooses it from the lost packets and round trip
+times of the last cycles. BusStats collects per servo statistics of the transactions.
+"""
+
+import time
+import heapq
+import threading
+from collections import deque
+from windowx_common.latency import NullProbe, LatencyHistogram
+
+_now = getattr(time, 'perf_counter', time.time)
+
+#Slots of a cycle, in order
+SLOTS = ('read', 'publish', 'write', 'aux')
+
+#Priorities of the queued transactions, lower first
+PRIORITY_HIGH = 0
+PRIORITY_LOW = 10
+
+class BusScheduler():
+    """Single thread scheduler of the bus transactions"""
+    def __init__(self, rate, read, publish, probe=None, max_wait=1.0, on_error=None, max_failures=50):
+        """
+        read() runs the state read transaction and returns its result, publish(result) handles it
+        without using the bus. probe times the 'read', 'publish', 'write', 'aux' phases.
+        on_error(slot, exception) is called for an exception raised in a slot; after max_failures
+        consecutive failed cycles run() returns with failed set.
+        """
+        self.period = 1.0/rate
+        self.read = read
+        self.publish = publish
+        self.probe = probe or NullProbe()
+        self.max_wait = max_wait
+        self.torque = None
+        self.queue = []
+        self.seq = 0
+        self.lock = threading.Lock()
+        #Estimated duration of the low priority transactions and of the torque writes
+        self.aux_cost = 0.0
+        self.write_cost = 0.0
+        self.cycles = 0
+        self.writes = 0
+        self.replaced_writes = 0
+        self.aux_runs = 0
+        self.on_error = on_error
+        self.max_failures = max_failures
+        self.errors = dict((slot, 0) for slot in SLOTS)
+        self.consecutive_failures = 0
+        self.failed = False
+        self.running = False
+        self.stopped = threading.Event()
+        self.stopped.set()
+
+    def set_rate(self, rate):
+        """
+        New cycles rate, from the next cycle
+        """
+        self.period = 1.0/rate
+        self.probe.period = self.period
+
+    def write_torque(self, fn, *args):
+        """
+        Torque command for the write slot of the next cycle, it replaces the pending one
+        """
+        with self.lock:
+            if self.torque is not None:
+                self.replaced_writes += 1
+            self.torque = (fn, args)
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Queue a transaction for the aux slots, priority=PRIORITY_LOW by default
+        """
+        priority = kwargs.get('priority', PRIORITY_LOW)
+        with self.lock:
+            self.seq += 1
+            heapq.heappush(self.queue, (priority, self.seq, _now(), fn, args))
+
+    def _aux(self, deadline):
+        """
+        Run the first queued transaction if there is time left before deadline
+        """
+        with self.lock:
+            if not self.queue:
+                return
+            priority, seq, t_submit, fn, args = self.queue[0]
+            t = _now()
+            if t + self.aux_cost > deadline and t - t_submit < self.max_wait:
+                return
+            heapq.heappop(self.queue)
+        fn(*args)
+        cost = _now() - t
+        self.aux_cost = cost if self.aux_runs == 0 else 0.8*self.aux_cost + 0.2*cost
+        self.aux_runs += 1
+
+    def _error(self, slot, e):
+        self.errors[slot] += 1
+        if self.on_error is not None:
+            self.on_error(slot, e)
+
+    def _write(self):
+        """
+        Run the pending torque command
+        """
+        #Taken and cleared at once: a command arriving meanwhile is the pending one of the next cycle
+        with self.lock:
+            torque = self.torque
+            self.torque = None
+        if torque is not None:
+            t = _now()
+            torque[0](*torque[1])
+            cost = _now() - t
+            self.write_cost = cost if self.writes == 0 else 0.8*self.write_cost + 0.2*cost
+            self.writes += 1
+
+    def run(self, is_shutdown):
+        """
+        Run the cycles until is_shutdown() is true, stop() is called or max_failures consecutive cycles failed
+        """
+        self.running = True
+        self.failed = False
+        self.consecutive_failures = 0
+        self.stopped.clear()
+        probe = self.probe
+        deadline = _now()
+        try:
+            while self.running and not is_shutdown():
+                probe.start()
+                deadline += self.period
+                errors = sum(self.errors.values())
+                #read
+                read = False
+                try:
+                    state = self.read()
+                    read = True
+                except Exception as e:
+                    self._error('read', e)
+                probe.lap()
+                #publish, a failed read leaves nothing to publish
+                if read:
+                    try:
+                        self.publish(state)
+                    except Exception as e:
+                        self._error('publish', e)
+                probe.lap()
+                #write, a failed command is dropped, the next one replaces it
+                try:
+                    self._write()
+                except Exception as e:
+                    self._error('write', e)
+                probe.lap()
+                #aux
+                try:
+                    self._aux(deadline)
+                except Exception as e:
+                    self._error('aux', e)
+                probe.lap()
+                self.cycles += 1
+                if sum(self.errors.values()) > errors:
+                    self.consecutive_failures += 1
+                    if self.consecutive_failures >= self.max_failures:
+                        self.failed = True
+                        break
+                else:
+                    self.consecutive_failures = 0
+                t = _now()
+                if t < deadline:
+                    time.sleep(deadline - t)
+                else:
+                    #Overrun, the next cycle starts now
+                    deadline = t
+        finally:
+            self.stopped.set()
+
+    def stop(self, timeout=1.0):
+        """
+        Stop the cycles and wait for the transaction in progress, the bus can then be used by the caller
+        """
+        self.running = False
+        return self.stopped.wait(timeout)
+
+
+class RateAdapter():
+    """Choice of the bus rate from the lost packets and round trip times of a sliding window of cycles"""
+    def __init__(self, rate, min_rate=50.0, max_rate=300.0, window=150, max_loss=0.02, step=10.0, backoff=0.8, load=0.7, hold=50):
+        """
+        The rate goes down by backoff when more than max_loss of the reads of the window were lost or
+        the p95 read time plus the write time is more than load of the period, and up by step when
+        the losses are below max_loss/4 and the higher rate still leaves that margin. After losses
+        the rate stays below the lossy one for hold decisions (window/5 cycles each) before probing it again.
+        """
+        self.rate = float(rate)
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.window = window
+        self.max_loss = max_loss
+        self.step = step
+        self.backoff = backoff
+        self.load = load
+        self.hold = hold
+        self.ceiling = self.max_rate
+        self.holding = 0
+        self.lost = deque(maxlen=window)
+        self.rtt = deque(maxlen=window)
+        self.lost_count = 0
+        self.samples = 0
+        self.loss = 0.0
+        self.rtt_p95 = 0.0
+        self.changes = 0
+
+    def update(self, lost, rtt, write_cost=0.0):
+        """
+        Add the read of a cycle (lost packet, round trip time in s), returns the new rate or None
+        """
+        if len(self.lost) == self.window:
+            self.lost_count -= self.lost[0]
+        self.lost.append(int(lost))
+        self.rtt.append(rtt)
+        self.lost_count += int(lost)
+        self.samples += 1
+        #Decisions on a full window, five times per window
+        if len(self.lost) < self.window or self.samples % max(1, self.window // 5):
+            return None
+        self.loss = float(self.lost_count) / self.window
+        self.rtt_p95 = sorted(self.rtt)[int(0.95 * (self.window - 1))]
+        need = self.rtt_p95 + write_cost
+        if self.holding:
+            self.holding -= 1
+            if not self.holding:
+                self.ceiling = self.max_rate
+        if self.loss > self.max_loss:
+            rate = max(self.min_rate, self.rate * self.backoff)
+            self.ceiling = max(self.min_rate, self.rate - self.step)
+            self.holding = self.hold
+        elif need > self.load / self.rate:
+            rate = max(self.min_rate, min(self.rate * self.backoff, self.load / need))
+        elif self.loss <= self.max_loss / 4 and need < self.load / (self.rate + self.step):
+            rate = min(self.ceiling, self.rate + self.step)
+        else:
+            return None
+        if rate == self.rate:
+            return None
+        self.rate = rate
+        self.changes += 1
+        #The samples at the old rate do not tell about the new one
+        self.lost.clear()
+        self.rtt.clear()
+        self.lost_count = 0
+        return rate
+
+
+#Outcomes of the bus transactions
+OK = 'ok'
+TIMEOUT = 'timeouts'
+CHECKSUM = 'checksum errors'
+LOST = 'lost'
+BAD_VALUE = 'bad values'
+ERROR = 'errors'
+OUTCOMES = (OK, TIMEOUT, CHECKSUM, LOST, BAD_VALUE, ERROR)
+READ = 'read'
+WRITE = 'write'
+
+class BusStats():
+    """Per servo counts, retries and round trip histograms of the bus transactions, split by read and write"""
+    def __init__(self, name, ids, period=2.0, publisher=None):
+        """
+        publisher(stats) is called every period seconds with the reports of the servos, then the
+        histograms start over; the counts are totals. A transaction with several servos counts for each.
+        LOST is a failed read that could not be told a timeout or a checksum error.
+        extra: None or a function returning a list of (key, value) of the whole bus, reported with the servos.
+        loop_errors counts the exceptions raised in the BusScheduler slots, see loop_error.
+        """
+        self.name = name
+        self.extra = None
+        self.loop_errors = dict((slot, 0) for slot in SLOTS)
+        self.ids = list(ids)
+        self.period = period
+        self.publisher = publisher
+        self.counts = {}
+        self.histograms = {}
+        self.retries = {}
+        self.failing = {}
+        for i in self.ids:
+            for kind in (READ, WRITE):
+                self.counts[i, kind] = dict((outcome, 0) for outcome in OUTCOMES)
+                self.histograms[i, kind] = LatencyHistogram()
+                self.retries[i, kind] = 0
+                self.failing[i, kind] = False
+        self.next_report = _now() + period
+
+    def record(self, kind, ids, rtt, outcome=OK):
+        """
+        Add a transaction of kind READ or WRITE with the servos ids, lasted rtt seconds
+        """
+        us = int(rtt * 1e6)
+        for i in ids:
+            key = (i, kind)
+            if key not in self.counts:
+                continue
+            self.counts[key][outcome] += 1
+            self.histograms[key].record(us)
+            #A transaction after a failed one of the same servo is a retry
+            if self.failing[key]:
+                self.retries[key] += 1
+            self.failing[key] = outcome != OK
+        if _now() >= self.next_report:
+            self.next_report = _now() + self.period
+            if self.publisher is not None:
+                self.publisher(self)
+            for h in self.histograms.values():
+                h.reset()
+
+    def bad_value(self, kind, servo):
+        """
+        A servo of a successful transaction returned a value out of range: counted as a failure of that servo
+        """
+        key = (servo, kind)
+        if key in self.counts:
+            self.counts[key][OK] -= 1
+            self.counts[key][BAD_VALUE] += 1
+            self.failing[key] = True
+
+    def summary(self, servo):
+        """
+        List of (key, value) of a servo
+        """
+        values = []
+        for kind in (READ, WRITE):
+            counts = self.counts[servo, kind]
+            h = self.histograms[servo, kind]
+            values.append((kind + ' transactions', sum(counts.values())))
+            values.extend((kind + ' ' + outcome, counts[outcome]) for outcome in OUTCOMES[1:])
+            values.append((kind + ' retries', self.retries[servo, kind]))
+            values.append((kind + ' rtt p50 [us]', h.percentile(50)))
+            values.append((kind + ' rtt p99 [us]', h.percentile(99)))
+            values.append((kind + ' rtt max [us]', h.max))
+        return values
+
+    def loop_error(self, slot):
+        """
+        Count an exception raised in a slot of the bus cycles
+        """
+        self.loop_errors[slot] += 1
+
+    def bus_summary(self):
+        """
+        List of (key, value) of the whole bus
+        """
+        values = [(slot + ' errors', self.loop_errors[slot]) for slot in SLOTS]
+        if self.extra is not None:
+            values.extend(self.extra())
+        return values
+
+    def failures(self, servo):
+        return sum(self.counts[servo, kind][outcome] for kind in (READ, WRITE) for outcome in OUTCOMES[1:])
+
+
+class BusStatsPublisher():
+    """Publisher of the BusStats reports on /diagnostics, one status per servo"""
+    def __init__(self, topic='/diagnostics'):
+        import rospy
+        from diagnostic_msgs.msg import DiagnosticArray, DiagnosticStatus, KeyValue
+        self.rospy = rospy
+        self.DiagnosticArray = DiagnosticArray
+        self.DiagnosticStatus = DiagnosticStatus
+        self.KeyValue = KeyValue
+        self.pub = rospy.Publisher(topic, DiagnosticArray, queue_size=1)
+        self.last_failures = {}
+        self.last_loop_errors = 0
+
+    def __call__(self, stats):
+        msg = self.DiagnosticArray()
+        msg.header.stamp = self.rospy.get_rostime()
+        for servo in stats.ids:
+            status = self.DiagnosticStatus()
+            status.name = '%s: servo %d' % (stats.name, servo)
+            status.hardware_id = 'dynamixel %d' % servo
+            failures = stats.failures(servo)
+            new = failures - self.last_failures.get(servo, 0)
+            self.last_failures[servo] = failures
+            if new:
+                status.level = self.DiagnosticStatus.WARN
+                status.message = '%d failed transactions in the last %.0fs' % (new, stats.period)
+            else:
+                status.level = self.DiagnosticStatus.OK
+                status.message = 'OK'
+            status.values = [self.KeyValue(key, str(value)) for key, value in stats.summary(servo)]
+            msg.status.append(status)
+        status = self.DiagnosticStatus()
+        status.name = stats.name
+        loop_errors = sum(stats.loop_errors.values())
+        new = loop_errors - self.last_loop_errors
+        self.last_loop_errors = loop_errors
+        if new:
+            status.level = self.DiagnosticStatus.ERROR
+            status.message = '%d errors in the bus cycles in the last %.0fs' % (new, stats.period)
+        else:
+            status.level = self.DiagnosticStatus.OK
+            status.message = 'OK'
+        status.values = [self.KeyValue(key, str(value)) for key, value in stats.bus_summary()]
+        msg.status.append(status)
+        self.pub.publish(msg)
+
+
+if __name__ == '__main__':
+    #Slot layout with a simulated bus: 2ms reads, 1.5ms writes at 150Hz, gripper moves of 3ms
+    from windowx_common.latency import LoopProbe
+    log = []
+    def bus(name, duration):
+        def transaction(*args):
+            log.append((_now(), name))
+            time.sleep(duration)
+            return [0, 0, 0], [0, 0, 0]
+        return transaction
+    probe = LoopProbe('bus', 1.0/150, SLOTS)
+    scheduler = BusScheduler(150, bus('read', 0.002), lambda state: None, probe)
+    t_end = _now() + 2.0
+    thread = threading.Thread(target=scheduler.run, args=(lambda: _now() > t_end,))
+    thread.start()
+    for i in range(200):
+        scheduler.write_torque(bus('write', 0.0015), [[2, 0], [3, 0], [4, 0]], [[2, 10], [3, 10], [4, 10]])
+        if i % 40 == 0:
+            scheduler.submit(bus('gripper', 0.003), 6, 50)
+        time.sleep(1.0/160)
+    thread.join()
+    order = [name for t, name in log]
+    after_read = [order[i + 1] for i in range(len(order) - 1) if order[i] == 'read']
+    print("cycles %d, writes %d (%d replaced), gripper moves %d" % (scheduler.cycles, scheduler.writes, scheduler.replaced_writes, scheduler.aux_runs))
+    print("slot after a read: %s" % dict((name, after_read.count(name)) for name in set(after_read)))
+    for key, value in probe.summary():
+        print("  %s: %s" % (key, value))
+
+    #Failing transactions: every 10th write raises, the cycles go on; a dead bus stops them after max_failures
+    def flaky(n=[0]):
+        n[0] += 1
+        if n[0] % 10 == 0:
+            raise IOError('write failed')
+    def dead():
+        raise IOError('no reply')
+    errors = []
+    scheduler = BusScheduler(500, lambda: None, lambda state: None, on_error=lambda slot, e: errors.append(slot), max_failures=20)
+    t_end = _now() + 0.5
+    thread = threading.Thread(target=scheduler.run, args=(lambda: _now() > t_end,))
+    thread.start()
+    while thread.is_alive():
+        scheduler.write_torque(flaky)
+        time.sleep(0.001)
+    thread.join()
+    print("flaky writes: cycles %d, errors %s, failed %s" % (scheduler.cycles, scheduler.errors, scheduler.failed))
+    scheduler = BusScheduler(500, dead, lambda state: None, max_failures=20)
+    scheduler.run(lambda: False)
+    print("dead bus: cycles %d, errors %s, failed %s" % (scheduler.cycles, scheduler.errors, scheduler.failed))
+
+    #Rate adaptation on a model bus: ~1ms reads, 0.6ms writes, losses growing above 220Hz (return delay too short)
+    import random
+    random.seed(1)
+    adapter = RateAdapter(150)
+    rates = [adapter.rate]
+    cycles = 0
+    lost_total = 0
+    t = 0.0
+    while t < 120.0:
+        rate = adapter.rate
+        lost = random.random() < max(0.001, 0.002 * (rate - 220))
+        rtt = 0.001 + random.expovariate(1.0 / 0.0001)
+        lost_total += lost
+        if adapter.update(lost, rtt, 0.0006) is not None:
+            rates.append(adapter.rate)
+        t += 1.0 / rate
+        cycles += 1
+    print("adaptive rate over %d cycles: %s Hz, mean %.0f Hz, %d changes, %.2f%% lost" %
+          (cycles, ' '.join('%.0f' % r for r in rates[:12]) + (' ... %.0f' % rates[-1] if len(rates) > 12 else ''),
+           cycles / t, adapter.changes, 100.0 * lost_total / cycles))
+
+    #Per servo statistics of reads and writes on the emulated bus with 2% lost and 1% corrupted replies
+    import os
+    import tty
+    from windowx_serial import SerialLink
+    from windowx_bus_emulator import *
+    emulator = BusEmulator(seed=0, loss=0.02, corrupt=0.01)
+    fd = os.open(emulator.port, os.O_RDWR | os.O_NOCTTY)
+    tty.setraw(fd)
+    link = SerialLink(fd)
+    reports = []
+    stats = BusStats('emulated bus', [2, 3, 4], 0.5, reports.append)
+    def transaction(index, ins, params, length):
+        counters = (link.timeouts, link.checksum_errors)
+        t = _now()
+        reply = link.execute(index, ins, params)
+        rtt = _now() - t
+        if reply is not None and len(reply) == length:
+            return rtt, OK
+        if link.checksum_errors > counters[1]:
+            return rtt, CHECKSUM
+        return rtt, TIMEOUT if link.timeouts > counters[0] else LOST
+    for i in range(600):
+        stats.record(READ, [2, 3, 4], *transaction(BROADCAST, SYNC_READ, [2, 3, 4, P_PRESENT_POSITION_L, 4], 12))
+        servo = 2 + i % 3
+        stats.record(WRITE, [servo], *transaction(servo, WRITE_DATA, [P_GOAL_POSITION_L, 0x00, 0x08], 0))
+    print("%d reports, servo 3:" % len(reports))
+    for key, value in stats.summary(3):
+        print("  %s: %s" % (key, value))
+    os.close(fd)
+    emulator.close()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python
+
+"""
+Emulator of the ArbotiX board and of the dynamixel servos of a windowx arm on a pseudo terminal,
+to run and benchmark the drivers without the arms: the drivers open the emulator port
+in place of /dev/ttyUSB0.
+Servos IDs 1-6 (MX-28, MX-64, MX-64, MX-28, AX-12, AX-12) with their register maps, the ArbotiX
+answers as ID 253. Instructions: PING, READ_DATA, WRITE_DATA, SYNC_WRITE and the ArbotiX SYNC_READ.
+The replies are delayed by the time the packets take on the bus at the emulated baud rate plus the
+return delay of the servos, and a fraction of them can be lost (no reply) or corrupted (bad checksum).
+The servos move toward their goal position at a speed proportional to the torque limit.
+Usage: windowx_bus_emulator.py [--baud B] [--loss P] [--corrupt P] [--boot S] [--link PATH]
+"""
+
+import os
+import sys
+import tty
+import time
+import random
+import select
+import threading
+
+#Instructions
+PING = 0x01
+READ_DATA = 0x02
+WRITE_DATA = 0x03
+SYNC_WRITE = 0x83
+SYNC_READ = 0x84
+BROADCAST = 0xFE
+ARBOTIX_ID = 0xFD
+
+#Registers, protocol 1.0
+P_MODEL_NUMBER_L = 0
+P_RETURN_DELAY_TIME = 5
+P_CW_ANGLE_LIMIT_L = 6
+P_CCW_ANGLE_LIMIT_L = 8
+P_STATUS_RETURN_LEVEL = 16
+P_TORQUE_ENABLE = 24
+P_GOAL_POSITION_L = 30
+P_MOVING_SPEED_L = 32
+P_TORQUE_LIMIT_L = 34
+P_PRESENT_POSITION_L = 36
+P_PRESENT_SPEED_L = 38
+P_PRESENT_LOAD_L = 40
+P_PRESENT_VOLTAGE = 42
+P_PRESENT_TEMPERATURE = 43
+P_MOVING = 46
+
+#Servo models: model number, control table size, position steps, speed unit (rpm), no load speed (rpm)
+MODELS = {
+    'MX-28': {'number': 29, 'size': 74, 'steps': 4096, 'vel_unit': 0.114, 'max_rpm': 55.0},
+    'MX-64': {'number': 310, 'size': 74, 'steps': 4096, 'vel_unit': 0.114, 'max_rpm': 63.0},
+    'AX-12': {'number': 12, 'size': 50, 'steps': 1024, 'vel_unit': 0.111, 'max_rpm': 114.0},
+}
+WINDOWX_SERVOS = {1: 'MX-28', 2: 'MX-64', 3: 'MX-64', 4: 'MX-28', 5: 'AX-12', 6: 'AX-12'}
+
+
+def checksum(body):
+    return 255 - (sum(body) % 256)
+
+def packet(servo_id, instruction, params):
+    """
+    Dynamixel 1.0 packet: 0xFF 0xFF id length instruction/error params checksum
+    """
+    body = [servo_id, len(params) + 2, instruction] + list(params)
+    return bytearray([0xFF, 0xFF] + body + [checksum(body)])
+
+
+class EmulatedServo():
+    """Control table and motion of a dynamixel servo"""
+    def __init__(self, servo_id, model):
+        self.id = servo_id
+        self.model = MODELS[model]
+        steps = self.model['steps']
+        self.table = bytearray(self.model['size'])
+        self.set(P_MODEL_NUMBER_L, self.model['number'])
+        self.table[2] = 36
+        self.table[3] = servo_id
+        self.table[4] = 1
+        self.table[P_RETURN_DELAY_TIME] = 0
+        self.set(P_CCW_ANGLE_LIMIT_L, steps - 1)
+        self.table[P_STATUS_RETURN_LEVEL] = 2
+        self.set(P_GOAL_POSITION_L, steps // 2)
+        self.set(P_TORQUE_LIMIT_L, 1023)
+        self.table[P_PRESENT_VOLTAGE] = 120
+        self.table[P_PRESENT_TEMPERATURE] = 35
+        self.position = float(steps // 2)
+        self.velocity = 0.0
+        self.update(0.0)
+
+    def get(self, address):
+        return self.table[address] + (self.table[address + 1] << 8)
+
+    def set(self, address, value):
+        self.table[address] = value & 0xFF
+        self.table[address + 1] = (value >> 8) & 0xFF
+
+    def read(self, address, length):
+        return self.table[address:address + length]
+
+    def write(self, address, data):
+        for i, value in enumerate(data):
+            if address + i < len(self.table):
+                self.table[address + i] = value
+        if address <= P_TORQUE_LIMIT_L + 1 and address + len(data) > P_GOAL_POSITION_L:
+            self.table[P_TORQUE_ENABLE] = 1
+
+    def update(self, dt):
+        """
+        Move toward the goal position for dt seconds and refresh the present registers
+        """
+        steps = self.model['steps']
+        torque = self.get(P_TORQUE_LIMIT_L) / 1023.0 if self.table[P_TORQUE_ENABLE] else 0.0
+        max_speed = self.model['max_rpm']
+        moving_speed = self.get(P_MOVING_SPEED_L) & 0x3FF
+        if moving_speed:
+            max_speed = min(max_speed, moving_speed * self.model['vel_unit'])
+        #rpm to steps/s
+        speed = max_speed * torque * steps / 60.0
+        error = self.get(P_GOAL_POSITION_L) - self.position
+        #Proportional approach of the goal with 20ms time constant, saturated at speed
+        self.velocity = max(-speed, min(speed, error / 0.02))
+        self.position += self.velocity * dt
+        self.position = max(self.get(P_CW_ANGLE_LIMIT_L), min(self.get(P_CCW_ANGLE_LIMIT_L), self.position))
+        self.set(P_PRESENT_POSITION_L, int(round(self.position)))
+        rpm = abs(self.velocity) * 60.0 / steps
+        magnitude = min(1023, int(round(rpm / self.model['vel_unit'])))
+        #Bit 10 is the direction, set for CW (decreasing positions)
+        self.set(P_PRESENT_SPEED_L, magnitude + (1024 if self.velocity < 0 else 0))
+        load = int(torque * 1023) if self.velocity != 0 else 0
+        self.set(P_PRESENT_LOAD_L, load + (1024 if error < 0 else 0))
+        self.table[P_MOVING] = 1 if magnitude else 0
+
+
+class BusEmulator():
+    """ArbotiX board and servos on the master side of a pseudo terminal"""
+    def __init__(self, servos=None, baud=1000000, loss=0.0, corrupt=0.0, seed=None, link=None, boot=0.0):
+        servos = servos or WINDOWX_SERVOS
+        self.servos = dict((i, EmulatedServo(i, model)) for i, model in servos.items())
+        self.baud = baud
+        self.loss = loss
+        self.corrupt = corrupt
+        self.random = random.Random(seed)
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.slave)
+        self.port = os.ttyname(self.slave)
+        self.link = link
+        if link:
+            if os.path.lexists(link):
+                os.remove(link)
+            os.symlink(self.port, link)
+        self.packets = 0
+        self.replies = 0
+        self.lost = 0
+        self.corrupted = 0
+        self.bad_packets = 0
+        self.t_update = time.time()
+        #The board ignores the packets while booting, as the ArbotiX after the reset of the port opening
+        self.t_boot = self.t_update + boot
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name='windowx_bus_emulator')
+        self.thread.daemon = True
+        self.thread.start()
+
+    def byte_time(self, n):
+        """
+        Time to transmit n bytes at the emulated baud rate (8N1)
+        """
+        return n * 10.0 / self.baud
+
+    def _update(self):
+        t = time.time()
+        dt = t - self.t_update
+        self.t_update = t
+        for servo in self.servos.values():
+            servo.update(dt)
+
+    def _reply(self, servo_id, params, t_request, servo_ids):
+        """
+        Send a status packet once the bus time of the transaction has passed
+        """
+        if self.random.random() < self.loss:
+            self.lost += 1
+            return
+        reply = packet(servo_id, 0, params)
+        if self.random.random() < self.corrupt:
+            self.corrupted += 1
+            reply[-1] = (reply[-1] + 1) & 0xFF
+        #Reply bytes, plus the return delay (2us units) of each servo involved
+        delay = self.byte_time(len(reply)) + sum(2e-6 * self.servos[i].table[P_RETURN_DELAY_TIME] for i in servo_ids if i in self.servos)
+        wait = t_request + delay - time.time()
+        if wait > 0:
+            time.sleep(wait)
+        os.write(self.master, bytes(reply))
+        self.replies += 1
+
+    def handle(self, servo_id, instruction, params, t_request):
+        """
+        Execute an instruction packet
+        """
+        self.packets += 1
+        self._update()
+        if instruction == SYNC_WRITE and servo_id == BROADCAST and len(params) >= 2:
+            address, length = params[0], params[1]
+            for k in range(2, len(params) - length, length + 1):
+                if params[k] in self.servos:
+                    self.servos[params[k]].write(address, params[k + 1:k + 1 + length])
+        elif instruction == SYNC_READ and len(params) >= 2:
+            ids, address, length = params[:-2], params[-2], params[-1]
+            data = []
+            for i in ids:
+                if i not in self.servos:
+                    #The ArbotiX gives up on the whole read
+                    return
+                data += list(self.servos[i].read(address, length))
+            #The ArbotiX reads each servo on its own bus: request and reply of every servo
+            t_request += sum(self.byte_time(8) + self.byte_time(6 + length) for i in ids)
+            self._reply(ARBOTIX_ID, data, t_request, ids)
+        elif servo_id == BROADCAST:
+            if instruction == WRITE_DATA and params:
+                for servo in self.servos.values():
+                    servo.write(params[0], params[1:])
+        elif servo_id == ARBOTIX_ID:
+            if instruction == READ_DATA and len(params) == 2:
+                self._reply(ARBOTIX_ID, [0] * params[1], t_request, [])
+            else:
+                self._reply(ARBOTIX_ID, [], t_request, [])
+        elif servo_id in self.servos:
+            servo = self.servos[servo_id]
+            if instruction == PING:
+                self._reply(servo_id, [], t_request, [servo_id])
+            elif instruction == READ_DATA and len(params) == 2:
+                self._reply(servo_id, list(servo.read(params[0], params[1])), t_request, [servo_id])
+            elif instruction == WRITE_DATA and params:
+                servo.write(params[0], params[1:])
+                if servo.table[P_STATUS_RETURN_LEVEL] >= 2:
+                    self._reply(servo_id, [], t_request, [servo_id])
+
+    def _run(self):
+        buf = bytearray()
+        while self.running:
+            try:
+                ready = select.select([self.master], [], [], 0.1)[0]
+                if not ready:
+                    continue
+                data = os.read(self.master, 1024)
+            except OSError:
+                return
+            t = time.time()
+            if t < self.t_boot:
+                continue
+            buf += data
+            while True:
+                start = buf.find(b'\xff\xff')
+                if start < 0:
+                    del buf[:max(0, len(buf) - 1)]
+                    break
+                if start > 0:
+                    del buf[:start]
+                if len(buf) < 4:
+                    break
+                if buf[2] == 0xFF:
+                    #Third 0xFF of a header preceded by a stray byte
+                    del buf[:1]
+                    continue
+                length = buf[3]
+                if len(buf) < 4 + length:
+                    break
+                body = buf[2:4 + length - 1]
+                if length < 2 or checksum(body) != buf[3 + length]:
+                    self.bad_packets += 1
+                    del buf[:2]
+                    continue
+                #Request bytes on the bus, the reply starts after them
+                t_request = t + self.byte_time(4 + length)
+                self.handle(buf[2], buf[4], list(buf[5:3 + length]), t_request)
+                del buf[:4 + length]
+
+    def close(self):
+        self.running = False
+        self.thread.join()
+        os.close(self.master)
+        os.close(self.slave)
+        if self.link and os.path.islink(self.link):
+            os.remove(self.link)
+
+
+class EmulatorClient():
+    """Minimal host side of the protocol on the emulator port, for checks and benchmarks without pyserial"""
+    def __init__(self, port, timeout=0.05):
+        self.fd = os.open(port, os.O_RDWR | os.O_NOCTTY)
+        tty.setraw(self.fd)
+        self.timeout = timeout
+
+    def execute(self, servo_id, instruction, params):
+        """
+        Send a packet and return the reply params, None on timeout or bad checksum
+        """
+        os.write(self.fd, bytes(packet(servo_id, instruction, params)))
+        if servo_id == BROADCAST and instruction != SYNC_READ:
+            return []
+        buf = bytearray()
+        deadline = time.time() + self.timeout
+        while True:
+            if len(buf) >= 4 and len(buf) >= 4 + buf[3]:
+                reply = buf[:4 + buf[3]]
+                if checksum(reply[2:-1]) != reply[-1]:
+                    return None
+                return list(reply[5:-1])
+            wait = deadline - time.time()
+            if wait <= 0 or not select.select([self.fd], [], [], wait)[0]:
+                return None
+            buf += os.read(self.fd, 256)
+
+    def close(self):
+        os.close(self.fd)
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Emulator of the windowx ArbotiX bus on a pseudo terminal')
+    parser.add_argument('--baud', type=int, default=1000000)
+    parser.add_argument('--loss', type=float, default=0.0, help='fraction of lost replies')
+    parser.add_argument('--corrupt', type=float, default=0.0, help='fraction of replies with a bad checksum')
+    parser.add_argument('--boot', type=float, default=0.0, help='seconds before the board answers')
+    parser.add_argument('--link', default=None, help='symlink to the emulated port, e.g. /tmp/ttyWINDOWX0')
+    parser.add_argument('--check', action='store_true', help='run the protocol checks and a sync read benchmark')
+    #Unknown arguments are the ones added by roslaunch (__name:=...)
+    args = parser.parse_known_args()[0]
+
+    emulator = BusEmulator(baud=args.baud, loss=args.loss, corrupt=args.corrupt, link=args.link, seed=0, boot=args.boot)
+    if not args.check:
+        print("Emulated windowx bus on %s%s, %d baud, %.1f%% lost, %.1f%% corrupted replies" % (
+            emulator.port, (' (' + args.link + ')') if args.link else '', args.baud, 100 * args.loss, 100 * args.corrupt))
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            emulator.close()
+        sys.exit(0)
+
+    client = EmulatorClient(emulator.port)
+    models = [client.execute(i, READ_DATA, [P_MODEL_NUMBER_L, 2]) for i in range(1, 7)]
+    print("ping 1-6: %s, models: %s" % ([client.execute(i, PING, []) == [] for i in range(1, 7)], [m[0] + (m[1] << 8) for m in models]))
+    #Torque control as the drivers do: torque limit and a goal position far away in the direction of the torque
+    client.execute(BROADCAST, SYNC_WRITE, [P_TORQUE_LIMIT_L, 2, 2, 100, 0, 3, 100, 0, 4, 100, 0])
+    client.execute(BROADCAST, SYNC_WRITE, [P_GOAL_POSITION_L, 2, 2, 10, 0, 3, 0xF5, 0x0F, 4, 0xF5, 0x0F])
+    time.sleep(0.1)
+    values = client.execute(BROADCAST, SYNC_READ, [2, 3, 4, P_PRESENT_POSITION_L, 4])
+    positions = [values[4*i] + (values[4*i+1] << 8) for i in range(3)]
+    speeds = [values[4*i+2] + (values[4*i+3] << 8) for i in range(3)]
+    print("after 0.1s of torque: positions %s, speeds %s" % (positions, speeds))
+    n = 500
+    for name, reads in [('sync read pos+vel', [[2, 3, 4, P_PRESENT_POSITION_L, 4]]),
+                        ('sync read pos, vel', [[2, 3, 4, P_PRESENT_POSITION_L, 2], [2, 3, 4, P_PRESENT_SPEED_L, 2]])]:
+        t = time.time()
+        for k in range(n):
+            for params in reads:
+                client.execute(BROADCAST, SYNC_READ, params)
+        print("%-18s %.3f ms per cycle" % (name, (time.time() - t) / n * 1e3))
+    emulator.loss = 0.1
+    failed = sum(client.execute(BROADCAST, SYNC_READ, [2, 3, 4, P_PRESENT_POSITION_L, 4]) is None for k in range(n))
+    print("lost replies at 10%%: %d/%d (emulator counted %d)" % (failed, n, emulator.lost))
+    client.close()
+    emulator.close()
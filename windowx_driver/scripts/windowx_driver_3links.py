@@ -11,16 +11,20 @@ from math import pi
 from arbotix_python.arbotix import ArbotiX
 from std_msgs.msg import Float32MultiArray, MultiArrayDimension
 from servos_parameters import *
+from windowx_common.latency import loop_probe
+from windowx_startup import wait_for_servos
 
 class WindowxNode(ArbotiX):
     """Node to control in torque the dynamixel servos"""
     def __init__(self, port="/dev/ttyUSB0", baud=1000000):
         #Initialize arbotix comunications
-        print"\nArbotix initialization, wait 10 seconds..."
+        print"\nArbotix initialization, waiting for the servos to answer..."
         ArbotiX.__init__(self, port, baud)
-        for x in xrange(1,21):
-            time.sleep(0.5)
-            print(str(x*0.5) + "/10s")
+        t_servos = wait_for_servos(self.ping, range(1, 7), is_shutdown=rospy.is_shutdown)
+        if t_servos is None:
+            rospy.logwarn("Not all the servos answered the ping, going on anyway")
+        else:
+            rospy.loginfo("Servos answered in %.2fs", t_servos)
 
         print"Done."
         #Set inital torque limits
@@ -131,7 +135,10 @@ class WindowxNode(ArbotiX):
     def publish(self):
         rad_mx_step = (pi/30) * MX_VEL_UNIT
         rad_ax_step = (pi/30) * AX_VEL_UNIT
+        #The loop runs as fast as the reads allow: no period, no overruns
+        probe = loop_probe('windowx_3links_driver', None, ('sense', 'publish'))
         while not rospy.is_shutdown():
+            probe.start()
             #MX-* servos poses
             self.joints_poses[0] = MX_POS_UNIT * (self.getPosition(1) - MX_POS_CENTER)
             self.joints_poses[1] = MX_POS_UNIT * (int(MX_POS_CENTER + MX_POS_CENTER/2) - self.getPosition(2))
@@ -158,10 +165,12 @@ class WindowxNode(ArbotiX):
             else:
                 self.joints_vels[4] = rad_ax_step * (AX_VEL_CENTER - actualax_step_speed)
 
+            probe.lap()
             self.poses_to_pub.data = self.joints_poses
             self.vels_to_pub.data = self.joints_vels
             self.pos_pub.publish(self.poses_to_pub)
             self.vel_pub.publish(self.vels_to_pub)
+            probe.lap()
 
 
 def tourn_off_arm():
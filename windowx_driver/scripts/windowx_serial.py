@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+
+"""
+Low latency mode of the ArbotiX serial port. The USB-serial adapters hold the received bytes up to
+their latency timer (16ms by default on the FTDI ones) and the arbotix_python transactions write a
+packet one byte per call and read the reply one byte per call with a 100ms timeout.
+set_low_latency sets ASYNC_LOW_LATENCY on the port and the FTDI latency timer to 1ms (sysfs, when
+writable); SerialLink runs the dynamixel transactions on the port file descriptor with one write per
+packet and exact length reads (header, then the announced length) with a short timeout.
+Works on any tty, the __main__ checks it against the bus emulator pseudo terminal.
+"""
+
+import os
+import time
+import array
+import fcntl
+import select
+import termios
+
+_now = getattr(time, 'perf_counter', time.time)
+
+#linux/serial.h, linux/tty_flags.h
+TIOCGSERIAL = 0x541E
+TIOCSSERIAL = 0x541F
+ASYNC_LOW_LATENCY = 1 << 13
+#Index of flags in struct serial_struct (type, line, port, irq, flags, ...)
+SERIAL_FLAGS = 4
+
+def set_low_latency(fd, port=None, latency_timer=1):
+    """
+    ASYNC_LOW_LATENCY on the tty fd and latency_timer [ms] on the FTDI adapter of port.
+    Returns the list of what could be set.
+    """
+    done = []
+    buf = array.array('i', [0] * 32)
+    try:
+        fcntl.ioctl(fd, TIOCGSERIAL, buf)
+        buf[SERIAL_FLAGS] |= ASYNC_LOW_LATENCY
+        fcntl.ioctl(fd, TIOCSSERIAL, buf)
+        done.append('ASYNC_LOW_LATENCY')
+    except (IOError, OSError):
+        #Not a serial driver (pseudo terminal) or not allowed
+        pass
+    if port is not None:
+        path = '/sys/bus/usb-serial/devices/%s/latency_timer' % os.path.basename(os.path.realpath(port))
+        try:
+            with open(path, 'w') as f:
+                f.write('%d\n' % latency_timer)
+            done.append('latency_timer %dms' % latency_timer)
+        except (IOError, OSError):
+            pass
+    return done
+
+
+def _checksum(values):
+    return 255 - (sum(values) % 256)
+
+
+class SerialLink():
+    """Dynamixel 1.0 transactions on a tty file descriptor: one write per packet, exact length reads"""
+    def __init__(self, fd, timeout=0.005):
+        self.fd = fd
+        self.timeout = timeout
+        self.timeouts = 0
+        self.checksum_errors = 0
+
+    def _read(self, n, deadline):
+        """
+        Exactly n bytes, None if they did not arrive before deadline
+        """
+        buf = bytearray()
+        while len(buf) < n:
+            wait = deadline - _now()
+            if wait <= 0 or not select.select([self.fd], [], [], wait)[0]:
+                return None
+            buf += bytearray(os.read(self.fd, n - len(buf)))
+        return buf
+
+    def execute(self, index, ins, params, ret=True):
+        """
+        Send a packet and return the params of the reply as ArbotiX.execute, None on timeout or bad checksum
+        """
+        try:
+            termios.tcflush(self.fd, termios.TCIFLUSH)
+        except termios.error:
+            pass
+        body = [index, len(params) + 2, ins] + list(params)
+        os.write(self.fd, bytes(bytearray([0xFF, 0xFF] + body + [_checksum(body)])))
+        if not ret:
+            return None
+        deadline = _now() + self.timeout
+        #Header: 0xFF 0xFF id length, resynchronized on the first 0xFF 0xFF if there is garbage before it
+        header = self._read(4, deadline)
+        while header is not None and (header[0] != 0xFF or header[1] != 0xFF or header[2] == 0xFF):
+            more = self._read(1, deadline)
+            header = header[1:] + more if more is not None else None
+        if header is None:
+            self.timeouts += 1
+            return None
+        #error, params, checksum
+        rest = self._read(header[3], deadline)
+        if rest is None:
+            self.timeouts += 1
+            return None
+        if _checksum(list(header[2:]) + list(rest[:-1])) != rest[-1]:
+            self.checksum_errors += 1
+            return None
+        return list(rest[1:-1])
+
+
+def measure_rtt(transaction, n=50):
+    """
+    Durations [s] of n runs of transaction(), sorted, the failed ones (None or -1) left out
+    """
+    times = []
+    for i in range(n):
+        t = _now()
+        reply = transaction()
+        if reply is not None and reply != -1:
+            times.append(_now() - t)
+    return sorted(times)
+
+
+if __name__ == '__main__':
+    #Round trip times on the emulator pseudo terminal: arbotix_python style transactions (a write per byte,
+    #reads of one byte) against the low latency link
+    import tty
+    from windowx_bus_emulator import *
+    emulator = BusEmulator(seed=0)
+    fd = os.open(emulator.port, os.O_RDWR | os.O_NOCTTY)
+    tty.setraw(fd)
+    print("low latency settings on a pseudo terminal: %s" % (set_low_latency(fd, emulator.port) or 'none supported'))
+
+    def bytewise(index, ins, params, timeout=0.1):
+        try:
+            termios.tcflush(fd, termios.TCIFLUSH)
+        except termios.error:
+            pass
+        body = [index, len(params) + 2, ins] + list(params)
+        for value in [0xFF, 0xFF] + body + [_checksum(body)]:
+            os.write(fd, bytes(bytearray([value])))
+        reply = bytearray()
+        while len(reply) < 4 or len(reply) < 4 + reply[3]:
+            if not select.select([fd], [], [], timeout)[0]:
+                return None
+            reply += bytearray(os.read(fd, 1))
+        return list(reply[5:-1])
+
+    link = SerialLink(fd)
+    transactions = [('ping', 2, PING, []), ('sync read 3 servos', BROADCAST, SYNC_READ, [2, 3, 4, P_PRESENT_POSITION_L, 4])]
+    for name, index, ins, params in transactions:
+        for kind, execute in (('bytewise', bytewise), ('low latency', link.execute)):
+            times = measure_rtt(lambda: execute(index, ins, params), 300)
+            print("%-18s %-11s p50 %.3f ms, max %.3f ms, %d/300 replies" % (name, kind, times[len(times) // 2] * 1e3, times[-1] * 1e3, len(times)))
+    #Lost replies: the short timeout bounds the cost of a loss
+    lossy = BusEmulator(seed=0, loss=0.2)
+    lossy_fd = os.open(lossy.port, os.O_RDWR | os.O_NOCTTY)
+    tty.setraw(lossy_fd)
+    lossy_link = SerialLink(lossy_fd)
+    t = _now()
+    replies = measure_rtt(lambda: lossy_link.execute(2, PING, []), 200)
+    print("20%% lost replies: %d/200 replies, %d timeouts, %.2f ms per transaction" % (len(replies), lossy_link.timeouts, (_now() - t) / 200 * 1e3))
+    os.close(lossy_fd)
+    lossy.close()
+    os.close(fd)
+    emulator.close()
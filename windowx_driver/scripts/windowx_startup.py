@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+
+"""
+Readiness probes of the drivers startup, in place of fixed sleeps:
+wait_for_servos pings the servos until all of them answer (the ArbotiX is reset when the
+serial port is opened and does not answer while booting), wait_for_pose polls the present
+positions until the servos reach the initial pose or stop moving.
+Both return the elapsed time, or None on timeout.
+"""
+
+import time
+
+def _answered(reply):
+    return reply is not None and reply != -1
+
+def wait_for_servos(ping, ids, timeout=15.0, period=0.05, is_shutdown=lambda: False):
+    """
+    Ping the servos ids, ping(id) as ArbotiX.ping, until all of them have answered once
+    """
+    t0 = time.time()
+    pending = list(ids)
+    while pending:
+        pending = [i for i in pending if not _answered(ping(i))]
+        if not pending:
+            break
+        if time.time() - t0 > timeout or is_shutdown():
+            return None
+        time.sleep(period)
+    return time.time() - t0
+
+def wait_for_pose(get_positions, goals, tolerance=20, settle=0.25, timeout=3.0, period=0.02, is_shutdown=lambda: False):
+    """
+    Poll get_positions() (steps of the servos, -1 or None on a lost packet) until every servo is
+    within tolerance steps from goals or none of them moved by more than 1 step for settle seconds
+    """
+    t0 = time.time()
+    last = None
+    t_still = None
+    while True:
+        positions = get_positions()
+        t = time.time()
+        if positions and not -1 in positions:
+            if all(abs(p - g) <= tolerance for p, g in zip(positions, goals)):
+                return t - t0
+            if last is not None and all(abs(p - l) <= 1 for p, l in zip(positions, last)):
+                if t_still is None:
+                    t_still = t
+                elif t - t_still >= settle:
+                    return t - t0
+            else:
+                t_still = None
+            last = positions
+        if t - t0 > timeout or is_shutdown():
+            return None
+        time.sleep(period)
+
+
+if __name__ == '__main__':
+    #Startup against the bus emulator: board booting for 1.5s, initial pose move of 3 servos
+    from windowx_bus_emulator import *
+    emulator = BusEmulator(boot=1.5)
+    client = EmulatorClient(emulator.port)
+    ping = lambda i: client.execute(i, PING, [])
+    def positions():
+        values = client.execute(BROADCAST, SYNC_READ, [2, 3, 4, P_PRESENT_POSITION_L, 2])
+        return [values[2*i] + (values[2*i+1] << 8) for i in range(3)] if values else None
+    t_servos = wait_for_servos(ping, range(1, 7))
+    print("servos answered after %.2fs" % t_servos)
+    goals = [1710, 1577, 2170]
+    client.execute(BROADCAST, SYNC_WRITE, [P_TORQUE_LIMIT_L, 2, 2, 0x33, 0x01, 3, 0x33, 0x01, 4, 0x33, 0x01])
+    client.execute(BROADCAST, SYNC_WRITE, [P_GOAL_POSITION_L, 2] + sum([[i, g & 0xFF, g >> 8] for i, g in zip([2, 3, 4], goals)], []))
+    t_pose = wait_for_pose(positions, goals)
+    print("initial pose %s reached after %.2fs: %s" % (goals, t_pose, positions()))
+    print("time to ready %.2fs, against 13s of fixed sleeps" % (t_servos + t_pose))
+    client.close()
+    emulator.close()
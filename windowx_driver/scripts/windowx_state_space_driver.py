@@ -10,22 +10,46 @@ import operator
 import time
 from math import pi
 from arbotix_python.arbotix import ArbotiX
-from std_msgs.msg import Float32MultiArray, MultiArrayDimension, Bool
+from arbotix_python.ax12 import P_PRESENT_POSITION_L
+from std_msgs.msg import Float32MultiArray, MultiArrayDimension, Bool, Float32
+from windowx_msgs.msg import JointsState
 from servos_parameters import *
 from windowx_driver.srv import *
+from windowx_common.latency import loop_probe
+from windowx_common.log import ring_logger
+from windowx_bus import SLOTS, BusScheduler, RateAdapter, BusStats, BusStatsPublisher, READ, WRITE, OK, TIMEOUT, CHECKSUM, LOST, ERROR
+from windowx_startup import wait_for_servos, wait_for_pose
+from windowx_common.shm import ShmRing, ring_paths
+from windowx_observer import VelocityObserver
+from windowx_serial import set_low_latency, SerialLink, measure_rtt
+from windowx_common.singularity import SingularityMap, SHUTDOWN_MANIPULABILITY, WARNING_MANIPULABILITY
 
 class WindowxNode(ArbotiX):
     """Node to control in torque the dynamixel servos"""
     def __init__(self, serial_port, robot_name):
         #Initialize arbotix comunications
-        print"\nArbotix initialization for " + robot_name + ", wait 10 seconds..."
+        print"\nArbotix initialization for " + robot_name + ", waiting for the servos to answer..."
+        t_start = time.time()
+        self.link = None
         ArbotiX.__init__(self, port=serial_port)
-        for x in xrange(1,21):
-            time.sleep(0.5)
-            print(str(x*0.5) + "/10s for " + robot_name)
-            if rospy.is_shutdown():
-                break
-        print robot_name + " Done."
+        #Low latency serial mode (~low_latency): ASYNC_LOW_LATENCY and 1ms FTDI latency timer, one write per packet
+        #and exact length reads with a ~serial_timeout timeout for every transaction
+        if rospy.get_param(rospy.get_name() + "/low_latency", False):
+            settings = set_low_latency(self._ser.fileno(), serial_port)
+            self.link = SerialLink(self._ser.fileno(), rospy.get_param(rospy.get_name() + "/serial_timeout", 0.005))
+            rospy.loginfo(robot_name + ": low latency serial mode, port settings: %s", ', '.join(settings) or 'none supported')
+        #The ArbotiX resets when the port is opened: ping the servos until all of them answer
+        t_servos = wait_for_servos(self.ping, range(1, 7), is_shutdown=rospy.is_shutdown)
+        #Round trip times of the bus with the serial settings in use
+        ping_rtt = measure_rtt(lambda: self.ping(2))
+        read_rtt = measure_rtt(lambda: self.syncRead([2, 3, 4], P_PRESENT_POSITION_L, 4))
+        if ping_rtt and read_rtt:
+            rospy.loginfo(robot_name + ": round trip ping p50 %.2fms max %.2fms, state read p50 %.2fms max %.2fms", 1e3 * ping_rtt[len(ping_rtt)//2],
+                          1e3 * ping_rtt[-1], 1e3 * read_rtt[len(read_rtt)//2], 1e3 * read_rtt[-1])
+        if t_servos is None:
+            rospy.logwarn(robot_name + ": not all the servos answered the ping, going on anyway")
+        else:
+            print(robot_name + " Done, servos answered in %.2fs." % t_servos)
 
         #reset vel limit
         print"Reset max vels for " + robot_name
@@ -47,7 +71,10 @@ class WindowxNode(ArbotiX):
         pos_msg = [[1, int(MX_POS_CENTER)], [2, int(1710)], [3, int(1577)], [4, int(2170)], [5, int(AX_POS_CENTER)], [6,int(AX_POS_CENTER)]]
 
         self.syncSetTorque(max_torque_msg, pos_msg)
-        time.sleep(3)
+        #Wait for joints 2, 3 and 4 to reach the initial pose, or to stop against something
+        t_pose = wait_for_pose(lambda: self.syncGetPos([2, 3, 4]), [1710, 1577, 2170], is_shutdown=rospy.is_shutdown)
+        if t_pose is None:
+            rospy.logwarn(robot_name + ": initial pose not reached, going on anyway")
 
         print(robot_name + ": Closing gruppers")
         self.setPosition(int(6), 50)
@@ -76,13 +103,91 @@ class WindowxNode(ArbotiX):
         self.vels_to_pub.layout.dim = [self.vels_layout]
         self.vels_to_pub.layout.data_offset = 0
 
-        #ROS pubblisher for joint velocities and positions
-        self.pos_pub = rospy.Publisher('/windowx_3links_'+ robot_name +'/joints_poses', Float32MultiArray, queue_size=1)
-        self.vel_pub = rospy.Publisher('/windowx_3links_'+ robot_name +'/joints_vels', Float32MultiArray, queue_size=1)
-        self.pub_rate = rospy.Rate(150)
-
-        #ROS listener for control torues
-        self.torque_sub = rospy.Subscriber('windowx_3links_'+ robot_name +'/torques', Float32MultiArray, self._torque_callback, queue_size=1)
+        #ROS pubblisher of the joints state, one message per bus cycle with the time of the read
+        self.state = JointsState()
+        self.state_pub = rospy.Publisher('/windowx_3links_'+ robot_name +'/joints_state', JointsState, queue_size=1)
+        #~read_load: present loads in the same sync read, ~legacy_topics: also the old joints_poses and joints_vels topics
+        self.read_load = rospy.get_param(rospy.get_name() + "/read_load", False)
+        self.legacy_topics = rospy.get_param(rospy.get_name() + "/legacy_topics", False)
+        self.joints_loads = [0,0,0,0,0]
+        if self.legacy_topics:
+            self.pos_pub = rospy.Publisher('/windowx_3links_'+ robot_name +'/joints_poses', Float32MultiArray, queue_size=1)
+            self.vel_pub = rospy.Publisher('/windowx_3links_'+ robot_name +'/joints_vels', Float32MultiArray, queue_size=1)
+        #Positions and velocities come with a single sync read per cycle, ~rate can go above the old 150Hz
+        self.rate = rospy.get_param(rospy.get_name() + "/rate", 150)
+        #Velocity observer over the positions (~velocity_observer), mandatory when the present speeds are not read
+        #(~read_velocities false, shorter sync read for higher rates). ~observer_inertia of joints 2-4 to use the
+        #commanded torques, empty to ignore them. With both the raw and the estimated velocities of joints 2-4 are
+        #published side by side on velocity_check.
+        self.read_vels = rospy.get_param(rospy.get_name() + "/read_velocities", True)
+        self.observer = None
+        if rospy.get_param(rospy.get_name() + "/velocity_observer", False) or not self.read_vels:
+            self.observer = VelocityObserver(3, rospy.get_param(rospy.get_name() + "/observer_acc_noise", 20.0),
+                                             inertia=rospy.get_param(rospy.get_name() + "/observer_inertia", []))
+        if not self.read_vels:
+            rospy.logwarn(robot_name + ": present speeds not read, velocities estimated from the positions: rms error ~0.08rad/s "
+                          "against ~0.003rad/s of the servos (see windowx_observer.py)")
+        self.vel_check = Float32MultiArray()
+        self.vel_check.layout.dim = [MultiArrayDimension('velocity_check', 6, 0)]
+        self.vel_check.layout.data_offset = 0
+        self.vel_check_pub = rospy.Publisher('/windowx_3links_'+ robot_name +'/velocity_check', Float32MultiArray, queue_size=1)
+
+        #Records of the torque callback and of the bus loop, one logger per thread, printed by background threads
+        self.torque_log = ring_logger(6)
+        self.LOG_TORQUE_LIMIT = self.torque_log.channel(robot_name + ' max torque limit', ['tau2', 'tau3', 'tau4', 'steps2', 'steps3', 'steps4'])
+        self.log = ring_logger(3)
+        self.LOG_VEL_GLITCH = self.log.channel(robot_name + ' velocity out of range', ['joint', 'vel', 'steps'])
+        #Latency of the torque messages handling, the bus write is timed by the bus scheduler
+        self.torque_probe = loop_probe('windowx_3links_' + robot_name + '_torques', 1.0/self.rate, ('compute',))
+        #Single owner of the serial port: state read, torque write and gripper moves in fixed slots of each cycle.
+        #An exception in a slot is logged and counted, the node shuts down after ~max_bus_failures consecutive failed cycles
+        self.bus = BusScheduler(self.rate, self._read_state, self._publish_state,
+                                loop_probe('windowx_3links_' + robot_name + '_bus', 1.0/self.rate, SLOTS),
+                                on_error=self._bus_error, max_failures=rospy.get_param(rospy.get_name() + "/max_bus_failures", 50))
+        #Per servo counts, failures, retries and round trip times of the bus transactions, on /diagnostics every ~bus_stats_period s
+        self.bus_stats = BusStats('windowx_3links_' + robot_name + ' bus', range(1, 7), rospy.get_param(rospy.get_name() + "/bus_stats_period", 2.0),
+                                  BusStatsPublisher())
+        #Proximity to the jacobian singularity from the map in ~singularity_map (windowx_common.singularity, built at startup
+        #when empty): shut down below the signed manipulability ~singularity_shutdown, warn below ~singularity_warning
+        #(defaults: the ones of joint 2 at -0.45rad and -0.55rad)
+        self.singularity = SingularityMap(rospy.get_param(rospy.get_name() + "/singularity_map", ''))
+        self.singularity_shutdown = rospy.get_param(rospy.get_name() + "/singularity_shutdown", SHUTDOWN_MANIPULABILITY)
+        self.singularity_warning = rospy.get_param(rospy.get_name() + "/singularity_warning", WARNING_MANIPULABILITY)
+        #Torque writes only for the servos whose steps moved by more than ~torque_deadband or whose direction changed,
+        #every servo is written again after ~torque_keepalive bus cycles. Counters in the bus probe reports and in the
+        #/diagnostics of the bus stats (also without ~latency_probe).
+        self.torque_deadband = rospy.get_param(rospy.get_name() + "/torque_deadband", 0)
+        self.torque_keepalive = rospy.get_param(rospy.get_name() + "/torque_keepalive", 30)
+        self.written_torque = {}
+        self.written_direction = {}
+        self.written_cycle = {}
+        self.torque_writes = 0
+        self.skipped_torque_writes = 0
+        self.skipped_servo_writes = 0
+        self.keepalive_writes = 0
+        self.bus.probe.extra = self._write_counters
+        self.bus_stats.extra = self._write_counters
+        #Adaptive rate (~adaptive_rate) between ~min_rate and ~max_rate: the highest one with at most ~max_loss lost
+        #packets and time left for the read and the write. The rate in use is latched on bus_rate for the controllers.
+        self.rate_adapter = None
+        if rospy.get_param(rospy.get_name() + "/adaptive_rate", False):
+            self.rate_adapter = RateAdapter(self.rate, rospy.get_param(rospy.get_name() + "/min_rate", 50), rospy.get_param(rospy.get_name() + "/max_rate", 300),
+                                            max_loss=rospy.get_param(rospy.get_name() + "/max_loss", 0.02))
+        self.rate_pub = rospy.Publisher('/windowx_3links_'+ robot_name +'/bus_rate', Float32, queue_size=1, latch=True)
+        self.rate_pub.publish(Float32(self.rate))
+        #Shared memory transport with the controller on the same host (~shm_transport): states and torques go
+        #through the rings in ~shm_dir, the torques topic is left to monitoring. After publishing a state the bus
+        #waits at most ~shm_torque_wait seconds for the torques computed from it, to write them in the same cycle.
+        self.state_ring = None
+        if rospy.get_param(rospy.get_name() + "/shm_transport", False):
+            state_path, torque_path = ring_paths(robot_name, rospy.get_param(rospy.get_name() + "/shm_dir", '/dev/shm'))
+            self.state_ring = ShmRing(state_path)
+            self.torque_ring = ShmRing(torque_path)
+            self.torque_wait = rospy.get_param(rospy.get_name() + "/shm_torque_wait", 0.001)
+            self.last_torque = self.torque_ring.head() - 1
+        else:
+            #ROS listener for control torues
+            self.torque_sub = rospy.Subscriber('windowx_3links_'+ robot_name +'/torques', Float32MultiArray, self._torque_callback, queue_size=1)
         self.gripper_sub = rospy.Subscriber('windowx_3links_'+ robot_name +'/gripper', Bool, self._gripper_callback, queue_size=1)
 
         #Topic for checkings
@@ -106,23 +211,32 @@ class WindowxNode(ArbotiX):
         print"\nWindowx_3link_" + robot_name + " node created, whaiting for messages in:"
         print"      windowx_3links_" + robot_name + "/torque"
         print"Publishing joints' positions and velocities in:"
-        print"      /windowx_3links_" + robot_name + "/joints_poses"
-        print"      /windowx_3links_" + robot_name + "/joints_vels"
+        print"      /windowx_3links_" + robot_name + "/joints_state"
+        if self.legacy_topics:
+            print"      /windowx_3links_" + robot_name + "/joints_poses"
+            print"      /windowx_3links_" + robot_name + "/joints_vels"
         print"Scurity stop server running: windowx_3links_" + robot_name + "/security_stop"
-        #Start publisher
-        self.publish()
+        rospy.loginfo(robot_name + ": ready in %.2fs (servos answered in %s, initial pose in %s)", time.time() - t_start,
+                      "%.2fs" % t_servos if t_servos is not None else "timeout", "%.2fs" % t_pose if t_pose is not None else "timeout")
 
     def _torque_callback(self, msg):
         """
         ROS callback
         """
 
+        self.torque_probe.start()
         #Initialize freqency estimation
         if self.first_torque:
             old_time = rospy.get_rostime()
             self.first_torque = False
 
-        goal_torque = msg.data
+        self._set_torques(msg.data)
+        self.torque_probe.lap()
+
+    def _set_torques(self, goal_torque):
+        """
+        Torque steps and directions of goal_torque, written in the next write slot of the bus
+        """
         goal_torque_steps = [0,0,0]
         direction = [0,0,0]
         #Setup torque steps
@@ -134,17 +248,8 @@ class WindowxNode(ArbotiX):
         goal_torque_steps[2] = min(int(MX28_TORQUE_UNIT * abs(goal_torque[3])), int(max3))
 
         if goal_torque_steps[0] == int(max1) or goal_torque_steps[1] == int(max2) or goal_torque_steps[2] == int(max3):
-            print("\nWARNING, "+ robot_name +" MAX TORQUE LIMIT REACHED FOR ID: ")
-            if goal_torque_steps[0] == int(max1):
-                print("2")
-            if goal_torque_steps[1] == int(max2):
-                print("3")
-            if goal_torque_steps[2] == int(max3):
-                print("4")
-            print("goal_torque:")
-            print(goal_torque)
-            print("goal_torque_steps:")
-            print(goal_torque_steps)
+            #The saturated IDs are the ones with steps at MX_TORQUE_STEPS/2
+            self.torque_log.push(self.LOG_TORQUE_LIMIT, goal_torque[1], goal_torque[2], goal_torque[3], goal_torque_steps[0], goal_torque_steps[1], goal_torque_steps[2])
 
         # print("joints_poses")
         # print(self.joints_poses)
@@ -167,7 +272,9 @@ class WindowxNode(ArbotiX):
 
         torque_msg = [[2, goal_torque_steps[0]], [3, goal_torque_steps[1]], [4, goal_torque_steps[2]]]
         direction_msg = [[2, direction[0]], [3, direction[1]], [4, direction[2]]]
-        self.syncSetTorque(torque_msg, direction_msg)
+        self.bus.write_torque(self._write_torques, torque_msg, direction_msg)
+        if self.observer is not None:
+            self.observer.command(goal_torque[1:4])
 
         #####read present loads and confront with applied torques: ##########
         # present_load = [0,0,0]
@@ -198,65 +305,221 @@ class WindowxNode(ArbotiX):
         #     self.freq_sum = 0
         #     self.old_time = rospy.get_rostime()
 
+    def _write_torques(self, torque_msg, direction_msg):
+        """
+        Write slot of the bus: sync write of the servos whose torque or direction changed from the last written ones
+        """
+        cycle = self.bus.cycles
+        torques = []
+        directions = []
+        keepalive = False
+        for (ID, steps), (direction_ID, direction) in zip(torque_msg, direction_msg):
+            if ID in self.written_torque and direction == self.written_direction[ID] and \
+               abs(steps - self.written_torque[ID]) <= self.torque_deadband:
+                if cycle - self.written_cycle[ID] < self.torque_keepalive:
+                    self.skipped_servo_writes += 1
+                    continue
+                keepalive = True
+            torques.append([ID, steps])
+            directions.append([ID, direction])
+        if not torques:
+            self.skipped_torque_writes += 1
+            return
+        t = time.time()
+        try:
+            self.syncSetTorque(torques, directions)
+        except Exception:
+            self.bus_stats.record(WRITE, [ID for ID, steps in torques], time.time() - t, ERROR)
+            raise
+        self.bus_stats.record(WRITE, [ID for ID, steps in torques], time.time() - t)
+        self.torque_writes += 1
+        if keepalive:
+            self.keepalive_writes += 1
+        for (ID, steps), (direction_ID, direction) in zip(torques, directions):
+            self.written_torque[ID] = steps
+            self.written_direction[ID] = direction
+            self.written_cycle[ID] = cycle
+
+    def _write_counters(self):
+        return [('torque writes', self.torque_writes), ('torque writes skipped', self.skipped_torque_writes),
+                ('servo writes skipped', self.skipped_servo_writes), ('keep-alive writes', self.keepalive_writes)]
+
     def _gripper_callback(self, msg):
         """
         ROS callback
         """
         if msg.data:
-            self.setPosition(int(6), 50)
+            self.bus.submit(self._move_gripper, 50)
         else:
-            self.setPosition(int(6), AX_POS_CENTER)
+            self.bus.submit(self._move_gripper, AX_POS_CENTER)
+
+    def _move_gripper(self, position):
+        counters = self._link_counters()
+        t = time.time()
+        reply = self.setPosition(int(6), position)
+        self.bus_stats.record(WRITE, [6], time.time() - t, self._outcome(reply is not None and reply != -1, counters))
 
 
     def publish(self):
+        """
+        Run the bus cycles until shutdown
+        """
+        self.bus.run(rospy.is_shutdown)
+        if self.bus.failed:
+            rospy.logerr(robot_name + ": %d consecutive bus cycles failed (errors per slot: %s). Shutting Down.", self.bus.max_failures, self.bus.errors)
+            rospy.signal_shutdown("bus failure")
+
+    def _bus_error(self, slot, e):
+        self.bus_stats.loop_error(slot)
+        rospy.logerr_throttle(1.0, robot_name + ": bus %s slot failed: %r" % (slot, e))
+
+    def _read_state(self):
+        #MX-* servos poses and vels
+        #self.joints_poses[0] = MX_POS_UNIT * (self.getPosition(1) - MX_POS_CENTER)
+        #The servos sample their registers when the request arrives: stamp with the time it is sent
+        t_read = rospy.get_rostime()
+        t = time.time()
+        state = self.syncGetState([2, 3, 4], self.read_load, self.read_vels)
+        return (t_read, self.bus.cycles, time.time() - t) + state
+
+    def _publish_state(self, state):
         rad_mx_step = (pi/30) * MX_VEL_UNIT
         #rad_ax_step = (pi/30) * AX_VEL_UNIT
-        while not rospy.is_shutdown():
-            #MX-* servos poses
-            #self.joints_poses[0] = MX_POS_UNIT * (self.getPosition(1) - MX_POS_CENTER)
-            present_positions = self.syncGetPos([2, 3, 4])
-            present_vels = self.syncGetVel([2,3,4])
-            #Check if got good values for position and vels otherwise repeat the reading
-            if not -1 in present_vels and not -1 in present_positions:
-                self.joints_poses[1] = MX_POS_UNIT * (int(MX_POS_CENTER + MX_POS_CENTER/2) - present_positions[0])
-                self.joints_poses[2] = MX_POS_UNIT * (present_positions[1] - int(MX_POS_CENTER + MX_POS_CENTER/2))
-                if self.joints_poses[2] > -0.45:
-                    rospy.logerr(robot_name + ": Joint 2 near jacobian singularity. Shutting Down. Actual position: %frad, singularity in: -0.325rad", self.joints_poses[2])
-                    rospy.signal_shutdown(robot_name + ": Joint 2 near jacobian singularity.")
-                elif self.joints_poses[2] > -0.55: #I'm near the Jacobian sigularity => send warning
-                    rospy.logwarn(robot_name + ": Joint 2 is approaching the jacobian singularity (actual position: %frad, singularity in: -0.325rad): Move away from here.", self.joints_poses[2])
-
-                self.joints_poses[3] = MX_POS_UNIT * (present_positions[2] - MX_POS_CENTER)
-                #AX 12 servos poses
-                #self.joints_poses[4] = AX_POS_UNIT * (self.getPosition(5) - AX_POS_CENTER)
-                #self.joints_poses[5] = self.ee_closed
-
-                #MX-* servos vels
+        t_read, cycle, rtt, present_positions, present_vels, present_loads = state
+        if self.rate_adapter is not None:
+            rate = self.rate_adapter.update(-1 in present_positions, rtt, self.bus.write_cost)
+            if rate is not None:
+                self.rate = rate
+                self.bus.set_rate(rate)
+                self.torque_probe.period = 1.0/rate
+                self.rate_pub.publish(Float32(rate))
+                rospy.loginfo(robot_name + ": bus rate %.0fHz (%.1f%% lost packets, read p95 %.2fms)", rate,
+                              100 * self.rate_adapter.loss, 1e3 * self.rate_adapter.rtt_p95)
+        #Check if got good values for position and vels otherwise the reading is repeated in the next cycle
+        if not -1 in present_positions:
+            self.joints_poses[1] = MX_POS_UNIT * (int(MX_POS_CENTER + MX_POS_CENTER/2) - present_positions[0])
+            self.joints_poses[2] = MX_POS_UNIT * (present_positions[1] - int(MX_POS_CENTER + MX_POS_CENTER/2))
+            self.joints_poses[3] = MX_POS_UNIT * (present_positions[2] - MX_POS_CENTER)
+            manipulability, rcond, rcond_grasp = self.singularity.lookup(self.joints_poses[2], self.joints_poses[3])
+            if manipulability < self.singularity_shutdown:
+                rospy.logerr(robot_name + ": Joint 2 near jacobian singularity. Shutting Down. Actual position: %frad, manipulability %.2e (shutdown below %.2e), singularity in: -0.325rad", self.joints_poses[2], manipulability, self.singularity_shutdown)
+                rospy.signal_shutdown(robot_name + ": Joint 2 near jacobian singularity.")
+            elif manipulability < self.singularity_warning: #I'm near the Jacobian sigularity => send warning
+                rospy.logwarn(robot_name + ": Joint 2 is approaching the jacobian singularity (actual position: %frad, manipulability %.2e, inverse condition number %.3f, singularity in: -0.325rad): Move away from here.", self.joints_poses[2], manipulability, rcond)
+
+            #AX 12 servos poses
+            #self.joints_poses[4] = AX_POS_UNIT * (self.getPosition(5) - AX_POS_CENTER)
+            #self.joints_poses[5] = self.ee_closed
+
+            #MX-* servos vels
+            if present_vels is not None:
                 for j in xrange(1,4):
                     if present_vels[j-1] < MX_VEL_CENTER:
                         self.joints_vels[j] = rad_mx_step * present_vels[j-1]
                     else:
                         self.joints_vels[j] = rad_mx_step * (MX_VEL_CENTER - present_vels[j-1])
                         if self.joints_vels[j] < -5:
-                            print(self.joints_vels[j])
-                            print(present_vels[j-1])
+                            self.log.push(self.LOG_VEL_GLITCH, j, self.joints_vels[j], present_vels[j-1])
 
                 #Invert second joint velocity sign
                 self.joints_vels[1] = -1*self.joints_vels[1]
-                # #AX 12 servos vels
-                # actualax_step_speed = self.getSpeed(5)
-                # if actualax_step_speed < AX_VEL_CENTER:
-                #     self.joints_vels[4] = rad_ax_step * actualax_step_speed
-                # else:
-                #     self.joints_vels[4] = rad_ax_step * (AX_VEL_CENTER - actualax_step_speed)
-
+            if self.observer is not None:
+                estimated = self.observer.update(t_read.to_sec(), self.joints_poses[1:4]).tolist()
+                if present_vels is not None:
+                    self.vel_check.data = self.joints_vels[1:4] + estimated
+                    self.vel_check_pub.publish(self.vel_check)
+                self.joints_vels[1:4] = estimated
+            if present_loads is not None:
+                #Same direction bit as the speed, fraction of the max torque
+                for j in xrange(1,4):
+                    if present_loads[j-1] < MX_VEL_CENTER:
+                        self.joints_loads[j] = present_loads[j-1] / MX_TORQUE_STEPS
+                    else:
+                        self.joints_loads[j] = (MX_VEL_CENTER - present_loads[j-1]) / MX_TORQUE_STEPS
+                self.joints_loads[1] = -1*self.joints_loads[1]
+            # #AX 12 servos vels
+            # actualax_step_speed = self.getSpeed(5)
+            # if actualax_step_speed < AX_VEL_CENTER:
+            #     self.joints_vels[4] = rad_ax_step * actualax_step_speed
+            # else:
+            #     self.joints_vels[4] = rad_ax_step * (AX_VEL_CENTER - actualax_step_speed)
+
+            self.state.header.stamp = t_read
+            self.state.cycle = cycle
+            self.state.positions = self.joints_poses
+            self.state.velocities = self.joints_vels
+            self.state.loads = self.joints_loads if present_loads is not None else []
+            self.state_pub.publish(self.state)
+            if self.legacy_topics:
                 self.poses_to_pub.data = self.joints_poses
                 self.vels_to_pub.data = self.joints_vels
                 self.pos_pub.publish(self.poses_to_pub)
                 self.vel_pub.publish(self.vels_to_pub)
-                self.pub_rate.sleep()
-            else:
-                rospy.logwarn(robot_name + ": Lost packet at %fs", rospy.get_rostime().to_sec()) # If getting lost packets check return delay of servos or reduce publish rate for torques and/or joints vels and poses
+            if self.state_ring is not None:
+                self.state_ring.write(t_read.to_sec(), cycle, self.joints_poses + self.joints_vels)
+                record = self.torque_ring.wait(self.last_torque, self.torque_wait)
+                if record is not None:
+                    self.last_torque = record[0]
+                    self._set_torques(record[3][0:6])
+        else:
+            rospy.logwarn(robot_name + ": Lost packet at %fs", rospy.get_rostime().to_sec()) # If getting lost packets check return delay of servos or reduce publish rate for torques and/or joints vels and poses
+
+    def execute(self, index, ins, params, ret=True):
+        """
+        ArbotiX transaction, through the low latency link when enabled
+        """
+        if self.link is None:
+            return ArbotiX.execute(self, index, ins, params, ret)
+        self._mutex.acquire()
+        try:
+            return self.link.execute(index, ins, params, ret)
+        finally:
+            self._mutex.release()
+
+    def _link_counters(self):
+        return (self.link.timeouts, self.link.checksum_errors) if self.link is not None else None
+
+    def _outcome(self, ok, counters):
+        """
+        Outcome of a transaction for the bus statistics, timeouts and checksum errors are told apart by the low latency link
+        """
+        if ok:
+            return OK
+        if counters is None:
+            return LOST
+        if self.link.checksum_errors > counters[1]:
+            return CHECKSUM
+        return TIMEOUT
+
+    def syncGetState(self, servos, load=False, vel=True):
+        """
+        Present positions, speeds (vel) and loads (load) of servos in one bus transaction: sync read of
+        the adjacent registers from P_PRESENT_POSITION_L to P_PRESENT_POSITION_H, P_PRESENT_SPEED_H or
+        P_PRESENT_LOAD_H (the speeds are read with the loads). On a lost packet all values are -1,
+        speeds and loads are None when not read.
+        """
+        vel = vel or load
+        n = 6 if load else (4 if vel else 2)
+        counters = self._link_counters()
+        t = time.time()
+        try:
+            values = self.syncRead(servos, P_PRESENT_POSITION_L, n)
+        except Exception:
+            values = None
+        rtt = time.time() - t
+        if not values or len(values) < n*len(servos) or -1 in values:
+            self.bus_stats.record(READ, servos, rtt, self._outcome(False, counters))
+            lost = [-1]*len(servos)
+            return lost, lost if vel else None, lost if load else None
+        self.bus_stats.record(READ, servos, rtt)
+        positions = [values[n*i] + (values[n*i+1] << 8) for i in xrange(len(servos))]
+        for servo, position in zip(servos, positions):
+            #A servo that did not answer the board
+            if position > MX_POS_STEPS:
+                self.bus_stats.bad_value(READ, servo)
+        vels = [values[n*i+2] + (values[n*i+3] << 8) for i in xrange(len(servos))] if vel else None
+        loads = [values[n*i+4] + (values[n*i+5] << 8) for i in xrange(len(servos))] if load else None
+        return positions, vels, loads
 
     def _sec_stop(self, req):
         rospy.logerr(req.reason)
@@ -267,6 +530,8 @@ class WindowxNode(ArbotiX):
         Disable all servos.
         """
         print robot_name + ": Disabling servos please wait..."
+        #Wait for the bus scheduler to release the serial port
+        self.bus.stop()
         max_torque_msg = [[1, 0], [2, 0], [3, 0], [4, 0], [5, 0], [6, int(AX_TORQUE_STEPS/4)]]
         pos_msg = [[1, int(MX_POS_CENTER)], [2, int(1710)], [3, int(1577)], [4, int(2170)], [5, int(AX_POS_CENTER)], [6, int(AX_POS_CENTER)]]
         self.syncSetTorque(max_torque_msg, pos_msg)
@@ -281,6 +546,8 @@ if __name__ == '__main__':
     serial_port = rospy.get_param(rospy.get_name() + "/serial_port")
     #Create windowx arm object
     wn = WindowxNode(serial_port, robot_name)
-    #Handle shutdown
+    #Handle shutdown, registered before the bus cycles start
     rospy.on_shutdown(wn.tourn_off_arm)
+    #Start publisher
+    wn.publish()
     rospy.spin()
@@ -0,0 +1,11 @@
+## ! DO NOT MANUALLY INVOKE THIS setup.py, USE CATKIN INSTEAD
+
+from distutils.core import setup
+from catkin_pkg.python_setup import generate_distutils_setup
+
+#windowx_common: modules shared by the driver and the controllers
+setup_args = generate_distutils_setup(
+    packages=['windowx_common'],
+    package_dir={'': 'src'})
+
+setup(**setup_args)
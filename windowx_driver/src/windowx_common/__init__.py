@@ -0,0 +1,5 @@
+"""
+Modules shared by the windowx_driver and windowx_controller nodes: latency probes (latency), ring
+buffer logger (log), shared memory transport (shm), link lengths of the arm (links) and singularity
+map (singularity).
+"""
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+
+"""
+Per tick latency probes of the control and driver loops.
+Each loop tick is split in phases (sense, compute, publish, ...) closed by lap(); the durations,
+the whole busy time and the start to start cycle go in HDR-style histograms (exact below 64us,
+32 linear sub-buckets per power of two above, ~3% resolution). Once per second p50/p99/max and
+the ticks whose busy time overran the loop period (none for an unpaced loop, period None) are published as a diagnostic_msgs/DiagnosticArray
+on /diagnostics. With the ~latency_probe parameter set to false the node gets a probe that does nothing.
+"""
+
+import time
+
+#Monotonic clock where available (python 3), wall clock otherwise
+_now = getattr(time, 'perf_counter', time.time)
+
+SUB_BITS = 5
+SUB_BUCKETS = 1 << SUB_BITS
+MAX_US = (1 << 26) - 1 #~67s, longer samples are clamped
+REPORT_PERIOD = 1.0
+
+class LatencyHistogram():
+    """Log-linear histogram of durations in microseconds"""
+    def __init__(self):
+        max_shift = MAX_US.bit_length() - (SUB_BITS + 1)
+        self.counts = [0] * ((max_shift + 2) * SUB_BUCKETS)
+        self.reset()
+
+    def reset(self):
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.max = 0
+
+    def record(self, us):
+        """
+        Add a sample, us an integer number of microseconds
+        """
+        if us > MAX_US:
+            us = MAX_US
+        elif us < 0:
+            us = 0
+        if us < 2 * SUB_BUCKETS:
+            self.counts[us] += 1
+        else:
+            shift = us.bit_length() - (SUB_BITS + 1)
+            self.counts[shift * SUB_BUCKETS + (us >> shift)] += 1
+        self.count += 1
+        if us > self.max:
+            self.max = us
+
+    def value(self, bucket):
+        """
+        Middle of the range of values counted in bucket
+        """
+        if bucket < 2 * SUB_BUCKETS:
+            return bucket
+        shift = bucket // SUB_BUCKETS - 1
+        return ((bucket - shift * SUB_BUCKETS) << shift) + (1 << (shift - 1))
+
+    def percentile(self, p):
+        """
+        Value below which p percent of the samples are, 0 without samples
+        """
+        if not self.count:
+            return 0
+        rank = max(1, int(p / 100.0 * self.count + 0.5))
+        seen = 0
+        for bucket, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self.value(bucket), self.max)
+        return self.max
+
+
+class NullProbe():
+    """Probe of a loop with the instrumentation disabled"""
+    def start(self):
+        pass
+
+    def lap(self):
+        pass
+
+
+class LoopProbe():
+    """Timing probe of the phases of a loop running at a nominal period (s), None for a loop that is not paced"""
+    def __init__(self, name, period, phases=('sense', 'compute', 'publish'), publisher=None):
+        self.name = name
+        self.period = period
+        self.phases = tuple(phases)
+        self.histograms = [LatencyHistogram() for p in self.phases]
+        self.busy = LatencyHistogram()
+        self.cycle = LatencyHistogram()
+        self.overruns = 0
+        self.overruns_total = 0
+        self.ticks_total = 0
+        self.publisher = publisher
+        #Optional callable returning more (key, value) of the loop, added to the reports
+        self.extra = None
+        self.phase = len(self.phases)
+        self.t_start = None
+        self.t_lap = None
+        self.next_report = _now() + REPORT_PERIOD
+
+    def start(self):
+        """
+        Beginning of a tick, the first phase starts here
+        """
+        t = _now()
+        if t >= self.next_report:
+            self.report()
+            self.next_report += REPORT_PERIOD
+            if self.next_report < t:
+                self.next_report = t + REPORT_PERIOD
+            t = _now()
+        if self.t_start is not None:
+            self.cycle.record(int((t - self.t_start) * 1e6))
+        self.t_start = t
+        self.t_lap = t
+        self.phase = 0
+
+    def lap(self):
+        """
+        End of the current phase, the tick is complete after the last one
+        """
+        if self.phase >= len(self.phases):
+            return
+        t = _now()
+        self.histograms[self.phase].record(int((t - self.t_lap) * 1e6))
+        self.t_lap = t
+        self.phase += 1
+        if self.phase == len(self.phases):
+            busy = t - self.t_start
+            self.busy.record(int(busy * 1e6))
+            self.ticks_total += 1
+            if self.period is not None and busy > self.period:
+                self.overruns += 1
+                self.overruns_total += 1
+
+    def summary(self):
+        """
+        List of (key, value) of the current report window
+        """
+        values = []
+        for name, h in list(zip(self.phases, self.histograms)) + [('busy', self.busy), ('cycle', self.cycle)]:
+            values.append((name + ' p50 [us]', h.percentile(50)))
+            values.append((name + ' p99 [us]', h.percentile(99)))
+            values.append((name + ' max [us]', h.max))
+        values.append(('ticks', self.busy.count))
+        values.append(('overruns', self.overruns))
+        values.append(('overruns total', self.overruns_total))
+        if self.period is not None:
+            values.append(('period [us]', int(self.period * 1e6)))
+        if self.extra is not None:
+            values.extend(self.extra())
+        return values
+
+    def report(self):
+        """
+        Publish the report window and start a new one
+        """
+        if self.publisher is not None:
+            self.publisher(self)
+        for h in self.histograms:
+            h.reset()
+        self.busy.reset()
+        self.cycle.reset()
+        self.overruns = 0
+
+
+class DiagnosticsPublisher():
+    """Publisher of the LoopProbe reports on /diagnostics"""
+    def __init__(self, topic='/diagnostics'):
+        #ROS imports here, the histograms and probes do not need a ROS installation
+        import rospy
+        from diagnostic_msgs.msg import DiagnosticArray, DiagnosticStatus, KeyValue
+        self.rospy = rospy
+        self.DiagnosticArray = DiagnosticArray
+        self.DiagnosticStatus = DiagnosticStatus
+        self.KeyValue = KeyValue
+        self.pub = rospy.Publisher(topic, DiagnosticArray, queue_size=1)
+
+    def __call__(self, probe):
+        status = self.DiagnosticStatus()
+        status.name = probe.name + ': loop latency'
+        status.hardware_id = self.rospy.get_name()
+        if probe.overruns:
+            status.level = self.DiagnosticStatus.WARN
+            status.message = '%d overruns of the %.1fms period' % (probe.overruns, probe.period * 1e3)
+        else:
+            status.level = self.DiagnosticStatus.OK
+            status.message = 'OK'
+        status.values = [self.KeyValue(key, str(value)) for key, value in probe.summary()]
+        msg = self.DiagnosticArray()
+        msg.header.stamp = self.rospy.get_rostime()
+        msg.status = [status]
+        self.pub.publish(msg)
+
+
+def loop_probe(name, period, phases=('sense', 'compute', 'publish')):
+    """
+    Probe of a loop of the node, publishing on /diagnostics, or a NullProbe when
+    the private parameter ~latency_probe is false (default true). period is None for a loop
+    running as fast as its reads allow, its overruns are not counted.
+    """
+    import rospy
+    if not rospy.get_param('~latency_probe', True):
+        return NullProbe()
+    return LoopProbe(name, period, phases, DiagnosticsPublisher())
+
+
+if __name__ == '__main__':
+    #Percentiles of known distributions and cost of the probe
+    import random
+    h = LatencyHistogram()
+    samples = [random.randint(0, 20000) for i in range(100000)]
+    for s in samples:
+        h.record(s)
+    samples.sort()
+    for p in (50, 99):
+        exact = samples[int(p / 100.0 * len(samples)) - 1]
+        print("p%d: %d us, exact %d us, error %.2f%%" % (p, h.percentile(p), exact, 100.0 * abs(h.percentile(p) - exact) / exact))
+    print("max: %d us, exact %d us" % (h.max, samples[-1]))
+
+    n = 100000
+    for probe in (NullProbe(), LoopProbe('benchmark', 1.0/150)):
+        t = _now()
+        for i in range(n):
+            probe.start()
+            probe.lap()
+            probe.lap()
+            probe.lap()
+        print("%-9s %.3f us per tick" % (probe.__class__.__name__, (_now() - t) / n * 1e6))
@@ -0,0 +1,12 @@
+#!/usr/bin/env python
+
+"""
+Link lengths [m] of the 3 links windowx arm (2nd, 3rd and 4th joints), shared by the kinematics and
+dynamics of the controllers (windowx_arm) and by the singularity map of the driver (singularity).
+"""
+
+L1_X = 0.141924
+L1_Y = -0.047767
+L2 = 0.14203
+L3 = 0.15036 #Link 3 length to the grasp point
+L3_DYN = 0.16036 #Link 3 length of the dynamic model, used by the cooperative controllers jacobians
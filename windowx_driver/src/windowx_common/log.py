@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+"""
+Asynchronous logger of the control and driver loops.
+The loop pushes fixed size numeric records (timestamp, channel, values) in a preallocated ring
+buffer, without locks (one producer, the loop, and one consumer). A background thread formats the
+records and writes them to the console or to a file at a throttled rate: at most max_lines records
+per write, the older ones are skipped. When the writer falls behind and the ring is full the new
+records are dropped, the loop never waits. Both are counted.
+"""
+
+import sys
+import time
+import threading
+import numpy as np
+
+class RingLogger():
+    """Ring buffer of numeric records written by a background thread"""
+    def __init__(self, stream=None, capacity=1024, width=16, rate=10.0, max_lines=20):
+        self.stream = stream or sys.stdout
+        self.capacity = capacity
+        self.width = width
+        self.period = 1.0/rate
+        self.max_lines = max_lines
+        #Row: time, channel, values
+        self.buffer = np.zeros((capacity, width + 2))
+        self.channels = []
+        #Producer owns head, consumer owns tail
+        self.head = 0
+        self.tail = 0
+        self.dropped = 0
+        self.skipped = 0
+        self.written = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='windowx_log')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def channel(self, name, fields):
+        """
+        Register a kind of record, fields are the names of its values. Returns the channel id.
+        """
+        if len(fields) > self.width:
+            raise ValueError("Channel %s has %d fields, the logger records at most %d" % (name, len(fields), self.width))
+        self.channels.append((name, tuple(fields)))
+        return len(self.channels) - 1
+
+    def push(self, channel, *values):
+        """
+        Add a record of channel from scalars and arrays, flattened in order.
+        Returns False if the record was dropped.
+        """
+        head = self.head
+        if head - self.tail >= self.capacity:
+            self.dropped += 1
+            return False
+        row = self.buffer[head % self.capacity]
+        row[0] = time.time()
+        row[1] = channel
+        k = 2
+        for v in values:
+            if isinstance(v, np.ndarray):
+                n = v.size
+                row[k:k + n] = v.flat
+                k += n
+            else:
+                row[k] = v
+                k += 1
+        #Publish the record only once it is complete
+        self.head = head + 1
+        return True
+
+    def format(self, row):
+        name, fields = self.channels[int(row[1])]
+        return '%.4f %s: %s' % (row[0], name, ' '.join('%s=%.5g' % (f, v) for f, v in zip(fields, row[2:])))
+
+    def flush(self):
+        """
+        Write the pending records, at most max_lines of them
+        """
+        head = self.head
+        tail = self.tail
+        if head - tail > self.max_lines:
+            self.skipped += head - tail - self.max_lines
+            tail = head - self.max_lines
+        lines = [self.format(self.buffer[i % self.capacity]) for i in range(tail, head)]
+        #Rows are formatted, the producer can reuse them
+        self.tail = head
+        if lines:
+            self.stream.write('\n'.join(lines) + '\n')
+            self.stream.flush()
+            self.written += len(lines)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._stop.wait(self.period)
+            try:
+                self.flush()
+            except (IOError, ValueError):
+                #Stream closed at shutdown
+                return
+
+    def close(self):
+        """
+        Stop the writer after a last flush
+        """
+        self._stop.set()
+        self._thread.join()
+        self.max_lines = self.capacity
+        self.flush()
+        self.stream.write('windowx_log: %d records written, %d skipped, %d dropped\n' % (self.written, self.skipped, self.dropped))
+        self.stream.flush()
+        if self.stream is not sys.stdout:
+            self.stream.close()
+
+
+def ring_logger(width=16):
+    """
+    Logger of the node, closed at shutdown. Private parameters: ~log_file (console when empty),
+    ~log_rate writes per second, ~log_lines records per write, ~log_capacity records in the ring.
+    """
+    import rospy
+    path = rospy.get_param('~log_file', '')
+    logger = RingLogger(open(path, 'a') if path else None, int(rospy.get_param('~log_capacity', 1024)), width,
+                        float(rospy.get_param('~log_rate', 10.0)), int(rospy.get_param('~log_lines', 20)))
+    rospy.on_shutdown(logger.close)
+    return logger
+
+
+if __name__ == '__main__':
+    #Cost of a push against printing the same values, and drops when the writer falls behind
+    import os
+    n = 20000
+    u = np.random.uniform(-1.0, 1.0, (3, 1))
+    tau = np.random.uniform(-1.0, 1.0, (3, 1))
+    devnull = open(os.devnull, 'w')
+    logger = RingLogger(devnull, capacity=4096, rate=100.0, max_lines=n)
+    FORCES = logger.channel('forces', ['x', 'y', 'theta', 'tau2', 'tau3', 'tau4'])
+    t = time.time()
+    for i in range(n):
+        logger.push(FORCES, u, tau)
+    t_push = (time.time() - t) / n
+    stdout = sys.stdout
+    sys.stdout = devnull
+    t = time.time()
+    for i in range(n):
+        print("Forces: ")
+        print(u)
+        print(tau)
+    t_print = (time.time() - t) / n
+    sys.stdout = stdout
+    logger.close()
+    print("push %.2f us, print %.2f us per record" % (t_push * 1e6, t_print * 1e6))
+    print("records written %d, skipped %d, dropped %d of %d" % (logger.written, logger.skipped, logger.dropped, n))
@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+
+"""
+Shared memory transport between the driver and the controllers running on the same host.
+A ShmRing is a memory mapped file (in /dev/shm) with a ring of fixed size records (stamp, cycle,
+values), one writer and any number of readers, no locks. Each slot is a seqlock: the writer makes
+the slot sequence odd, writes the record and makes it even again, a reader copies the record and
+retries if the sequence changed meanwhile or is not the one of the index it asked for. The head
+counter is moved only after the record is complete, readers never wait for the writer.
+The driver writes the joints states and reads the torques, the controllers the other way round;
+the ROS topics are still published for monitoring.
+"""
+
+import os
+import mmap
+import time
+import struct
+
+_now = getattr(time, 'perf_counter', time.time)
+
+MAGIC = b'WXSR'
+#magic, slots, width, reserved, head
+HEADER = struct.Struct('<4sIIIQ')
+HEAD_OFFSET = 16
+HEAD = struct.Struct('<Q')
+#seq, stamp, cycle, followed by width float64 values
+SLOT_HEADER = struct.Struct('<QdQ')
+SEQ = struct.Struct('<Q')
+
+class ShmRing():
+    """Seqlock ring buffer of numeric records in a memory mapped file"""
+    def __init__(self, path, slots=8, width=16):
+        """
+        Attach to the ring in path, created if missing. Writer and readers must agree on slots and width.
+        """
+        self.path = path
+        self.slots = slots
+        self.width = width
+        self.values = struct.Struct('<%dd' % width)
+        self.slot_size = SLOT_HEADER.size + self.values.size
+        self.size = HEADER.size + slots * self.slot_size
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            if os.fstat(fd).st_size < self.size:
+                os.ftruncate(fd, self.size)
+            self.map = mmap.mmap(fd, self.size)
+        finally:
+            os.close(fd)
+        magic, map_slots, map_width, reserved, head = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            HEADER.pack_into(self.map, 0, MAGIC, slots, width, 0, 0)
+        elif map_slots != slots or map_width != width:
+            raise ValueError("Ring %s has %d slots of %d values, expected %d of %d" % (path, map_slots, map_width, slots, width))
+        self.retries = 0
+
+    def head(self):
+        """
+        Number of records written so far, the latest one has index head() - 1
+        """
+        return HEAD.unpack_from(self.map, HEAD_OFFSET)[0]
+
+    def write(self, stamp, cycle, values):
+        """
+        Add a record, values at most width numbers. Returns its index.
+        """
+        index = self.head()
+        offset = HEADER.size + (index % self.slots) * self.slot_size
+        SEQ.pack_into(self.map, offset, 2*index + 1)
+        SLOT_HEADER.pack_into(self.map, offset, 2*index + 1, stamp, cycle)
+        values = list(values)
+        self.values.pack_into(self.map, offset + SLOT_HEADER.size, *(values + [0.0] * (self.width - len(values))))
+        SEQ.pack_into(self.map, offset, 2*index + 2)
+        HEAD.pack_into(self.map, HEAD_OFFSET, index + 1)
+        return index
+
+    def read(self, index):
+        """
+        Record index as (index, stamp, cycle, values), None if it was overwritten or not written yet
+        """
+        offset = HEADER.size + (index % self.slots) * self.slot_size
+        while True:
+            seq, stamp, cycle = SLOT_HEADER.unpack_from(self.map, offset)
+            if seq != 2*index + 2:
+                if seq == 2*index + 1:
+                    #Being written, the writer does not wait on anything
+                    self.retries += 1
+                    continue
+                return None
+            values = self.values.unpack_from(self.map, offset + SLOT_HEADER.size)
+            if SEQ.unpack_from(self.map, offset)[0] == seq:
+                return index, stamp, cycle, values
+            self.retries += 1
+
+    def latest(self):
+        """
+        Latest complete record, None if nothing was written
+        """
+        while True:
+            head = self.head()
+            if head == 0:
+                return None
+            record = self.read(head - 1)
+            if record is not None:
+                return record
+
+    def wait(self, index, timeout, period=0.00005):
+        """
+        Poll for a record newer than index (-1 for any) for at most timeout seconds.
+        Returns the latest record, or None on timeout.
+        """
+        t_end = _now() + timeout
+        while True:
+            if self.head() > index + 1:
+                return self.latest()
+            if _now() >= t_end:
+                return None
+            time.sleep(period)
+
+    def close(self):
+        self.map.close()
+
+
+def ring_paths(robot_name, directory='/dev/shm'):
+    """
+    Paths of the joints state and torques rings of a robot
+    """
+    return (os.path.join(directory, 'windowx_3links_' + robot_name + '_state'),
+            os.path.join(directory, 'windowx_3links_' + robot_name + '_torques'))
+
+
+def _driver(directory, rate, n, results):
+    """
+    Benchmark driver process: writes a state per cycle, takes the torques of the controller
+    """
+    state, torques = [ShmRing(p) for p in ring_paths('bench', directory)]
+    period = 1.0/rate
+    sent = {}
+    latencies = []
+    last = torques.head() - 1
+    deadline = _now()
+    for cycle in range(n):
+        t = _now()
+        sent[cycle] = t
+        state.write(t, cycle, [0.0, 0.1, -0.5, 0.2, 0.0, 0.0] + [0.0] * 5)
+        deadline += period
+        #Torques come back within the cycle, the driver would write them in its write slot
+        while _now() < deadline:
+            record = torques.wait(last, deadline - _now())
+            if record is None:
+                break
+            last = record[0]
+            if record[2] in sent:
+                latencies.append(_now() - sent.pop(record[2]))
+        time.sleep(max(0.0, deadline - _now()))
+    results.put(('shm', latencies, torques.retries + state.retries))
+
+
+def _controller(directory, n):
+    """
+    Benchmark controller process: waits for the states, writes the torques of each one
+    """
+    state, torques = [ShmRing(p) for p in ring_paths('bench', directory)]
+    last = state.head() - 1
+    for i in range(n):
+        record = state.wait(last, 1.0)
+        if record is None:
+            return
+        last = record[0]
+        torques.write(_now(), record[2], [0.0, 0.1, 0.2, 0.3, 0.0, 1.0])
+
+
+def _rospy_benchmark(rate, n, results):
+    """
+    Same loop over rospy topics: JointsState to the controller, torques back on a Float32MultiArray
+    """
+    import multiprocessing
+    def controller():
+        import rospy
+        from std_msgs.msg import Float32MultiArray
+        from windowx_msgs.msg import JointsState
+        rospy.init_node('windowx_shm_bench_controller')
+        pub = rospy.Publisher('/windowx_shm_bench/torques', Float32MultiArray, queue_size=1)
+        def callback(msg):
+            #Cycle in place of the first joint torque, which is not used
+            pub.publish(Float32MultiArray(data=[msg.cycle, 0.1, 0.2, 0.3, 0.0, 1.0]))
+        rospy.Subscriber('/windowx_shm_bench/joints_state', JointsState, callback, queue_size=1)
+        rospy.spin()
+    child = multiprocessing.Process(target=controller)
+    child.daemon = True
+    child.start()
+    import rospy
+    from std_msgs.msg import Float32MultiArray
+    from windowx_msgs.msg import JointsState
+    rospy.init_node('windowx_shm_bench_driver')
+    sent = {}
+    latencies = []
+    def callback(msg):
+        t = sent.pop(int(msg.data[0]), None)
+        if t is not None:
+            latencies.append(_now() - t)
+    rospy.Subscriber('/windowx_shm_bench/torques', Float32MultiArray, callback, queue_size=1)
+    pub = rospy.Publisher('/windowx_shm_bench/joints_state', JointsState, queue_size=1)
+    time.sleep(1.0)
+    msg = JointsState()
+    r = rospy.Rate(rate)
+    for cycle in range(n):
+        msg.cycle = cycle
+        msg.positions = [0.0, 0.1, -0.5, 0.2, 0.0, 0.0]
+        msg.velocities = [0.0] * 5
+        sent[cycle] = _now()
+        msg.header.stamp = rospy.get_rostime()
+        pub.publish(msg)
+        r.sleep()
+    child.terminate()
+    results.put(('rospy', latencies, 0))
+
+
+if __name__ == '__main__':
+    #Read to torque latency at 150Hz: driver and controller processes over the rings, then over rospy if a master is running
+    import shutil
+    import tempfile
+    import multiprocessing
+    rate = 150
+    n = 1500
+    directory = tempfile.mkdtemp(dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+    results = multiprocessing.Queue()
+    runs = [multiprocessing.Process(target=_controller, args=(directory, n)),
+            multiprocessing.Process(target=_driver, args=(directory, rate, n, results))]
+    for run in runs:
+        run.start()
+    outcomes = [results.get()]
+    for run in runs:
+        run.join()
+    shutil.rmtree(directory)
+    try:
+        import rosgraph
+        if rosgraph.is_master_online():
+            run = multiprocessing.Process(target=_rospy_benchmark, args=(rate, n, results))
+            run.start()
+            outcomes.append(results.get())
+            run.join()
+        else:
+            print("rospy path skipped: no ROS master running")
+    except ImportError:
+        print("rospy path skipped: ROS is not installed")
+    for name, latencies, retries in outcomes:
+        latencies = sorted(latencies)
+        if not latencies:
+            print("%-6s no torques received" % name)
+            continue
+        percentile = lambda p: latencies[min(len(latencies) - 1, int(p / 100.0 * len(latencies)))] * 1e6
+        print("%-6s read to torque: p50 %.0f us, p99 %.0f us, max %.0f us, %d/%d cycles, %d seqlock retries" %
+              (name, percentile(50), percentile(99), latencies[-1] * 1e6, len(latencies), n, retries))
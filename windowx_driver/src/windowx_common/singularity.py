@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+
+"""
+Precomputed singularity map of the 3 links windowx arm, for per tick safety checks without SVDs.
+The arm jacobian J_e and the grasp jacobian J_o^-1 J_e (object velocity from the joint velocities,
+the jacobian of the object point: link 3 lengthened by the grasp offset) do not depend on the 1st
+joint angle nor on the mirrored mounting, the map is a periodic grid over (q2, q3) with:
+- the signed manipulability -det(J_e) = -L2*(L1_X*sin(q2) - L1_Y*cos(q2)), positive with the elbow up
+  (the working pose), zero with link 1 and link 2 aligned (q2 = -0.325rad, or folded at -3.467rad) and
+  negative past it. det(J_o) = 1: the grasp jacobian has the same manipulability.
+- the inverse condition numbers sigma_min/sigma_max of J_e and of the grasp jacobian, 1 for an isotropic
+  jacobian, 0 at a singularity (x and y in m, theta in rad).
+lookup interpolates the grid bilinearly in O(1). build_map evaluates it offline and saves it as a
+(3, steps, steps) float32 .npy; SingularityMap loads it, or builds it in memory when no path is given.
+Usage: python -m windowx_common.singularity [PATH] [STEPS], the map goes in a temporary directory without PATH
+"""
+
+from math import pi, sin, cos, floor
+import numpy as np
+from windowx_common.links import L1_X, L1_Y, L2, L3, L3_DYN
+
+#Object origin from the grasp point along link 3 (p1o_in_e1 = p2o_in_e2 = [-0.04, 0, 0] of the controllers)
+GRASP_OFFSET = 0.04
+#Layers of the map
+MANIPULABILITY = 0
+RCOND_ARM = 1
+RCOND_GRASP = 2
+
+def manipulability(q2):
+    """
+    Signed manipulability -det(J_e) of the joint 2 angle q2
+    """
+    return -L2*(L1_X*np.sin(q2) - L1_Y*np.cos(q2))
+
+#Driver thresholds: shut down and warn at the manipulability of joint 2 at -0.45rad and -0.55rad
+SHUTDOWN_MANIPULABILITY = float(manipulability(-0.45))
+WARNING_MANIPULABILITY = float(manipulability(-0.55))
+
+def _jacobians(q2, q3, l3):
+    """
+    Jacobians (N, 3, 3) at q1 = 0 of the joint angles q2, q3 (N,)
+    """
+    J = np.empty((len(q2), 3, 3))
+    J[:, 0, 2] = -l3*np.sin(q2 + q3)
+    J[:, 0, 1] = J[:, 0, 2] - L2*np.sin(q2)
+    J[:, 0, 0] = J[:, 0, 1] - L1_Y
+    J[:, 1, 2] = l3*np.cos(q2 + q3)
+    J[:, 1, 1] = J[:, 1, 2] + L2*np.cos(q2)
+    J[:, 1, 0] = J[:, 1, 1] + L1_X
+    J[:, 2, :] = 1.0
+    return J
+
+def _rcond(J):
+    s = np.linalg.svd(J, compute_uv=False)
+    return s[:, -1] / s[:, 0]
+
+def evaluate(steps=256, l3=L3_DYN, grasp_offset=GRASP_OFFSET):
+    """
+    Map (3, steps, steps) on q2, q3 = -pi + 2 pi k / steps, k = 0 .. steps - 1
+    """
+    angles = -pi + 2*pi*np.arange(steps)/steps
+    q2, q3 = [a.ravel() for a in np.meshgrid(angles, angles, indexing='ij')]
+    grid = np.empty((3, steps*steps), dtype=np.float32)
+    grid[MANIPULABILITY] = manipulability(q2)
+    grid[RCOND_ARM] = _rcond(_jacobians(q2, q3, l3))
+    grid[RCOND_GRASP] = _rcond(_jacobians(q2, q3, l3 + grasp_offset))
+    return grid.reshape(3, steps, steps)
+
+def build_map(path, steps=256, l3=L3_DYN, grasp_offset=GRASP_OFFSET):
+    """
+    Evaluate the map and save it in path
+    """
+    np.save(path, evaluate(steps, l3, grasp_offset))
+    return path
+
+
+class SingularityMap():
+    """Bilinear lookup in a map of build_map (path) or of evaluate (path None)"""
+    def __init__(self, path=None, steps=256, l3=L3_DYN, grasp_offset=GRASP_OFFSET):
+        if path:
+            grid = np.load(path)
+        else:
+            grid = evaluate(steps, l3, grasp_offset)
+        self.steps = grid.shape[1]
+        self.h = 2*pi/self.steps
+        #Nested lists: the reads of a single lookup are faster than on the array
+        self.grid = grid.astype(np.float64).tolist()
+
+    def lookup(self, q2, q3):
+        """
+        (manipulability, inverse condition number of J_e, of the grasp jacobian) at the joint angles q2, q3 [rad]
+        """
+        u = (q2 + pi)/self.h
+        v = (q3 + pi)/self.h
+        i = int(floor(u))
+        j = int(floor(v))
+        s = u - i
+        t = v - j
+        n = self.steps
+        i0 = i % n
+        i1 = (i + 1) % n
+        j0 = j % n
+        j1 = (j + 1) % n
+        w00 = (1 - s)*(1 - t)
+        w01 = (1 - s)*t
+        w10 = s*(1 - t)
+        w11 = s*t
+        return tuple(layer[i0][j0]*w00 + layer[i0][j1]*w01 + layer[i1][j0]*w10 + layer[i1][j1]*w11 for layer in self.grid)
+
+
+if __name__ == '__main__':
+    #Build a map, then lookup errors against the SVDs and cost per call
+    import os
+    import sys
+    import shutil
+    import tempfile
+    import timeit
+    tmp = tempfile.mkdtemp()
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(tmp, 'singularity_map.npy')
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+    build_map(path, steps)
+    print("%s: %dx%d points, %.2f MB" % (path, steps, steps, os.path.getsize(path) / 1e6))
+    smap = SingularityMap(path)
+    q = np.random.RandomState(0).uniform(-pi, pi, (5000, 2))
+    exact = np.column_stack([manipulability(q[:, 0]), _rcond(_jacobians(q[:, 0], q[:, 1], L3_DYN)),
+                             _rcond(_jacobians(q[:, 0], q[:, 1], L3_DYN + GRASP_OFFSET))])
+    looked_up = np.array([smap.lookup(q2, q3) for q2, q3 in q])
+    print("max lookup error: manipulability %.2e, rcond J_e %.2e, rcond grasp %.2e" % tuple(np.max(np.abs(looked_up - exact), axis=0)))
+    try:
+        from windowx_arm import ArmConfiguration, jacobian
+        conf = ArmConfiguration(np.column_stack([np.random.RandomState(1).uniform(-pi, pi, 5000), q]))
+        J = jacobian(conf, L3_DYN)
+        assert np.allclose(-np.linalg.det(J), exact[:, 0]) and np.allclose(_rcond(J), exact[:, 1])
+        print("manipulability and rcond J_e equal to the ones of windowx_arm.jacobian")
+    except ImportError:
+        pass
+    t_lookup = min(timeit.repeat(lambda: smap.lookup(-2.29, 0.19), number=10000, repeat=3)) / 10000
+    J = _jacobians(np.array([-2.29]), np.array([0.19]), L3_DYN)[0]
+    t_svd = min(timeit.repeat(lambda: np.linalg.svd(J, compute_uv=False), number=10000, repeat=3)) / 10000
+    print("lookup %.1f us per call, SVD of J_e %.1f us" % (t_lookup*1e6, t_svd*1e6))
+    print("thresholds: shutdown below %.2e (q2 = -0.45rad), warning below %.2e (q2 = -0.55rad)" % (SHUTDOWN_MANIPULABILITY, WARNING_MANIPULABILITY))
+    for q2 in (-2.29, -0.55, -0.45, -0.4, -0.325, -0.2, 1.0, -3.3):
+        print("q2 = %6.3f  manipulability %9.2e  rcond J_e %.3f  rcond grasp %.3f" % ((q2,) + smap.lookup(q2, 0.19)))
+    shutil.rmtree(tmp)